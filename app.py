@@ -1,8 +1,127 @@
+import argparse
+import asyncio
+import sys
 from src.clinica_gestion.cli.interfaz_cli import CLI
+from src.clinica_gestion.cli.lote import leer_comandos_desde_archivo
+from src.clinica_gestion.cli.perfilado import PerfiladorSesion
+from src.clinica_gestion.modelo.clinica import Clinica
+from src.clinica_gestion.persistencia.journal import JournalClinica
+from src.clinica_gestion.persistencia.repositorio_sqlite import RepositorioSQLite
+from src.clinica_gestion.servicio.servidor import ServidorClinica
 
 def main():
-    cli = CLI()
-    cli.iniciar()
+    parser = argparse.ArgumentParser(description="Sistema de Gestión de una Clínica")
+    parser.add_argument("--datos", default="datos_clinica",
+                        help="Directorio donde se guardan el journal y los snapshots (por defecto: datos_clinica)")
+    parser.add_argument("--sin-persistencia", action="store_true",
+                        help="Trabajar solo en memoria, sin leer ni guardar datos en disco")
+    parser.add_argument("--sqlite", metavar="ARCHIVO",
+                        help="Guardar los datos en una base SQLite en lugar de mantenerlos en memoria")
+    servidor = parser.add_mutually_exclusive_group()
+    servidor.add_argument("--servidor", metavar="[HOST:]PUERTO",
+                          help="En lugar del menú, atender clientes por TCP con el protocolo JSON por líneas")
+    servidor.add_argument("--socket", metavar="RUTA",
+                          help="En lugar del menú, atender clientes por un socket Unix con el protocolo JSON por líneas")
+    servidor.add_argument("--lote", metavar="ARCHIVO",
+                          help="En lugar del menú, ejecutar los comandos de ARCHIVO (uno por línea o JSONL) y mostrar un resumen")
+    parser.add_argument("--metricas", metavar="ARCHIVO",
+                        help="Medir las operaciones de la clínica y guardar las métricas en formato Prometheus en ARCHIVO")
+    parser.add_argument("--profile", nargs="?", const="perfil_clinica", metavar="PREFIJO",
+                        help="Perfilar la sesión del menú con cProfile y guardar PREFIJO.pstats y PREFIJO.txt "
+                             "(por defecto: perfil_clinica)")
+    args = parser.parse_args()
+    if args.profile and (args.servidor or args.socket):
+        parser.error("--profile solo se puede usar con el menú, no con --servidor ni --socket")
+
+    if args.sqlite:
+        repositorio = RepositorioSQLite(args.sqlite)
+        try:
+            ejecutar(Clinica(repositorio), args)
+        finally:
+            repositorio.cerrar()
+        return
+
+    if args.sin_persistencia:
+        ejecutar(Clinica(), args)
+        return
+
+    journal = JournalClinica(args.datos)
+    clinica = journal.abrir()
+    try:
+        ejecutar(clinica, args)
+    finally:
+        journal.cerrar()
+
+def ejecutar(clinica: Clinica, args: argparse.Namespace) -> None:
+    if args.metricas:
+        clinica.habilitar_metricas()
+    try:
+        if args.servidor is None and args.socket is None:
+            perfilador = PerfiladorSesion(clinica) if args.profile else None
+            cli = CLI(clinica, perfilador)
+            sesion = (lambda: ejecutar_lote(cli, args.lote)) if args.lote else cli.iniciar
+            errores = sesion() if perfilador is None else perfilar(perfilador, sesion, args.profile)
+            if errores:
+                sys.exit(1)
+            return
+        try:
+            asyncio.run(servir(clinica, args))
+        except KeyboardInterrupt:
+            print("\nServidor detenido.")
+    finally:
+        if args.metricas:
+            clinica.obtener_metricas().escribir_prometheus(args.metricas)
+
+def ejecutar_lote(cli: CLI, ruta: str) -> int:
+    # Devuelve la cantidad de comandos con error, para terminar con código 1 si hubo alguno
+    salida = []
+    resultado = cli.ejecutar_lote(leer_comandos_desde_archivo(ruta), salida)
+    if salida:
+        sys.stdout.write("\n".join(salida) + "\n")
+    print(f"\nLote finalizado. {resultado}")
+    errores = resultado.obtener_errores()
+    for error in errores[:CLI.MAX_ERRORES_IMPORTACION_MOSTRADOS]:
+        print(f"  {error}")
+    if resultado.obtener_cantidad_errores() > CLI.MAX_ERRORES_IMPORTACION_MOSTRADOS:
+        print(f"  ... y {resultado.obtener_cantidad_errores() - CLI.MAX_ERRORES_IMPORTACION_MOSTRADOS} errores más.")
+    for advertencia in resultado.obtener_advertencias()[:CLI.MAX_ERRORES_IMPORTACION_MOSTRADOS]:
+        print(f"  Advertencia: {advertencia}")
+    return resultado.obtener_cantidad_errores()
+
+def perfilar(perfilador: PerfiladorSesion, sesion, ruta_base: str) -> object:
+    # La sesión puede ser el menú (interactivo o con las respuestas por la entrada estándar) o un lote
+    try:
+        with perfilador.sesion():
+            return sesion()
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        ruta_pstats, ruta_informe = perfilador.guardar(ruta_base)
+        print(f"\nPerfil guardado en {ruta_pstats} e informe en {ruta_informe}")
+
+async def servir(clinica: Clinica, args: argparse.Namespace) -> None:
+    servidor_clinica = ServidorClinica(clinica)
+    exportacion = asyncio.create_task(exportar_metricas(clinica, args.metricas)) if args.metricas else None
+    try:
+        if args.socket:
+            servidor = await servidor_clinica.iniciar_unix(args.socket)
+        else:
+            host, _, puerto = args.servidor.rpartition(":")
+            servidor = await servidor_clinica.iniciar_tcp(host or "127.0.0.1", int(puerto))
+        direcciones = ", ".join(str(sock.getsockname()) for sock in servidor.sockets)
+        print(f"Atendiendo solicitudes en {direcciones} (Ctrl+C para detener)")
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        if exportacion is not None:
+            exportacion.cancel()
+        await servidor_clinica.detener()
+
+async def exportar_metricas(clinica: Clinica, ruta: str, intervalo: float = 15.0) -> None:
+    # Mientras el servidor está activo el archivo se actualiza periódicamente, para que lo lea un recolector
+    while True:
+        await asyncio.sleep(intervalo)
+        clinica.obtener_metricas().escribir_prometheus(ruta)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
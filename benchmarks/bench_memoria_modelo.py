@@ -0,0 +1,86 @@
+# Mide los bytes por instancia de las clases del modelo y los compara con objetos equivalentes
+# que guardan los mismos atributos en un __dict__ por instancia (la representación anterior a __slots__).
+#
+# Uso: python -m benchmarks.bench_memoria_modelo [--cantidad N]
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime
+from src.clinica_gestion.modelo.especialidad import Especialidad
+from src.clinica_gestion.modelo.medico import Medico
+from src.clinica_gestion.modelo.paciente import Paciente
+from src.clinica_gestion.modelo.receta import Receta
+from src.clinica_gestion.modelo.turno import Turno
+
+
+class _ObjetoConDict:
+    pass
+
+
+def _con_dict(atributos: dict) -> _ObjetoConDict:
+    objeto = _ObjetoConDict()
+    objeto.__dict__.update(atributos)
+    return objeto
+
+
+def medir_bytes_por_objeto(crear: Callable[[int], object], cantidad: int) -> float:
+    # Los valores de los atributos se comparten entre instancias, así solo se mide el costo del objeto
+    gc.collect()
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+    objetos = [crear(i) for i in range(cantidad)]
+    total = tracemalloc.get_traced_memory()[0] - inicio
+    tracemalloc.stop()
+    # Se descuenta la lista que mantiene vivos a los objetos
+    total -= objetos.__sizeof__()
+    return total / cantidad
+
+
+def casos() -> dict[str, tuple[Callable[[int], object], Callable[[int], object]]]:
+    paciente = Paciente("Laura Palmer", "87654321", "15/07/1990")
+    medico = Medico("Dr. Lawrence Jacoby", "MAT001")
+    fecha = datetime(2025, 3, 3, 10, 0)
+    medicamentos = ["Sertralina 50mg"]
+    dias = ["lunes", "miércoles"]
+
+    return {
+        "Paciente": (
+            lambda i: Paciente("Laura Palmer", "87654321", "15/07/1990"),
+            lambda i: _con_dict({"__nombre__": "Laura Palmer", "__dni__": "87654321", "__fecha_nacimiento__": "15/07/1990"}),
+        ),
+        "Medico": (
+            lambda i: Medico("Dr. Lawrence Jacoby", "MAT001"),
+            lambda i: _con_dict({"__nombre__": "Dr. Lawrence Jacoby", "__matricula__": "MAT001", "__especialidades__": []}),
+        ),
+        "Especialidad": (
+            lambda i: Especialidad("Psiquiatría", dias),
+            lambda i: _con_dict({"__tipo__": "Psiquiatría", "__dias__": [dia for dia in dias]}),
+        ),
+        "Turno": (
+            lambda i: Turno(paciente, medico, fecha, "Psiquiatría"),
+            lambda i: _con_dict({"__paciente__": paciente, "__medico__": medico, "__fecha_hora__": fecha,
+                                 "__nombre_especialidad_atendida__": "Psiquiatría"}),
+        ),
+        "Receta": (
+            lambda i: Receta(paciente, medico, medicamentos, fecha),
+            lambda i: _con_dict({"__paciente__": paciente, "__medico__": medico, "__medicamentos__": medicamentos,
+                                 "__fecha__": fecha}),
+        ),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memoria por instancia de las clases del modelo")
+    parser.add_argument("--cantidad", type=int, default=100_000, help="Instancias creadas por clase")
+    args = parser.parse_args()
+
+    print(f"{'Clase':<14}{'con __dict__':>16}{'con __slots__':>16}{'ahorro':>10}")
+    for nombre, (crear_actual, crear_con_dict) in casos().items():
+        antes = medir_bytes_por_objeto(crear_con_dict, args.cantidad)
+        despues = medir_bytes_por_objeto(crear_actual, args.cantidad)
+        print(f"{nombre:<14}{antes:>14.1f} B{despues:>14.1f} B{1 - despues / antes:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
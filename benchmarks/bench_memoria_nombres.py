@@ -0,0 +1,82 @@
+# Informe de la memoria que ahorra compartir los nombres de especialidad y de días (ver modelo/nombres.py):
+# compara turnos y especialidades cuyos textos se leyeron por separado (un str propio por objeto, como quedaban
+# al cargarlos de disco) con los mismos objetos usando las instancias compartidas del registro.
+#
+# Uso: python -m benchmarks.bench_memoria_nombres [--cantidad N]
+import argparse
+import gc
+import json
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime
+from src.clinica_gestion.modelo.especialidad import Especialidad
+from src.clinica_gestion.modelo.medico import Medico
+from src.clinica_gestion.modelo.paciente import Paciente
+from src.clinica_gestion.modelo.turno import Turno
+
+ESPECIALIDADES = ("Clínica Médica", "Pediatría", "Cardiología", "Otorrinolaringología")
+DIAS = ("lunes", "miércoles", "viernes")
+
+
+def medir_bytes(crear: Callable[[list], list], cantidad: int) -> int:
+    # Se mide lo que queda vivo una vez creados los objetos y descartados los textos leídos: un texto que
+    # sigue ocupando memoria es el que quedó guardado en algún objeto
+    gc.collect()
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+    textos = _textos_leidos(cantidad)
+    objetos = crear(textos)
+    del textos
+    gc.collect()
+    total = tracemalloc.get_traced_memory()[0] - inicio
+    tracemalloc.stop()
+    del objetos
+    return total
+
+
+def _textos_leidos(cantidad: int) -> list:
+    # json.loads crea un str nuevo por cada valor, como al leer un snapshot o un journal
+    return json.loads(json.dumps([[ESPECIALIDADES[i % len(ESPECIALIDADES)], list(DIAS)] for i in range(cantidad)]))
+
+
+def _turnos(textos: list, compartidos: bool) -> list[Turno]:
+    paciente = Paciente("Laura Palmer", "87654321", "15/07/1990")
+    medico = Medico("Dr. Lawrence Jacoby", "MAT001")
+    fecha = datetime(2030, 1, 7, 10, 0)
+    turnos = []
+    for especialidad, _ in textos:
+        turno = Turno(paciente, medico, fecha, especialidad)
+        if not compartidos:
+            # Sin registro cada turno se quedaba con el texto que recibió
+            turno.__nombre_especialidad_atendida__ = especialidad
+        turnos.append(turno)
+    return turnos
+
+
+def _especialidades(textos: list, compartidos: bool) -> list[Especialidad]:
+    especialidades = []
+    for tipo, dias in textos:
+        especialidad = Especialidad(tipo, dias)
+        if not compartidos:
+            especialidad.__tipo__ = tipo
+            especialidad.__dias__ = tuple(dia.lower() for dia in dias)
+        especialidades.append(especialidad)
+    return especialidades
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ahorro de memoria de los nombres compartidos")
+    parser.add_argument("--cantidad", type=int, default=1_000_000, help="Objetos creados por caso")
+    args = parser.parse_args()
+
+    print(f"{'Objetos':<28}{'textos propios':>16}{'compartidos':>16}{'ahorro':>16}")
+    for nombre, crear in (("Turno", _turnos), ("Especialidad", _especialidades)):
+        antes = medir_bytes(lambda textos: crear(textos, False), args.cantidad)
+        despues = medir_bytes(lambda textos: crear(textos, True), args.cantidad)
+        ahorro = antes - despues
+        print(f"{f'{args.cantidad:,} x {nombre}':<28}{antes / 2**20:>13.1f} MB{despues / 2**20:>13.1f} MB"
+              f"{ahorro / 2**20:>9.1f} MB ({ahorro / antes:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# Compara la interpretación de fechas de agendar_turno: strptime (implementación anterior),
+# el camino rápido de formato fijo y la versión con caché usada por Clinica.
+#
+# Uso: python -m benchmarks.bench_parse_fecha_hora [--cantidad N] [--horarios-distintos M]
+import argparse
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from src.clinica_gestion.modelo.fechas import FORMATO_FECHA_HORA, parse_fecha_hora, parse_fecha_hora_rapido
+
+
+def _con_strptime(texto: str) -> datetime | None:
+    try:
+        return datetime.strptime(texto, FORMATO_FECHA_HORA)
+    except ValueError:
+        return None
+
+
+def generar_textos(cantidad: int, horarios_distintos: int) -> list[str]:
+    inicio = datetime(2030, 1, 7, 8, 0)
+    horarios = [(inicio + timedelta(minutes=30 * i)).strftime(FORMATO_FECHA_HORA) for i in range(horarios_distintos)]
+    return [horarios[i % horarios_distintos] for i in range(cantidad)]
+
+
+def medir(funcion: Callable[[str], object], textos: list[str]) -> float:
+    inicio = time.perf_counter()
+    for texto in textos:
+        funcion(texto)
+    return time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmark de interpretación de fechas")
+    parser.add_argument("--cantidad", type=int, default=200_000, help="Cantidad de fechas a interpretar")
+    parser.add_argument("--horarios-distintos", type=int, default=2_000,
+                        help="Cantidad de horarios distintos entre las fechas (afecta a la caché)")
+    args = parser.parse_args()
+
+    textos = generar_textos(args.cantidad, args.horarios_distintos)
+    variantes = {
+        "strptime": _con_strptime,
+        "formato fijo": parse_fecha_hora_rapido,
+        "formato fijo + caché": parse_fecha_hora,
+    }
+
+    base = None
+    for nombre, funcion in variantes.items():
+        segundos = medir(funcion, textos)
+        base = base or segundos
+        print(f"{nombre:<22}{segundos:>8.3f} s{args.cantidad / segundos:>14,.0f} fechas/s{base / segundos:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
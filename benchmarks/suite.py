@@ -0,0 +1,259 @@
+# Suite de benchmarks de las operaciones más usadas de Clinica, a varios tamaños de clínica.
+# Mide la latencia de cada llamada (percentiles) y el throughput, y guarda los resultados en JSON
+# para poder comparar dos corridas (por ejemplo, antes y después de un cambio en modelo/clinica.py).
+#
+# Uso: python -m benchmarks.suite correr [--tamanios 1000,10000,100000] [--salida resultados.json]
+#      python -m benchmarks.suite comparar base.json nuevo.json [--umbral 0.10]
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime
+from src.clinica_gestion.cli.interfaz_cli import CLI
+from src.clinica_gestion.herramientas.generador import GeneradorClinica
+from src.clinica_gestion.modelo.fechas import DIAS_SEMANA_ES, FORMATO_FECHA_HORA
+from src.clinica_gestion.modelo.historia_clinica import HistoriaClinica
+
+VERSION_RESULTADOS = 1
+TAMANIOS_POR_DEFECTO = (1_000, 10_000, 100_000)
+SEMILLA = 2025
+
+
+# Medición
+def medir(operacion: Callable[[int], object], cantidad: int) -> dict:
+    # operacion(i) ejecuta la i-ésima llamada; los datos de entrada se preparan antes de medir.
+    # El primer 10 % de las llamadas se toma como calentamiento y no entra en las estadísticas,
+    # y el recolector de basura se pausa para que sus ciclos no aparezcan como latencia de una llamada.
+    latencias = []
+    reloj = time.perf_counter_ns
+    calentamiento = cantidad // 10
+    gc.collect()
+    gc.disable()
+    try:
+        for i in range(calentamiento):
+            operacion(i)
+        inicio_total = reloj()
+        for i in range(calentamiento, cantidad):
+            inicio = reloj()
+            operacion(i)
+            latencias.append(reloj() - inicio)
+        total = reloj() - inicio_total
+    finally:
+        gc.enable()
+
+    cantidad = len(latencias)
+    latencias.sort()
+    return {
+        "operaciones": cantidad,
+        "ops_por_segundo": cantidad / (total / 1e9) if total else 0.0,
+        "media_us": sum(latencias) / cantidad / 1000,
+        "p50_us": _percentil(latencias, 0.50) / 1000,
+        "p90_us": _percentil(latencias, 0.90) / 1000,
+        "p99_us": _percentil(latencias, 0.99) / 1000,
+    }
+
+
+def _percentil(ordenados: list[int], fraccion: float) -> float:
+    return ordenados[min(len(ordenados) - 1, int(fraccion * len(ordenados)))]
+
+
+# Casos
+def casos_para_tamanio(tamanio: int, operaciones: int) -> dict[str, Callable[[], dict]]:
+    # Clínica de referencia: `tamanio` pacientes, un médico cada 100 pacientes y 5 turnos y 2 recetas por paciente
+    medicos = max(5, tamanio // 100)
+    turnos = tamanio * 5
+    generador = GeneradorClinica(tamanio, medicos, turnos, tamanio * 2, semilla=SEMILLA)
+    clinica = generador.poblar()
+    aleatorio = random.Random(SEMILLA)
+    dnis = [paciente.obtener_dni() for paciente in generador.obtener_pacientes()]
+    matriculas = [medico.obtener_matricula() for medico in generador.obtener_medicos()]
+
+    def agendar_turno() -> dict:
+        # Los mismos horarios que seguiría generando el generador: libres y válidos para cada médico
+        siguientes = GeneradorClinica(tamanio, medicos, turnos + operaciones, 0, semilla=SEMILLA).generar_turnos()
+        solicitudes = [
+            (
+                turno.obtener_paciente().obtener_dni(),
+                turno.obtener_medico().obtener_matricula(),
+                turno.obtener_fecha_hora().strftime(FORMATO_FECHA_HORA),
+                turno.obtener_especialidad_atendida(),
+            )
+            for indice, turno in enumerate(siguientes) if indice >= turnos
+        ]
+        return medir(lambda i: clinica.agendar_turno(*solicitudes[i]), len(solicitudes))
+
+    def emitir_receta() -> dict:
+        pares = [(aleatorio.choice(dnis), aleatorio.choice(matriculas)) for _ in range(operaciones)]
+        return medir(lambda i: clinica.emitir_receta(pares[i][0], pares[i][1], ["Ibuprofeno 400mg"]), operaciones)
+
+    def obtener_historia_clinica() -> dict:
+        consultas = [aleatorio.choice(dnis) for _ in range(operaciones)]
+        return medir(lambda i: clinica.obtener_historia_clinica(consultas[i]), operaciones)
+
+    def historia_agregar_turno() -> dict:
+        # Inserciones en orden aleatorio en la historia de un paciente que ya tiene `tamanio` turnos
+        todos = list(GeneradorClinica(tamanio, medicos, tamanio + operaciones, 0, semilla=SEMILLA).generar_turnos())
+        aleatorio.shuffle(todos)
+        historia = HistoriaClinica(generador.obtener_pacientes()[0])
+        for turno in todos[operaciones:]:
+            historia.agregar_turno(turno)
+        nuevos = todos[:operaciones]
+        return medir(lambda i: historia.agregar_turno(nuevos[i]), len(nuevos))
+
+    def medico_especialidades_para_dia() -> dict:
+        todos = generador.obtener_medicos()
+        consultas = [(aleatorio.choice(todos), aleatorio.choice(DIAS_SEMANA_ES)) for _ in range(operaciones)]
+        return medir(lambda i: consultas[i][0].obtener_especialidades_para_dia(consultas[i][1]), operaciones)
+
+    def buscar_pacientes() -> dict:
+        # Nombre completo, primera palabra o sus tres primeras letras de pacientes al azar; el índice se arma antes
+        nombres = [paciente.obtener_nombre() for paciente in generador.obtener_pacientes()]
+        consultas = []
+        for _ in range(operaciones):
+            nombre = aleatorio.choice(nombres)
+            consultas.append(aleatorio.choice((nombre, nombre.split()[0], nombre[:3])))
+        clinica.buscar_pacientes(consultas[0])
+        return medir(lambda i: clinica.buscar_pacientes(consultas[i]), operaciones)
+
+    def buscar_proximo_turno_libre() -> dict:
+        # Desde el inicio de la agenda generada, que está completa: hay que saltear los días ya ocupados
+        especialidades = sorted({
+            especialidad.obtener_especialidad()
+            for medico in generador.obtener_medicos() for especialidad in medico.obtener_especialidades()
+        })
+        consultas = [aleatorio.choice(especialidades) for _ in range(operaciones)]
+        inicio = datetime(2030, 1, 7, 8, 0)
+        return medir(lambda i: clinica.buscar_proximo_turno_libre(consultas[i], inicio, 30, 5), operaciones)
+
+    def cancelar_turno() -> dict:
+        # Turnos generados al azar (los IDs van de 1 a `turnos`), cada uno una sola vez
+        ids = aleatorio.sample(range(1, turnos + 1), min(operaciones, turnos))
+        return medir(lambda i: clinica.cancelar_turno(ids[i]), len(ids))
+
+    def obtener_turnos() -> dict:
+        return medir(lambda i: clinica.obtener_turnos(), max(20, operaciones // 100))
+
+    def cli_listar_turnos(filtros: str, cantidad: int) -> Callable[[], dict]:
+        # La opción 7 del menú se ejecuta como un comando de lote: la salida se arma pero no se imprime
+        cli = CLI(clinica)
+
+        def listar(_: int) -> None:
+            cli.ejecutar_lote([(1, ("7", [filtros]))], [])
+
+        return lambda: medir(listar, cantidad)
+
+    # Las consultas van antes que las altas y las bajas al final, así todas miden la clínica con el mismo tamaño
+    return {
+        "medico.obtener_especialidades_para_dia": medico_especialidades_para_dia,
+        "historia_clinica.agregar_turno": historia_agregar_turno,
+        "clinica.obtener_historia_clinica": obtener_historia_clinica,
+        "clinica.buscar_pacientes": buscar_pacientes,
+        "clinica.buscar_proximo_turno_libre": buscar_proximo_turno_libre,
+        "clinica.obtener_turnos": obtener_turnos,
+        "cli.listar_turnos": cli_listar_turnos("", max(20, operaciones // 100)),
+        "cli.listar_turnos_completo": cli_listar_turnos(f"cantidad={turnos}", max(10, operaciones // 500)),
+        "clinica.agendar_turno": agendar_turno,
+        "clinica.emitir_receta": emitir_receta,
+        "clinica.cancelar_turno": cancelar_turno,
+    }
+
+
+def correr(tamanios: list[int], operaciones: int, repeticiones: int = 3, filtro: str | None = None) -> dict:
+    # Cada caso se repite sobre una clínica recién generada y se guarda la repetición con menor mediana:
+    # el ruido de la máquina (otros procesos, frecuencia de la CPU) solo puede hacer más lenta una corrida
+    resultados = {}
+    for tamanio in tamanios:
+        for _ in range(repeticiones):
+            for nombre, caso in casos_para_tamanio(tamanio, operaciones).items():
+                if filtro and filtro not in nombre:
+                    continue
+                clave = f"{nombre}@{tamanio}"
+                resultado = caso()
+                if clave not in resultados or resultado["p50_us"] < resultados[clave]["p50_us"]:
+                    resultados[clave] = resultado
+        for clave in (c for c in resultados if c.endswith(f"@{tamanio}")):
+            r = resultados[clave]
+            print(f"{clave:<48}{r['ops_por_segundo']:>14,.0f} ops/s  p50 {r['p50_us']:>10.1f} us  p99 {r['p99_us']:>10.1f} us",
+                  flush=True)
+    return {
+        "version": VERSION_RESULTADOS,
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "plataforma": platform.platform(),
+        "operaciones": operaciones,
+        "repeticiones": repeticiones,
+        "resultados": resultados,
+    }
+
+
+# Comparación
+def comparar(base: dict, nuevo: dict, umbral: float) -> list[str]:
+    # Se compara la mediana de latencia: es la métrica más estable entre corridas.
+    # Devuelve los casos que empeoraron más que el umbral (0.10 = 10 % más lentos).
+    regresiones = []
+    print(f"{'caso':<48}{'p50 base':>12}{'p50 nuevo':>12}{'cambio':>10}")
+    for clave, resultado_nuevo in nuevo["resultados"].items():
+        resultado_base = base["resultados"].get(clave)
+        if resultado_base is None:
+            print(f"{clave:<48}{'-':>12}{resultado_nuevo['p50_us']:>12.1f}{'nuevo':>10}")
+            continue
+        antes, despues = resultado_base["p50_us"], resultado_nuevo["p50_us"]
+        cambio = (despues - antes) / antes if antes else 0.0
+        marca = ""
+        if cambio > umbral:
+            marca = "  REGRESIÓN"
+            regresiones.append(clave)
+        elif cambio < -umbral:
+            marca = "  mejora"
+        print(f"{clave:<48}{antes:>12.1f}{despues:>12.1f}{cambio:>+10.1%}{marca}")
+    return regresiones
+
+
+def _leer_resultados(ruta: str) -> dict:
+    with open(ruta, encoding="utf-8") as archivo:
+        resultados = json.load(archivo)
+    if resultados.get("version") != VERSION_RESULTADOS:
+        raise SystemExit(f"{ruta}: versión de resultados no soportada.")
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suite de benchmarks de Clinica")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    parser_correr = subcomandos.add_parser("correr", help="Ejecutar la suite y guardar los resultados")
+    parser_correr.add_argument("--tamanios", default=",".join(str(t) for t in TAMANIOS_POR_DEFECTO),
+                               help="Cantidades de pacientes separadas por comas")
+    parser_correr.add_argument("--operaciones", type=int, default=2_000, help="Llamadas medidas por caso")
+    parser_correr.add_argument("--repeticiones", type=int, default=3,
+                               help="Corridas de cada caso; se guarda la de menor mediana (por defecto 3)")
+    parser_correr.add_argument("--filtro", help="Ejecutar solo los casos cuyo nombre contiene este texto")
+    parser_correr.add_argument("--salida", default="resultados_benchmarks.json", help="Archivo JSON de resultados")
+
+    parser_comparar = subcomandos.add_parser("comparar", help="Comparar dos archivos de resultados")
+    parser_comparar.add_argument("base")
+    parser_comparar.add_argument("nuevo")
+    parser_comparar.add_argument("--umbral", type=float, default=0.10,
+                                 help="Empeoramiento relativo de la mediana que se considera regresión (por defecto 0.10)")
+    args = parser.parse_args()
+
+    if args.comando == "correr":
+        tamanios = [int(t) for t in args.tamanios.split(",") if t.strip()]
+        resultados = correr(tamanios, args.operaciones, args.repeticiones, args.filtro)
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(resultados, archivo, ensure_ascii=False, indent=2)
+        print(f"Resultados guardados en {args.salida}")
+    else:
+        regresiones = comparar(_leer_resultados(args.base), _leer_resultados(args.nuevo), args.umbral)
+        if regresiones:
+            print(f"\n{len(regresiones)} caso(s) con regresión: {', '.join(regresiones)}")
+            sys.exit(1)
+        print("\nSin regresiones.")
+
+
+if __name__ == "__main__":
+    main()
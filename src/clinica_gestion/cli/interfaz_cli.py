@@ -1,51 +1,89 @@
+import shlex
+import time
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime
+from contextlib import AbstractContextManager, nullcontext
+from itertools import islice
+from src.clinica_gestion.cli.lote import ComandoLote, ResultadoLote
 from src.clinica_gestion.modelo.clinica import Clinica
 from src.clinica_gestion.modelo.especialidad import Especialidad
 from src.clinica_gestion.modelo.excepciones import ClinicaException
+from src.clinica_gestion.modelo.fechas import MINUTOS_TURNO, parse_fecha_hora
+from src.clinica_gestion.modelo.importacion import ImportadorClinica
 
 class CLI:
-    def __init__(self, clinica: Clinica = Clinica()):
+    MAX_ERRORES_IMPORTACION_MOSTRADOS = 10
+    OPCIONES_MENU = {
+        "1": "Agregar Paciente",
+        "2": "Agregar Médico",
+        "3": "Agendar Turno",
+        "4": "Agregar Especialidad a Médico Existente",
+        "5": "Emitir Receta",
+        "6": "Ver Historia Clínica de Paciente",
+        "7": "Listar Turnos",
+        "8": "Listar Pacientes",
+        "9": "Listar Médicos",
+        "10": "Importar Pacientes/Médicos desde Archivo (CSV/JSONL)",
+        "11": "Buscar Paciente o Médico por Nombre",
+        "12": "Buscar Próximos Turnos Libres por Especialidad",
+        "13": "Cancelar Turno",
+        "14": "Reprogramar Turno",
+        "15": "Agendar Serie de Turnos",
+        "0": "Salir",
+    }
+    ACCIONES_MENU = {
+        "1": "_opcion_agregar_paciente",
+        "2": "_opcion_agregar_medico",
+        "3": "_opcion_agendar_turno",
+        "4": "_opcion_agregar_especialidad_a_medico",
+        "5": "_opcion_emitir_receta",
+        "6": "_opcion_ver_historia_clinica",
+        "7": "_opcion_listar_turnos",
+        "8": "_opcion_listar_pacientes",
+        "9": "_opcion_listar_medicos",
+        "10": "_opcion_importar_desde_archivo",
+        "11": "_opcion_buscar_por_nombre",
+        "12": "_opcion_buscar_turnos_libres",
+        "13": "_opcion_cancelar_turno",
+        "14": "_opcion_reprogramar_turno",
+        "15": "_opcion_agendar_serie_turnos",
+    }
+    MAX_ERRORES_LOTE_DETALLADOS = 100
+    TURNOS_LIBRES_MOSTRADOS = 5
+    TAMANIO_PAGINA = 20
+    COMANDOS_POR_TRANSACCION = 1000
+
+    def __init__(self, clinica: Clinica = Clinica(), perfilador=None):
         self.__clinica__ = clinica
+        # PerfiladorSesion opcional que mide el tiempo de cada opción (ver perfilado.py y --profile en app.py)
+        self.__perfilador__ = perfilador
+        # En modo lote las respuestas salen de la lista de valores del comando en lugar de input()
+        # y lo que se mostraría se acumula en una lista (ver _leer, _mostrar y ejecutar_lote)
+        self.__valores_lote__: Iterator[str] | None = None
+        self.__salida_lote__: list[str] | None = None
 
     def mostrar_menu_principal(self):
         print("\n--- Menú Clínica ---")
-        print("1. Agregar Paciente")
-        print("2. Agregar Médico")
-        print("3. Agendar Turno")
-        print("4. Agregar Especialidad a Médico Existente")
-        print("5. Emitir Receta")
-        print("6. Ver Historia Clínica de Paciente")
-        print("7. Listar Turnos")
-        print("8. Listar Pacientes")
-        print("9. Listar Médicos")
-        print("0. Salir")
+        for opcion, nombre in self.OPCIONES_MENU.items():
+            print(f"{opcion}. {nombre}")
+
+    def _medir_opcion(self, opcion: str) -> AbstractContextManager:
+        if self.__perfilador__ is None:
+            return nullcontext()
+        return self.__perfilador__.opcion(f"{opcion}. {self.OPCIONES_MENU[opcion]}")
 
     def iniciar(self):
         while True:
             self.mostrar_menu_principal()
             opcion = input("Seleccione una opción: ")
+            if opcion == '0':
+                print("¡Hasta luego!")
+                break
 
             try:
-                if opcion == '1':
-                    self._opcion_agregar_paciente()
-                elif opcion == '2':
-                    self._opcion_agregar_medico()
-                elif opcion == '3':
-                    self._opcion_agendar_turno()
-                elif opcion == '4':
-                    self._opcion_agregar_especialidad_a_medico()
-                elif opcion == '5':
-                    self._opcion_emitir_receta()
-                elif opcion == '6':
-                    self._opcion_ver_historia_clinica()
-                elif opcion == '7':
-                    self._opcion_listar_turnos()
-                elif opcion == '8':
-                    self._opcion_listar_pacientes()
-                elif opcion == '9':
-                    self._opcion_listar_medicos()
-                elif opcion == '0':
-                    print("¡Hasta luego!")
-                    break
+                if opcion in self.ACCIONES_MENU:
+                    with self._medir_opcion(opcion):
+                        getattr(self, self.ACCIONES_MENU[opcion])()
                 else:
                     print("Opción no válida. Intente de nuevo.")
             except ClinicaException as e:
@@ -60,42 +98,119 @@ class CLI:
             input("\nPresione Enter para continuar...")
 
 
+    # Modo lote
+    def ejecutar_lote(self, comandos: Iterable[ComandoLote], salida: list[str] | None = None) -> ResultadoLote:
+        # Ejecuta cada comando con la misma lógica que el menú, sin pausas; si se pasa `salida`,
+        # ahí se acumula lo que cada opción mostraría por pantalla
+        resultado = ResultadoLote(self.MAX_ERRORES_LOTE_DETALLADOS)
+        salida = salida if salida is not None else []
+        inicio = time.perf_counter()
+        comandos = iter(comandos)
+        procesados = self.COMANDOS_POR_TRANSACCION
+        # Como en la importación, las escrituras se confirman de a bloques
+        while procesados == self.COMANDOS_POR_TRANSACCION:
+            procesados = 0
+            with self.__clinica__.transaccion():
+                for numero_linea, comando in islice(comandos, self.COMANDOS_POR_TRANSACCION):
+                    procesados += 1
+                    self._ejecutar_comando(numero_linea, comando, resultado, salida)
+        resultado.registrar_duracion(time.perf_counter() - inicio)
+        return resultado
+
+    def _ejecutar_comando(self, numero_linea: int, comando: tuple[str, list[str]] | Exception,
+                          resultado: ResultadoLote, salida: list[str]) -> None:
+        if isinstance(comando, Exception):
+            resultado.registrar_error(numero_linea, comando)
+            return
+        opcion, valores = comando
+        opcion = self._resolver_opcion(opcion)
+        if opcion is None:
+            resultado.registrar_error(numero_linea, ValueError(f"Opción desconocida: '{comando[0]}'."), comando[0])
+            return
+
+        nombre_opcion = f"{opcion}. {self.OPCIONES_MENU[opcion]}"
+        self.__valores_lote__, self.__salida_lote__ = iter(valores), salida
+        inicio = time.perf_counter()
+        try:
+            with self._medir_opcion(opcion):
+                getattr(self, self.ACCIONES_MENU[opcion])()
+        except Exception as e:
+            resultado.registrar_error(numero_linea, e, nombre_opcion, time.perf_counter() - inicio)
+        else:
+            resultado.registrar_correcto(nombre_opcion, time.perf_counter() - inicio)
+            # Cuántas preguntas hace una opción depende de las respuestas, así que los valores sobrantes solo se
+            # conocen al terminar: el comando ya cambió la clínica y cuenta como correcto, con una advertencia
+            sobrantes = sum(1 for _ in self.__valores_lote__)
+            if sobrantes:
+                resultado.registrar_advertencia(
+                    numero_linea, nombre_opcion, f"sobraron valores sin usar ({sobrantes}); revise el orden de los datos."
+                )
+        finally:
+            self.__valores_lote__, self.__salida_lote__ = None, None
+
+    def _resolver_opcion(self, opcion: str) -> str | None:
+        # Se acepta el número del menú o el nombre de la acción (por ejemplo "agendar_turno")
+        if opcion in self.ACCIONES_MENU:
+            return opcion
+        for numero, accion in self.ACCIONES_MENU.items():
+            if accion == f"_opcion_{opcion}":
+                return numero
+        return None
+
+    def _leer(self, mensaje: str, por_defecto: str | None = None) -> str:
+        # `por_defecto` es el valor que toma en modo lote una pregunta opcional que el comando no responde
+        if self.__valores_lote__ is None:
+            return input(mensaje)
+        valor = next(self.__valores_lote__, por_defecto)
+        if valor is None:
+            raise ValueError(f"Faltan valores en el comando: se esperaba '{mensaje.strip()}'")
+        return valor
+
+    def _en_modo_lote(self) -> bool:
+        return self.__valores_lote__ is not None
+
+    def _mostrar(self, *valores) -> None:
+        if self.__salida_lote__ is None:
+            print(*valores)
+        else:
+            self.__salida_lote__.append(" ".join(str(valor) for valor in valores))
+
+
     def _opcion_agregar_paciente(self):
-        print("\n--- Agregar Nuevo Paciente ---")
-        nombre = input("Nombre completo del paciente: ")
-        dni = input("DNI del paciente (solo números): ")
-        fecha_nacimiento = input("Fecha de nacimiento (DD/MM/AAAA): ")
+        self._mostrar("\n--- Agregar Nuevo Paciente ---")
+        nombre = self._leer("Nombre completo del paciente: ")
+        dni = self._leer("DNI del paciente (solo números): ")
+        fecha_nacimiento = self._leer("Fecha de nacimiento (DD/MM/AAAA): ")
 
         from src.clinica_gestion.modelo.paciente import Paciente
         nuevo_paciente = Paciente(nombre, dni, fecha_nacimiento)
         self.__clinica__.agregar_paciente(nuevo_paciente)
-        print(f"Paciente {nombre} (DNI: {dni}) agregado exitosamente.")
+        self._mostrar(f"Paciente {nombre} (DNI: {dni}) agregado exitosamente.")
 
     def _opcion_listar_pacientes(self):
-        print("\n--- Listado de Pacientes ---")
-        pacientes = self.__clinica__.obtener_pacientes()
-        if not pacientes:
-            print("No hay pacientes registrados.")
-            return
-        for p in pacientes:
-            print(p)
+        self._mostrar("\n--- Listado de Pacientes ---")
+        filtros = self._leer_filtros("nombre", "inicio", "cantidad")
+        self._listar_paginado(
+            lambda desde, cantidad: self.__clinica__.iterar_pacientes(desde, cantidad, filtros.get("nombre")),
+            str, filtros, "No hay pacientes registrados.",
+        )
 
 
     def _opcion_agregar_medico(self):
-        print("\n--- Agregar Nuevo Médico ---")
-        nombre = input("Nombre completo del médico: ")
-        matricula = input("Matrícula del médico: ")
+        self._mostrar("\n--- Agregar Nuevo Médico ---")
+        nombre = self._leer("Nombre completo del médico: ")
+        matricula = self._leer("Matrícula del médico: ")
 
         from src.clinica_gestion.modelo.medico import Medico
         nuevo_medico = Medico(nombre, matricula)
 
         while True:
-            agregar_esp = input("¿Desea agregar una especialidad a este médico? (s/n): ").lower()
+            agregar_esp = self._leer("¿Desea agregar una especialidad a este médico? (s/n): ").lower()
             if agregar_esp != 's':
                 break
 
-            nombre_esp = input("Nombre de la especialidad: ")
-            dias_str = input("Días de atención para esta especialidad (ej: lunes,martes,viernes): ")
+            nombre_esp = self._leer("Nombre de la especialidad: ")
+            dias_str = self._leer("Días de atención para esta especialidad (ej: lunes,martes,viernes): ")
             lista_dias = [dia.strip().lower() for dia in dias_str.split(',')]
 
             dias_validos = []
@@ -103,44 +218,52 @@ class CLI:
                 if dia in Clinica.DIAS_SEMANA_ES: # Usamos la lista de Clinica
                     dias_validos.append(dia)
                 else:
-                    print(f"Advertencia: Día '{dia}' no reconocido y será ignorado.")
+                    self._mostrar(f"Advertencia: Día '{dia}' no reconocido y será ignorado.")
 
             if not dias_validos:
-                print("No se ingresaron días válidos para la especialidad. No se agregará.")
+                self._mostrar("No se ingresaron días válidos para la especialidad. No se agregará.")
                 continue
 
             especialidad = Especialidad(nombre_esp, dias_validos)
             nuevo_medico.agregar_especialidad(especialidad)
-            print(f"Especialidad '{nombre_esp}' agregada al Dr. {nombre}.")
+            self._mostrar(f"Especialidad '{nombre_esp}' agregada al Dr. {nombre}.")
 
         self.__clinica__.agregar_medico(nuevo_medico)
-        print(f"Médico {nombre} (Matrícula: {matricula}) agregado exitosamente.")
+        self._mostrar(f"Médico {nombre} (Matrícula: {matricula}) agregado exitosamente.")
 
 
     def _opcion_listar_medicos(self):
-        print("\n--- Listado de Médicos ---")
-        medicos = self.__clinica__.obtener_medicos()
-        if not medicos:
-            print("No hay médicos registrados.")
-            return
-        for m in medicos:
-            print(f"- {m.obtener_nombre()} (Matrícula: {m.obtener_matricula()})")
-            especialidades_medico = m.obtener_especialidades()
-            if especialidades_medico:
-                print(f"    Especialidades: {[str(esp) for esp in especialidades_medico]}".replace("'", ""))
-            else:
-                print("  Especialidades: Ninguna")
+        self._mostrar("\n--- Listado de Médicos ---")
+        filtros = self._leer_filtros("especialidad", "inicio", "cantidad", "detalle")
+        self._listar_paginado(
+            lambda desde, cantidad: self.__clinica__.iterar_medicos(desde, cantidad, filtros.get("especialidad")),
+            self._detalle_medico if "detalle" in filtros else self._linea_medico,
+            filtros, "No hay médicos registrados.",
+        )
+
+    def _linea_medico(self, medico) -> str:
+        especialidades = ", ".join(esp.obtener_especialidad() for esp in medico.obtener_especialidades()) or "sin especialidades"
+        return f"{medico.obtener_nombre()} ({medico.obtener_matricula()}) | {especialidades}"
+
+    def _detalle_medico(self, medico) -> str:
+        lineas = [f"- {medico.obtener_nombre()} (Matrícula: {medico.obtener_matricula()})"]
+        especialidades_medico = medico.obtener_especialidades()
+        if especialidades_medico:
+            lineas.append(f"    Especialidades: {[str(esp) for esp in especialidades_medico]}".replace("'", ""))
+        else:
+            lineas.append("  Especialidades: Ninguna")
+        return "\n".join(lineas)
 
 
     def _opcion_agregar_especialidad_a_medico(self):
-        print("\n--- Agregar Especialidad a Médico Existente ---")
-        matricula = input("Ingrese la matrícula del médico: ")
+        self._mostrar("\n--- Agregar Especialidad a Médico Existente ---")
+        matricula = self._leer("Ingrese la matrícula del médico: ")
 
         medico = self.__clinica__.obtener_medico_por_matricula(matricula) # Lanza excepción si no existe
-        print(f"Médico encontrado: {medico.obtener_nombre()}")
+        self._mostrar(f"Médico encontrado: {medico.obtener_nombre()}")
 
-        nombre_esp = input("Nombre de la nueva especialidad: ")
-        dias_str = input("Días de atención para esta especialidad (ej: lunes,martes,viernes): ")
+        nombre_esp = self._leer("Nombre de la nueva especialidad: ")
+        dias_str = self._leer("Días de atención para esta especialidad (ej: lunes,martes,viernes): ")
         lista_dias = [dia.strip().lower() for dia in dias_str.split(',')]
 
         dias_validos = []
@@ -148,59 +271,182 @@ class CLI:
             if dia in Clinica.DIAS_SEMANA_ES:
                 dias_validos.append(dia)
             else:
-                print(f"Advertencia: Día '{dia}' no reconocido y será ignorado.")
+                self._mostrar(f"Advertencia: Día '{dia}' no reconocido y será ignorado.")
 
         if not dias_validos:
-            print("No se ingresaron días válidos para la especialidad. No se agregará.")
+            self._mostrar("No se ingresaron días válidos para la especialidad. No se agregará.")
             return
 
         especialidad = Especialidad(nombre_esp, dias_validos)
-        medico.agregar_especialidad(especialidad)
-        print(f"Especialidad '{nombre_esp}' agregada exitosamente al Dr./Dra. {medico.obtener_nombre()}.")
+        self.__clinica__.agregar_especialidad(matricula, especialidad)
+        self._mostrar(f"Especialidad '{nombre_esp}' agregada exitosamente al Dr./Dra. {medico.obtener_nombre()}.")
 
 
     def _opcion_agendar_turno(self):
-        print("\n--- Agendar Nuevo Turno ---")
-        dni_paciente = input("DNI del paciente: ")
-        matricula_medico = input("Matrícula del médico: ")
-        fecha_hora_str = input("Fecha y hora del turno (YYYY-MM-DD HH:MM): ")
-        nombre_especialidad = input("Especialidad deseada para el turno: ")
+        self._mostrar("\n--- Agendar Nuevo Turno ---")
+        dni_paciente = self._leer("DNI del paciente: ")
+        matricula_medico = self._leer("Matrícula del médico: ")
+        fecha_hora_str = self._leer("Fecha y hora del turno (YYYY-MM-DD HH:MM): ")
+        nombre_especialidad = self._leer("Especialidad deseada para el turno: ")
+        minutos = self._leer_minutos_turno()
 
         turno_agendado = self.__clinica__.agendar_turno(
             dni_paciente,
             matricula_medico,
             fecha_hora_str,
-            nombre_especialidad
+            nombre_especialidad,
+            minutos
         )
-        print("\n¡Turno agendado exitosamente!\n")
-        print(f"Turno:\n{turno_agendado}")
+        self._mostrar("\n¡Turno agendado exitosamente!\n")
+        self._mostrar(f"Turno:\n{turno_agendado}")
+
+
+    def _opcion_agendar_serie_turnos(self):
+        self._mostrar("\n--- Agendar Serie de Turnos ---")
+        dni_paciente = self._leer("DNI del paciente: ")
+        matricula_medico = self._leer("Matrícula del médico: ")
+        fecha_hora_str = self._leer("Fecha y hora del primer turno (YYYY-MM-DD HH:MM): ")
+        nombre_especialidad = self._leer("Especialidad deseada para los turnos: ")
+        cantidad = self._leer_entero("Cantidad de turnos: ")
+        dias_entre_turnos = self._leer_entero("Días entre un turno y el siguiente (Enter para semanal): ", 7)
+        minutos = self._leer_minutos_turno()
+
+        turnos = self.__clinica__.agendar_serie_turnos(
+            dni_paciente, matricula_medico, fecha_hora_str, nombre_especialidad, cantidad, dias_entre_turnos, minutos
+        )
+        lineas = [f"\n¡{len(turnos)} turnos agendados exitosamente!"]
+        lineas.extend(self._linea_turno(turno) for turno in turnos)
+        self._mostrar("\n".join(lineas))
+
+    def _leer_entero(self, mensaje: str, por_defecto: int | None = None) -> int:
+        texto = self._leer(mensaje, por_defecto="" if por_defecto is not None else None).strip()
+        if not texto and por_defecto is not None:
+            return por_defecto
+        if not texto.isdigit():
+            raise ValueError(f"Se esperaba un número entero: '{texto}'.")
+        return int(texto)
+
+    def _leer_minutos_turno(self) -> int:
+        return self._leer_entero(f"Duración en minutos (Enter para {MINUTOS_TURNO}): ", MINUTOS_TURNO)
+
+
+    def _opcion_cancelar_turno(self):
+        self._mostrar("\n--- Cancelar Turno ---")
+        id_turno = self._leer_id_turno()
+        turno_cancelado = self.__clinica__.cancelar_turno(id_turno)
+        self._mostrar(f"Turno {id_turno} cancelado: {self._linea_turno(turno_cancelado)}")
+
+
+    def _opcion_reprogramar_turno(self):
+        self._mostrar("\n--- Reprogramar Turno ---")
+        id_turno = self._leer_id_turno()
+        fecha_hora_str = self._leer("Nueva fecha y hora del turno (YYYY-MM-DD HH:MM): ")
+
+        turno_reprogramado = self.__clinica__.reprogramar_turno(id_turno, fecha_hora_str)
+        self._mostrar("\n¡Turno reprogramado exitosamente!\n")
+        self._mostrar(f"Turno:\n{turno_reprogramado}")
+
+    def _leer_id_turno(self) -> int:
+        return self._leer_entero("ID del turno (se muestra al listar los turnos): ")
 
 
     def _opcion_listar_turnos(self):
-        print("\n--- Listado de Turnos Agendados ---")
-        turnos = self.__clinica__.obtener_turnos()
-        if not turnos:
-            print("No hay turnos agendados.")
-            return
-        for t in turnos:
-            print(t)
+        self._mostrar("\n--- Listado de Turnos Agendados ---")
+        filtros = self._leer_filtros("medico", "paciente", "especialidad", "fecha_desde", "fecha_hasta",
+                                     "inicio", "cantidad", "detalle")
+        fecha_desde = self._parse_fecha_filtro(filtros, "fecha_desde")
+        fecha_hasta = self._parse_fecha_filtro(filtros, "fecha_hasta")
+        if fecha_hasta is not None:
+            # La fecha final incluye todo ese día
+            fecha_hasta = fecha_hasta.replace(hour=23, minute=59, second=59, microsecond=999999)
+        self._listar_paginado(
+            lambda desde, cantidad: self.__clinica__.iterar_turnos(
+                desde, cantidad, filtros.get("medico"), filtros.get("paciente"), filtros.get("especialidad"),
+                fecha_desde, fecha_hasta,
+            ),
+            str if "detalle" in filtros else self._linea_turno,
+            filtros, "No hay turnos agendados.",
+        )
+
+    def _linea_turno(self, turno) -> str:
+        medico, paciente = turno.obtener_medico(), turno.obtener_paciente()
+        return (
+            f"#{turno.obtener_id()} | {turno.obtener_fecha_hora():%Y-%m-%d %H:%M} | {turno.obtener_especialidad_atendida()} | "
+            f"{medico.obtener_nombre()} ({medico.obtener_matricula()}) | {paciente.obtener_nombre()} (DNI {paciente.obtener_dni()})"
+        )
+
+
+    # Listados paginados
+    def _leer_filtros(self, *claves: str) -> dict[str, str]:
+        # Filtros como clave=valor separados por espacios (los valores con espacios van entre comillas);
+        # "detalle" no lleva valor y muestra el formato completo en lugar de una línea por elemento
+        ayuda = ", ".join(clave if clave == "detalle" else f"{clave}=" for clave in claves)
+        texto = self._leer(f"Filtros ({ayuda}; Enter para ninguno): ", por_defecto="")
+        filtros = {}
+        for parte in shlex.split(texto):
+            clave, _, valor = parte.partition("=")
+            if clave not in claves:
+                raise ValueError(f"Filtro desconocido: '{clave}'. Los filtros válidos son: {', '.join(claves)}.")
+            filtros[clave] = valor.strip()
+        return filtros
+
+    def _parse_fecha_filtro(self, filtros: dict[str, str], clave: str) -> datetime | None:
+        if not filtros.get(clave):
+            return None
+        try:
+            return datetime.strptime(filtros[clave], "%Y-%m-%d")
+        except ValueError:
+            raise ValueError(f"El filtro '{clave}' debe tener el formato AAAA-MM-DD.")
+
+    def _parse_entero_filtro(self, filtros: dict[str, str], clave: str, por_defecto: int) -> int:
+        if not filtros.get(clave):
+            return por_defecto
+        if not filtros[clave].isdigit() or int(filtros[clave]) < 1:
+            raise ValueError(f"El filtro '{clave}' debe ser un número entero mayor que cero.")
+        return int(filtros[clave])
+
+    def _listar_paginado(self, obtener_pagina: Callable[[int, int], Iterator], formatear: Callable[[object], str],
+                         filtros: dict[str, str], sin_elementos: str) -> None:
+        # Cada página se pide al repositorio por separado y se muestra con una sola escritura.
+        # `inicio` es la posición (desde 1) del primer elemento y `cantidad` el tamaño de la página.
+        desde = self._parse_entero_filtro(filtros, "inicio", 1) - 1
+        tamanio = self._parse_entero_filtro(filtros, "cantidad", self.TAMANIO_PAGINA)
+        filtrado = any(valor for clave, valor in filtros.items() if clave not in ("inicio", "cantidad", "detalle"))
+        while True:
+            # Se pide un elemento más que el tamaño de la página para saber si hay otra después
+            elementos = list(obtener_pagina(desde, tamanio + 1))
+            hay_mas = len(elementos) > tamanio
+            lineas = [formatear(elemento) for elemento in elementos[:tamanio]]
+            if not lineas:
+                if desde > 0:
+                    self._mostrar("No hay más resultados.")
+                else:
+                    self._mostrar("No hay resultados para los filtros indicados." if filtrado else sin_elementos)
+                return
+            lineas.append(f"[{desde + 1}-{desde + len(lineas)}{', hay más' if hay_mas else ''}]")
+            self._mostrar("\n".join(lineas))
+            if not hay_mas or self._en_modo_lote():
+                return
+            if self._leer("Enter para ver la página siguiente, 'q' para volver al menú: ").strip().lower() == "q":
+                return
+            desde += tamanio
 
 
     def _opcion_emitir_receta(self):
-        print("\n--- Emitir Nueva Receta ---")
-        dni_paciente = input("DNI del paciente: ")
-        matricula_medico = input("Matrícula del médico que emite: ")
+        self._mostrar("\n--- Emitir Nueva Receta ---")
+        dni_paciente = self._leer("DNI del paciente: ")
+        matricula_medico = self._leer("Matrícula del médico que emite: ")
 
         medicamentos = []
-        print("Ingrese los medicamentos (deje vacío y presione Enter para finalizar):")
+        self._mostrar("Ingrese los medicamentos (deje vacío y presione Enter para finalizar):")
         while True:
-            medicamento = input(f"Medicamento {len(medicamentos) + 1}: ")
+            medicamento = self._leer(f"Medicamento {len(medicamentos) + 1}: ")
             if not medicamento:
                 break
             medicamentos.append(medicamento)
 
         if not medicamentos:
-            print("No se ingresaron medicamentos. No se emitirá la receta.")
+            self._mostrar("No se ingresaron medicamentos. No se emitirá la receta.")
             return
 
         receta_emitida = self.__clinica__.emitir_receta(
@@ -208,15 +454,79 @@ class CLI:
             matricula_medico,
             medicamentos
         )
-        print("\n¡Receta emitida exitosamente!\n")
-        print(f"Receta: {receta_emitida}")
+        self._mostrar("\n¡Receta emitida exitosamente!\n")
+        self._mostrar(f"Receta: {receta_emitida}")
 
 
     def _opcion_ver_historia_clinica(self):
-        print("\n--- Ver Historia Clínica ---")
-        dni_paciente = input("DNI del paciente: ")
+        self._mostrar("\n--- Ver Historia Clínica ---")
+        dni_paciente = self._leer("DNI del paciente: ")
 
         historia_clinica = self.__clinica__.obtener_historia_clinica(dni_paciente)
-        print("\n------------------------------------")
-        print(historia_clinica)
-        print("------------------------------------")
+        self._mostrar("\n------------------------------------")
+        self._mostrar(historia_clinica)
+        self._mostrar("------------------------------------")
+
+
+    def _opcion_importar_desde_archivo(self):
+        self._mostrar("\n--- Importar desde Archivo ---")
+        tipo = self._leer("¿Qué desea importar? (pacientes/medicos): ").strip().lower()
+        if tipo not in ("pacientes", "medicos"):
+            self._mostrar("Tipo de importación no válido. Use 'pacientes' o 'medicos'.")
+            return
+        ruta = self._leer("Ruta del archivo (.csv o .jsonl): ").strip()
+
+        importador = ImportadorClinica(self.__clinica__)
+        if tipo == "pacientes":
+            resultado = importador.importar_pacientes_desde_archivo(ruta)
+        else:
+            resultado = importador.importar_medicos_desde_archivo(ruta)
+
+        self._mostrar(f"\nImportación finalizada. {resultado}")
+        errores = resultado.obtener_errores()
+        for error in errores[:self.MAX_ERRORES_IMPORTACION_MOSTRADOS]:
+            self._mostrar(f"  {error}")
+        if resultado.obtener_cantidad_errores() > self.MAX_ERRORES_IMPORTACION_MOSTRADOS:
+            self._mostrar(f"  ... y {resultado.obtener_cantidad_errores() - self.MAX_ERRORES_IMPORTACION_MOSTRADOS} errores más.")
+
+
+    def _opcion_buscar_por_nombre(self):
+        self._mostrar("\n--- Buscar por Nombre ---")
+        texto = self._leer("Nombre o parte del nombre (sin importar acentos ni mayúsculas): ").strip()
+        if not texto:
+            self._mostrar("No se ingresó ningún nombre.")
+            return
+
+        pacientes = self.__clinica__.buscar_pacientes(texto, self.TAMANIO_PAGINA)
+        medicos = self.__clinica__.buscar_medicos(texto, self.TAMANIO_PAGINA)
+        lineas = ["Pacientes:"]
+        lineas.extend(f"  {paciente}" for paciente in pacientes)
+        if not pacientes:
+            lineas.append("  Sin coincidencias.")
+        lineas.append("Médicos:")
+        lineas.extend(f"  {self._linea_medico(medico)}" for medico in medicos)
+        if not medicos:
+            lineas.append("  Sin coincidencias.")
+        self._mostrar("\n".join(lineas))
+
+
+    def _opcion_buscar_turnos_libres(self):
+        self._mostrar("\n--- Buscar Turnos Libres ---")
+        especialidad = self._leer("Especialidad: ").strip()
+        desde_str = self._leer("Desde (YYYY-MM-DD HH:MM, Enter para buscar desde ahora): ", por_defecto="").strip()
+        desde = None
+        if desde_str:
+            desde = parse_fecha_hora(desde_str)
+            if desde is None:
+                raise ValueError("Formato de fecha y hora inválido. Use YYYY-MM-DD HH:MM.")
+
+        libres = self.__clinica__.buscar_proximo_turno_libre(especialidad, desde, cantidad=self.TURNOS_LIBRES_MOSTRADOS)
+        if not libres:
+            self._mostrar(f"No hay turnos libres para '{especialidad}'.")
+            return
+        lineas = [
+            f"{horario.strftime('%Y-%m-%d %H:%M')} | {medico.obtener_nombre()} ({medico.obtener_matricula()})"
+            for horario, medico in libres
+        ]
+        lineas.append("Para reservar uno, use la opción 3 con esa fecha y matrícula.")
+        self._mostrar("\n".join(lineas))
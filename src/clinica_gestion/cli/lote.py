@@ -0,0 +1,122 @@
+import json
+from collections.abc import Iterable, Iterator
+from src.clinica_gestion.modelo.importacion import ErrorImportacion, ResultadoImportacion
+
+# Un comando leído: número de línea en el archivo y la opción con sus valores (o el error que impidió leerlo).
+# Formatos, que se pueden mezclar en un mismo archivo:
+#   3|12345678|MAT001|2030-01-07 10:00|Pediatría
+#   agendar_turno|12345678|MAT001|2030-01-07 10:00|Pediatría
+#   {"opcion": "agendar_turno", "valores": ["12345678", "MAT001", "2030-01-07 10:00", "Pediatría"]}
+# Los valores son las respuestas a las preguntas de la opción, en el mismo orden que en el menú.
+# Las líneas vacías y las que empiezan con '#' se ignoran.
+ComandoLote = tuple[int, tuple[str, list[str]] | Exception]
+
+SEPARADOR_VALORES = "|"
+
+
+def leer_comandos(lineas: Iterable[str]) -> Iterator[ComandoLote]:
+    for numero_linea, linea in enumerate(lineas, start=1):
+        linea = linea.strip()
+        if not linea or linea.startswith("#"):
+            continue
+        try:
+            yield numero_linea, _parse_comando(linea)
+        except ValueError as e:
+            yield numero_linea, e
+
+
+def leer_comandos_desde_archivo(ruta: str) -> Iterator[ComandoLote]:
+    with open(ruta, encoding="utf-8") as archivo:
+        yield from leer_comandos(archivo)
+
+
+def _parse_comando(linea: str) -> tuple[str, list[str]]:
+    if not linea.startswith("{"):
+        opcion, *valores = linea.split(SEPARADOR_VALORES)
+        return opcion.strip(), valores
+    try:
+        comando = json.loads(linea)
+    except ValueError as e:
+        raise ValueError(f"JSON inválido: {e}")
+    if not isinstance(comando, dict) or "opcion" not in comando:
+        raise ValueError("Cada línea JSON debe ser un objeto con el campo 'opcion'.")
+    valores = comando.get("valores", [])
+    if not isinstance(valores, list):
+        raise ValueError("El campo 'valores' debe ser una lista.")
+    return str(comando["opcion"]), [str(valor) for valor in valores]
+
+
+class ErrorLote(ErrorImportacion):
+    def __init__(self, numero_linea: int, opcion: str, error: Exception):
+        super().__init__(numero_linea, error)
+        self.__opcion__: str = opcion
+
+    def obtener_numero_linea(self) -> int:
+        return self.obtener_numero_fila()
+
+    def obtener_opcion(self) -> str:
+        return self.__opcion__
+
+    def __str__(self) -> str:
+        error = self.obtener_error()
+        return f"Línea {self.obtener_numero_fila()} ({self.__opcion__}): {type(error).__name__}: {error}"
+
+
+class ResultadoLote(ResultadoImportacion):
+    # Los mismos contadores que una importación (un comando correcto cuenta como una fila importada),
+    # más los totales por opción y las advertencias de comandos que se ejecutaron igual
+    def __init__(self, max_errores_detallados: int):
+        super().__init__(max_errores_detallados)
+        # Por opción: [correctos, con error, segundos]
+        self.__por_opcion__: dict[str, list] = {}
+        self.__cantidad_advertencias__: int = 0
+        self.__advertencias__: list[str] = []
+
+    def registrar_correcto(self, opcion: str, segundos: float) -> None:
+        self.registrar_importado()
+        self._registrar_opcion(opcion, 0, segundos)
+
+    def registrar_error(self, numero_linea: int, error: Exception, opcion: str = "?", segundos: float | None = None) -> None:
+        # Sin `segundos` el comando no llegó a ejecutarse (línea mal escrita u opción desconocida)
+        # y no entra en los totales por opción
+        self._agregar_error(ErrorLote(numero_linea, opcion, error))
+        if segundos is not None:
+            self._registrar_opcion(opcion, 1, segundos)
+
+    def registrar_advertencia(self, numero_linea: int, opcion: str, mensaje: str) -> None:
+        self.__cantidad_advertencias__ += 1
+        if len(self.__advertencias__) < self.__max_errores_detallados__:
+            self.__advertencias__.append(f"Línea {numero_linea} ({opcion}): {mensaje}")
+
+    def _registrar_opcion(self, opcion: str, indice: int, segundos: float) -> None:
+        totales = self.__por_opcion__.setdefault(opcion, [0, 0, 0.0])
+        totales[indice] += 1
+        totales[2] += segundos
+
+    def obtener_correctos(self) -> int:
+        return self.obtener_importados()
+
+    def obtener_cantidad_advertencias(self) -> int:
+        return self.__cantidad_advertencias__
+
+    def obtener_advertencias(self) -> list[str]:
+        return list(self.__advertencias__)
+
+    def obtener_por_opcion(self) -> dict[str, tuple[int, int, float]]:
+        return {opcion: tuple(totales) for opcion, totales in self.__por_opcion__.items()}
+
+    def obtener_total_comandos(self) -> int:
+        return self.obtener_total_filas()
+
+    def obtener_comandos_por_segundo(self) -> float:
+        return self.obtener_filas_por_segundo()
+
+    def __str__(self) -> str:
+        lineas = [
+            f"Comandos ejecutados: {self.obtener_total_comandos()}, correctos: {self.obtener_correctos()}, "
+            f"con error: {self.obtener_cantidad_errores()}, con advertencias: {self.__cantidad_advertencias__} "
+            f"({self.obtener_segundos():.3f} s, {self.obtener_comandos_por_segundo():.0f} comandos/s)"
+        ]
+        for opcion, (correctos, errores, segundos) in self.__por_opcion__.items():
+            lineas.append(f"  {opcion}: {correctos} correctos, {errores} con error, {segundos:.3f} s")
+        return "\n".join(lineas)
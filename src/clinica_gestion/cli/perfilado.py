@@ -0,0 +1,130 @@
+import builtins
+import cProfile
+import io
+import pstats
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from src.clinica_gestion.modelo.clinica import Clinica
+
+
+class TiemposOpcion:
+    __slots__ = ("__veces__", "__total__", "__clinica__", "__salida__")
+
+    def __init__(self):
+        self.__veces__: int = 0
+        # Segundos dentro de la opción sin contar la espera de datos del usuario, de los cuales una parte
+        # se pasó en métodos de Clinica y otra en print (que incluye armar el texto de los objetos impresos)
+        self.__total__: float = 0.0
+        self.__clinica__: float = 0.0
+        self.__salida__: float = 0.0
+
+    def registrar(self, total: float, clinica: float, salida: float) -> None:
+        self.__veces__ += 1
+        self.__total__ += total
+        self.__clinica__ += clinica
+        self.__salida__ += salida
+
+    def obtener_veces(self) -> int:
+        return self.__veces__
+
+    def obtener_total(self) -> float:
+        return self.__total__
+
+    def obtener_clinica(self) -> float:
+        return self.__clinica__
+
+    def obtener_salida(self) -> float:
+        return self.__salida__
+
+    def obtener_resto(self) -> float:
+        return self.__total__ - self.__clinica__ - self.__salida__
+
+
+class PerfiladorSesion:
+    # Perfila una sesión del CLI con cProfile y mide cuánto tarda cada opción del menú, separando el tiempo
+    # del modelo (con las métricas de Clinica) del tiempo de impresión. Ver --profile en app.py.
+
+    def __init__(self, clinica: Clinica):
+        self.__clinica__: Clinica = clinica
+        self.__perfil__: cProfile.Profile = cProfile.Profile()
+        self.__tiempos__: dict[str, TiemposOpcion] = {}
+        # Acumulados de toda la sesión; cada opción toma la diferencia entre el inicio y el fin
+        self.__espera_entrada__: float = 0.0
+        self.__salida__: float = 0.0
+
+    @contextmanager
+    def sesion(self) -> Iterator["PerfiladorSesion"]:
+        if self.__clinica__.obtener_metricas() is None:
+            self.__clinica__.habilitar_metricas()
+        input_original, print_original = builtins.input, builtins.print
+        builtins.input, builtins.print = self._medir_entrada(input_original), self._medir_salida(print_original)
+        self.__perfil__.enable()
+        try:
+            yield self
+        finally:
+            self.__perfil__.disable()
+            builtins.input, builtins.print = input_original, print_original
+
+    def _medir_entrada(self, original):
+        def entrada(*args):
+            inicio = time.perf_counter()
+            try:
+                return original(*args)
+            finally:
+                self.__espera_entrada__ += time.perf_counter() - inicio
+        return entrada
+
+    def _medir_salida(self, original):
+        def salida(*args, **kwargs):
+            inicio = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.__salida__ += time.perf_counter() - inicio
+        return salida
+
+    @contextmanager
+    def opcion(self, nombre: str) -> Iterator[None]:
+        inicio = time.perf_counter()
+        espera, salida, clinica = self.__espera_entrada__, self.__salida__, self._tiempo_clinica()
+        try:
+            yield
+        finally:
+            self.__tiempos__.setdefault(nombre, TiemposOpcion()).registrar(
+                time.perf_counter() - inicio - (self.__espera_entrada__ - espera),
+                self._tiempo_clinica() - clinica,
+                self.__salida__ - salida,
+            )
+
+    def _tiempo_clinica(self) -> float:
+        return sum(datos["latencia"]["suma_segundos"] for datos in self.__clinica__.metricas().values())
+
+    def obtener_tiempos(self) -> dict[str, TiemposOpcion]:
+        return dict(self.__tiempos__)
+
+
+    # Informes
+    def informe(self, limite_funciones: int = 30) -> str:
+        lineas = [
+            "Tiempo por opción del menú (segundos, sin contar la espera de datos del usuario)",
+            f"{'opción':<48}{'veces':>7}{'total':>10}{'clínica':>10}{'salida':>10}{'resto':>10}",
+        ]
+        for nombre, t in sorted(self.__tiempos__.items(), key=lambda item: item[1].obtener_total(), reverse=True):
+            lineas.append(f"{nombre:<48}{t.obtener_veces():>7}{t.obtener_total():>10.3f}{t.obtener_clinica():>10.3f}"
+                          f"{t.obtener_salida():>10.3f}{t.obtener_resto():>10.3f}")
+        if not self.__tiempos__:
+            lineas.append("(no se eligió ninguna opción)")
+
+        texto = io.StringIO()
+        estadisticas = pstats.Stats(self.__perfil__, stream=texto)
+        estadisticas.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limite_funciones)
+        return "\n".join(lineas) + "\n\n" + texto.getvalue()
+
+    def guardar(self, ruta_base: str) -> tuple[str, str]:
+        # <ruta_base>.pstats se abre con pstats o con visores como snakeviz; <ruta_base>.txt es el informe
+        ruta_pstats, ruta_informe = ruta_base + ".pstats", ruta_base + ".txt"
+        self.__perfil__.dump_stats(ruta_pstats)
+        with open(ruta_informe, "w", encoding="utf-8") as archivo:
+            archivo.write(self.informe())
+        return ruta_pstats, ruta_informe
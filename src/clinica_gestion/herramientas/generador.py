@@ -0,0 +1,211 @@
+# Genera clínicas sintéticas de gran tamaño para pruebas de escala y benchmarks.
+# Con la misma semilla y los mismos parámetros los datos generados son siempre idénticos.
+#
+# Uso: python -m src.clinica_gestion.herramientas.generador DIRECTORIO [--pacientes N] [--medicos M] ...
+#      (escribe un snapshot que luego se abre con: python app.py --datos DIRECTORIO)
+import argparse
+import os
+import random
+import time
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta
+from src.clinica_gestion.modelo.clinica import Clinica
+from src.clinica_gestion.modelo.especialidad import Especialidad
+from src.clinica_gestion.modelo.medico import Medico
+from src.clinica_gestion.modelo.paciente import Paciente
+from src.clinica_gestion.modelo.receta import Receta
+from src.clinica_gestion.modelo.turno import Turno
+from src.clinica_gestion.persistencia.journal import JournalClinica
+from src.clinica_gestion.persistencia.serializacion import serializar_paciente, serializar_medico, \
+    serializar_turno, serializar_receta
+
+NOMBRES = (
+    "Ana", "Bruno", "Carla", "Diego", "Elena", "Facundo", "Gabriela", "Hernán", "Inés", "Joaquín",
+    "Julieta", "Lautaro", "Lucía", "Martín", "Micaela", "Nicolás", "Paula", "Ramiro", "Sofía", "Tomás",
+    "Valentina", "Ximena",
+)
+APELLIDOS = (
+    "Acosta", "Benítez", "Castro", "Domínguez", "Fernández", "García", "Giménez", "Gómez", "González",
+    "Herrera", "López", "Martínez", "Molina", "Pérez", "Ramírez", "Rodríguez", "Romero", "Sosa", "Suárez",
+    "Torres",
+)
+ESPECIALIDADES = (
+    "Clínica Médica", "Pediatría", "Cardiología", "Dermatología", "Ginecología", "Traumatología",
+    "Oftalmología", "Psiquiatría", "Neurología", "Endocrinología", "Otorrinolaringología", "Kinesiología",
+)
+# Combinaciones de días habituales en una cartilla: la mayoría de lunes a viernes, algunas con sábado
+PATRONES_DIAS = (
+    ("lunes", "miércoles", "viernes"),
+    ("martes", "jueves"),
+    ("lunes", "martes", "miércoles", "jueves", "viernes"),
+    ("lunes", "jueves"),
+    ("miércoles",),
+    ("martes", "viernes"),
+    ("viernes", "sábado"),
+    ("sábado",),
+)
+MEDICAMENTOS = (
+    "Ibuprofeno 400mg", "Paracetamol 500mg", "Amoxicilina 500mg", "Omeprazol 20mg", "Enalapril 10mg",
+    "Losartán 50mg", "Metformina 850mg", "Levotiroxina 50mcg", "Sertralina 50mg", "Atorvastatina 20mg",
+    "Salbutamol 100mcg", "Loratadina 10mg", "Diclofenac 75mg", "Clonazepam 0.5mg", "Amlodipina 5mg",
+)
+
+# Los turnos se dan cada 30 minutos de 8:00 a 18:00
+HORA_INICIO_AGENDA = 8
+TURNOS_POR_DIA = 20
+MINUTOS_POR_TURNO = 30
+DESPLAZAMIENTOS_TURNOS = tuple(timedelta(minutes=MINUTOS_POR_TURNO * i) for i in range(TURNOS_POR_DIA))
+
+
+class GeneradorClinica:
+    def __init__(self, pacientes: int = 1000, medicos: int = 50, turnos: int = 5000, recetas: int = 2000,
+                 semilla: int = 0, inicio_agenda: date = date(2030, 1, 7)):
+        if pacientes < 1 or medicos < 1:
+            raise ValueError("Se necesita al menos un paciente y un médico.")
+        self.__cantidad_pacientes__: int = pacientes
+        self.__cantidad_medicos__: int = medicos
+        self.__cantidad_turnos__: int = turnos
+        self.__cantidad_recetas__: int = recetas
+        self.__semilla__: int = semilla
+        # Fecha fija (y no la actual) para que los turnos generados no dependan del día en que se corre
+        self.__inicio_agenda__: date = inicio_agenda
+        self.__pacientes__: list[Paciente] | None = None
+        self.__medicos__: list[Medico] | None = None
+
+    def _aleatorio(self, flujo: str) -> random.Random:
+        # Un generador independiente por tipo de dato: cambiar la cantidad de recetas no altera los turnos
+        return random.Random(f"{self.__semilla__}:{flujo}")
+
+
+    # Entidades
+    def obtener_pacientes(self) -> list[Paciente]:
+        if self.__pacientes__ is None:
+            aleatorio = self._aleatorio("pacientes")
+            self.__pacientes__ = [
+                Paciente(
+                    f"{aleatorio.choice(NOMBRES)} {aleatorio.choice(APELLIDOS)}",
+                    str(20_000_000 + i),
+                    f"{aleatorio.randint(1, 28):02d}/{aleatorio.randint(1, 12):02d}/{aleatorio.randint(1935, 2024)}",
+                )
+                for i in range(self.__cantidad_pacientes__)
+            ]
+        return self.__pacientes__
+
+    def obtener_medicos(self) -> list[Medico]:
+        if self.__medicos__ is None:
+            aleatorio = self._aleatorio("medicos")
+            self.__medicos__ = []
+            for i in range(self.__cantidad_medicos__):
+                medico = Medico(f"Dr. {aleatorio.choice(NOMBRES)} {aleatorio.choice(APELLIDOS)}", f"MAT{i + 1:06d}")
+                for tipo in aleatorio.sample(ESPECIALIDADES, aleatorio.choice((1, 1, 2, 3))):
+                    medico.agregar_especialidad(Especialidad(tipo, list(aleatorio.choice(PATRONES_DIAS))))
+                self.__medicos__.append(medico)
+        return self.__medicos__
+
+    def generar_turnos(self) -> Iterator[Turno]:
+        # Los turnos se reparten entre los médicos en ronda, y cada médico avanza por sus propios horarios
+        # de atención: los turnos son válidos para la especialidad del día y nunca se superponen
+        aleatorio = self._aleatorio("turnos")
+        pacientes = self.obtener_pacientes()
+        medicos = self.obtener_medicos()
+        agendas = [self._horarios_medico(medico, aleatorio) for medico in medicos]
+        # random() escalado es bastante más rápido que choice() y sigue siendo reproducible
+        azar = aleatorio.random
+        for i in range(self.__cantidad_turnos__):
+            indice_medico = i % len(medicos)
+            fecha_hora, especialidad = next(agendas[indice_medico])
+            yield Turno(
+                pacientes[int(azar() * len(pacientes))], medicos[indice_medico], fecha_hora, especialidad, i + 1,
+                MINUTOS_POR_TURNO,
+            )
+
+    def _horarios_medico(self, medico: Medico, aleatorio: random.Random) -> Iterator[tuple[datetime, str]]:
+        # Todo médico generado tiene al menos una especialidad con un día de atención, así que el ciclo siempre avanza
+        dia = datetime.combine(self.__inicio_agenda__, datetime.min.time()).replace(hour=HORA_INICIO_AGENDA)
+        while True:
+            especialidades = medico.obtener_especialidades_para_dia_semana(dia.weekday())
+            if especialidades:
+                for desplazamiento in DESPLAZAMIENTOS_TURNOS:
+                    especialidad = especialidades[int(aleatorio.random() * len(especialidades))]
+                    yield dia + desplazamiento, especialidad
+            dia += timedelta(days=1)
+
+    def generar_recetas(self) -> Iterator[Receta]:
+        # Las recetas son anteriores al inicio de la agenda, repartidas a lo largo del año previo
+        aleatorio = self._aleatorio("recetas")
+        pacientes = self.obtener_pacientes()
+        medicos = self.obtener_medicos()
+        fin = datetime.combine(self.__inicio_agenda__, datetime.min.time())
+        minutos_en_un_anio = 365 * 24 * 60
+        azar = aleatorio.random
+        for _ in range(self.__cantidad_recetas__):
+            yield Receta(
+                pacientes[int(azar() * len(pacientes))],
+                medicos[int(azar() * len(medicos))],
+                aleatorio.sample(MEDICAMENTOS, 1 + int(azar() * 3)),
+                fin - timedelta(minutes=1 + int(azar() * minutos_en_un_anio)),
+            )
+
+
+    # Destinos
+    def poblar(self, clinica: Clinica | None = None) -> Clinica:
+        # Conviene poblar la clínica antes de conectarle un journal: si no, cada alta se escribe a disco
+        clinica = clinica if clinica is not None else Clinica()
+        with clinica.transaccion():
+            for paciente in self.obtener_pacientes():
+                clinica.agregar_paciente(paciente)
+            for medico in self.obtener_medicos():
+                clinica.agregar_medico(medico)
+            for turno in self.generar_turnos():
+                clinica.restaurar_turno(
+                    turno.obtener_paciente().obtener_dni(), turno.obtener_medico().obtener_matricula(),
+                    turno.obtener_fecha_hora(), turno.obtener_especialidad_atendida(), turno.obtener_id(),
+                    turno.obtener_minutos(),
+                )
+            for receta in self.generar_recetas():
+                clinica.emitir_receta(
+                    receta.obtener_paciente().obtener_dni(), receta.obtener_medico().obtener_matricula(),
+                    receta.obtener_medicamentos(), receta.obtener_fecha_emision(),
+                )
+        return clinica
+
+    def escribir_snapshot(self, directorio: str) -> None:
+        # Escribe los datos en el formato de JournalClinica sin construir la clínica en memoria
+        os.makedirs(directorio, exist_ok=True)
+        for archivo in (JournalClinica.ARCHIVO_SNAPSHOT, JournalClinica.ARCHIVO_JOURNAL):
+            if os.path.exists(os.path.join(directorio, archivo)):
+                raise FileExistsError(f"El directorio '{directorio}' ya contiene datos de una clínica ({archivo}).")
+        JournalClinica.escribir_snapshot(os.path.join(directorio, JournalClinica.ARCHIVO_SNAPSHOT), 0, self._eventos(),
+                                         self.__cantidad_turnos__)
+
+    def _eventos(self) -> Iterator[tuple[str, dict]]:
+        for paciente in self.obtener_pacientes():
+            yield "agregar_paciente", serializar_paciente(paciente)
+        for medico in self.obtener_medicos():
+            yield "agregar_medico", serializar_medico(medico)
+        for turno in self.generar_turnos():
+            yield "agendar_turno", serializar_turno(turno)
+        for receta in self.generar_recetas():
+            yield "emitir_receta", serializar_receta(receta)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera una clínica sintética y la guarda como snapshot")
+    parser.add_argument("directorio", help="Directorio de datos donde se escribe el snapshot (no debe tener datos)")
+    parser.add_argument("--pacientes", type=int, default=100_000)
+    parser.add_argument("--medicos", type=int, default=500)
+    parser.add_argument("--turnos", type=int, default=1_000_000)
+    parser.add_argument("--recetas", type=int, default=200_000)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    generador = GeneradorClinica(args.pacientes, args.medicos, args.turnos, args.recetas, args.semilla)
+    inicio = time.perf_counter()
+    generador.escribir_snapshot(args.directorio)
+    segundos = time.perf_counter() - inicio
+    total = args.pacientes + args.medicos + args.turnos + args.recetas
+    print(f"{total} registros escritos en {args.directorio} en {segundos:.2f} s ({total / segundos:.0f} registros/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+import heapq
+import re
+import threading
+import unicodedata
+from bisect import bisect_left, bisect_right, insort_right
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime
+from functools import lru_cache
+from itertools import chain, islice, takewhile
+from src.clinica_gestion.modelo.especialidad import Especialidad
+from src.clinica_gestion.modelo.fechas import DIAS_SEMANA_ES
+from src.clinica_gestion.modelo.medico import Medico
+from src.clinica_gestion.modelo.receta import Receta
+
+PALABRA = re.compile(r"\w+")
+# Mayor que cualquier carácter: las palabras que empiezan con un prefijo p están entre p y p + FIN_PREFIJO
+FIN_PREFIJO = chr(0x10FFFF)
+LIMITE_RESULTADOS = 20
+
+
+@lru_cache(maxsize=65536)
+def _normalizar_palabra(palabra: str) -> str:
+    # Los nombres repiten mucho las mismas palabras, así que se guarda la versión ya normalizada
+    descompuesta = unicodedata.normalize("NFKD", palabra)
+    return "".join(caracter for caracter in descompuesta if not unicodedata.combining(caracter)).casefold()
+
+
+def normalizar_palabras(texto: str) -> list[str]:
+    # "Dr. José Pérez" -> ["dr", "jose", "perez"]: sin acentos, sin distinguir mayúsculas y sin puntuación
+    return [_normalizar_palabra(palabra) for palabra in PALABRA.findall(texto)]
+
+
+class IndiceNombres:
+    # Índice de búsqueda por nombre: cada palabra normalizada del nombre apunta a los elementos que la contienen,
+    # y las palabras distintas se mantienen ordenadas para encontrar por bisección todas las que empiezan con
+    # un prefijo. Se construye la primera vez que se busca (a partir de `origen`) y después se actualiza con
+    # cada alta, así las altas masivas no pagan el índice si nunca se busca.
+
+    def __init__(self, origen: Callable[[], Iterable], obtener_nombre: Callable[[object], str],
+                 obtener_clave: Callable[[object], str]):
+        self.__origen__: Callable[[], Iterable] = origen
+        self.__obtener_nombre__: Callable[[object], str] = obtener_nombre
+        self.__obtener_clave__: Callable[[object], str] = obtener_clave
+        # Las altas pueden venir de varios hilos (Clinica concurrente); el índice se protege con un único lock
+        self.__bloqueo__: threading.Lock = threading.Lock()
+        self.__construido__: bool = False
+        self.__elementos__: list = []
+        # Para cada elemento (misma posición que en __elementos__) el largo con 4 dígitos y el nombre normalizado:
+        # "0010 juan perez". Ordenar por este texto es ordenar por largo y después alfabéticamente, y al ser
+        # un str la comparación la hace C sin armar tuplas en cada búsqueda.
+        self.__ordenes__: list[str] = []
+        self.__posiciones__: dict[str, int] = {}
+        # Palabra -> posiciones de los elementos que la tienen en cualquier lugar del nombre / como primera palabra
+        self.__apariciones__: dict[str, list[int]] = {}
+        self.__primeras__: dict[str, list[int]] = {}
+        self.__palabras__: list[str] = []
+        # Palabras nuevas todavía no ubicadas en __palabras__: se ordenan juntas en la siguiente búsqueda
+        self.__palabras_nuevas__: list[str] = []
+
+    def agregar(self, elemento: object) -> None:
+        with self.__bloqueo__:
+            if self.__construido__:
+                self._agregar(elemento)
+
+    def _agregar(self, elemento: object) -> None:
+        clave = self.__obtener_clave__(elemento)
+        # Un alta que ocurre mientras se construye el índice puede llegar dos veces (desde el origen y desde agregar)
+        if clave in self.__posiciones__:
+            return
+        posicion = len(self.__elementos__)
+        palabras = normalizar_palabras(self.__obtener_nombre__(elemento))
+        nombre = " ".join(palabras)
+        self.__posiciones__[clave] = posicion
+        self.__elementos__.append(elemento)
+        self.__ordenes__.append(f"{len(nombre):04d} {nombre}")
+        for palabra in set(palabras):
+            apariciones = self.__apariciones__.get(palabra)
+            if apariciones is None:
+                self.__apariciones__[palabra] = [posicion]
+                self.__palabras_nuevas__.append(palabra)
+            else:
+                apariciones.append(posicion)
+        if palabras:
+            self.__primeras__.setdefault(palabras[0], []).append(posicion)
+
+    def _preparar(self) -> None:
+        if not self.__construido__:
+            try:
+                for elemento in self.__origen__():
+                    self._agregar(elemento)
+            except BaseException:
+                # Sin índice a medias: la próxima búsqueda lo vuelve a construir (y vuelve a informar el error)
+                self.__elementos__, self.__ordenes__, self.__posiciones__ = [], [], {}
+                self.__apariciones__, self.__primeras__, self.__palabras_nuevas__ = {}, {}, []
+                raise
+            self.__construido__ = True
+        if self.__palabras_nuevas__:
+            # La lista ya ordenada más una cola chica: timsort lo resuelve en tiempo casi lineal
+            self.__palabras__ = sorted(self.__palabras__ + self.__palabras_nuevas__)
+            self.__palabras_nuevas__ = []
+
+    def buscar(self, texto: str, limite: int = LIMITE_RESULTADOS) -> list:
+        # Cada palabra buscada es el comienzo de alguna palabra del nombre, en cualquier orden: "per ju" encuentra
+        # a "Juan Pérez". Primero los nombres que tienen todas las palabras buscadas completas, y dentro de cada
+        # grupo primero los que empiezan por la primera palabra buscada; después, los nombres más cortos.
+        buscadas = list(dict.fromkeys(normalizar_palabras(texto)))
+        if not buscadas or limite <= 0:
+            return []
+        with self.__bloqueo__:
+            self._preparar()
+            candidatos = self._candidatos(buscadas)
+            resultado: list[int] = []
+            for grupo in self._grupos_por_relevancia(buscadas, candidatos):
+                resultado.extend(heapq.nsmallest(limite - len(resultado), grupo, key=self.__ordenes__.__getitem__))
+                if len(resultado) >= limite:
+                    break
+            return [self.__elementos__[posicion] for posicion in resultado]
+
+    def _candidatos(self, buscadas: list[str]) -> set[int]:
+        # Se empieza por la palabra buscada con menos apariciones y se descartan candidatos con las demás
+        grupos = sorted(
+            ((buscada, self._con_prefijo(buscada, self.__apariciones__)) for buscada in buscadas),
+            key=lambda grupo: sum(map(len, grupo[1])),
+        )
+        candidatos = set(chain.from_iterable(grupos[0][1]))
+        for buscada, apariciones in grupos[1:]:
+            if not candidatos:
+                break
+            if len(candidatos) * 8 < sum(map(len, apariciones)):
+                # Pocos candidatos contra muchas apariciones: conviene revisar cada nombre
+                candidatos = {posicion for posicion in candidatos if self._contiene_prefijo(posicion, buscada)}
+            else:
+                candidatos.intersection_update(chain.from_iterable(apariciones))
+        return candidatos
+
+    def _grupos_por_relevancia(self, buscadas: list[str], candidatos: set[int]) -> Iterator[set[int]]:
+        # Los grupos se arman con operaciones de conjuntos y solo mientras falten resultados
+        completos = candidatos
+        for buscada in buscadas:
+            completos = completos.intersection(self.__apariciones__.get(buscada, ()))
+        empiezan = candidatos.intersection(chain.from_iterable(self._con_prefijo(buscadas[0], self.__primeras__)))
+        yield completos & empiezan
+        yield completos - empiezan
+        parciales = candidatos - completos
+        yield parciales & empiezan
+        yield parciales - empiezan
+
+    def _con_prefijo(self, prefijo: str, posiciones_por_palabra: dict[str, list[int]]) -> list[list[int]]:
+        inicio = bisect_left(self.__palabras__, prefijo)
+        fin = bisect_left(self.__palabras__, prefijo + FIN_PREFIJO, lo=inicio)
+        return [
+            posiciones_por_palabra[palabra] for palabra in self.__palabras__[inicio:fin]
+            if palabra in posiciones_por_palabra
+        ]
+
+    def _contiene_prefijo(self, posicion: int, prefijo: str) -> bool:
+        return any(palabra.startswith(prefijo) for palabra in self.__ordenes__[posicion][5:].split(" "))
+
+    def __len__(self) -> int:
+        with self.__bloqueo__:
+            self._preparar()
+            return len(self.__elementos__)
+
+
+class IndiceEspecialidades:
+    # (especialidad, día de la semana) -> matrículas de los médicos que la atienden ese día, en orden de alta.
+    # Igual que IndiceNombres, se construye en la primera consulta y después se actualiza con cada alta.
+
+    def __init__(self, origen: Callable[[], Iterable]):
+        self.__origen__: Callable[[], Iterable] = origen
+        self.__bloqueo__: threading.Lock = threading.Lock()
+        self.__construido__: bool = False
+        # Un dict como conjunto ordenado: un médico visto dos veces durante la construcción no se repite
+        self.__matriculas__: dict[tuple[str, int], dict[str, None]] = {}
+
+    def agregar_medico(self, medico: Medico) -> None:
+        with self.__bloqueo__:
+            if self.__construido__:
+                self._agregar_medico(medico)
+
+    def agregar_especialidad(self, matricula: str, especialidad: Especialidad) -> None:
+        with self.__bloqueo__:
+            if self.__construido__:
+                self._agregar_especialidad(matricula, especialidad)
+
+    def _agregar_medico(self, medico: Medico) -> None:
+        for especialidad in medico.obtener_especialidades():
+            self._agregar_especialidad(medico.obtener_matricula(), especialidad)
+
+    def _agregar_especialidad(self, matricula: str, especialidad: Especialidad) -> None:
+        for dia in range(len(DIAS_SEMANA_ES)):
+            if especialidad.atiende_dia_semana(dia):
+                self.__matriculas__.setdefault((especialidad.obtener_especialidad(), dia), {})[matricula] = None
+
+    def obtener_matriculas(self, especialidad: str, dia_semana: int) -> list[str]:
+        with self.__bloqueo__:
+            if not self.__construido__:
+                try:
+                    for medico in self.__origen__():
+                        self._agregar_medico(medico)
+                except BaseException:
+                    # Sin índice a medias: la próxima consulta lo vuelve a construir (y vuelve a informar el error)
+                    self.__matriculas__ = {}
+                    raise
+                self.__construido__ = True
+            return list(self.__matriculas__.get((especialidad, dia_semana), ()))
+
+    def dias_con_atencion(self, especialidad: str) -> list[int]:
+        return [dia for dia in range(len(DIAS_SEMANA_ES)) if self.obtener_matriculas(especialidad, dia)]
+
+
+@lru_cache(maxsize=4096)
+def normalizar_medicamento(texto: str) -> str:
+    # "Ibuprofeno  400 MG" -> "ibuprofeno 400 mg"
+    return " ".join(normalizar_palabras(texto))
+
+
+class IndiceMedicamentos:
+    # Medicamento normalizado -> recetas que lo incluyen, ordenadas por fecha de emisión. Cada medicamento
+    # distinto se guarda una sola vez como clave. Como los otros índices, se construye en la primera consulta
+    # y después se actualiza con cada receta emitida.
+
+    def __init__(self, origen: Callable[[], Iterable[Receta]]):
+        self.__origen__: Callable[[], Iterable[Receta]] = origen
+        self.__bloqueo__: threading.Lock = threading.Lock()
+        self.__construido__: bool = False
+        self.__recetas__: dict[str, list[Receta]] = {}
+        self.__medicamentos__: list[str] = []
+        self.__medicamentos_nuevos__: list[str] = []
+
+    def agregar(self, receta: Receta, guardar: Callable[[], None] | None = None) -> None:
+        # `guardar` escribe la receta en el origen bajo el lock del índice: una construcción concurrente la ve
+        # en el origen o la recibe acá, nunca las dos cosas (el origen puede devolver otro objeto, como en SQLite)
+        with self.__bloqueo__:
+            if guardar is not None:
+                guardar()
+            if not self.__construido__:
+                return
+            fecha = receta.obtener_fecha_emision()
+            for recetas in self._listas_de(receta):
+                if not recetas or recetas[-1].obtener_fecha_emision() < fecha:
+                    # Caso habitual: la receta es la más reciente
+                    recetas.append(receta)
+                    continue
+                posicion = bisect_left(recetas, fecha, key=Receta.obtener_fecha_emision)
+                # Se distingue por identidad: dos recetas iguales emitidas a la misma hora son dos recetas
+                misma_fecha = takewhile(lambda otra: otra.obtener_fecha_emision() == fecha, islice(recetas, posicion, None))
+                if not any(otra is receta for otra in misma_fecha):
+                    insort_right(recetas, receta, key=Receta.obtener_fecha_emision)
+
+    def _listas_de(self, receta: Receta) -> list[list[Receta]]:
+        listas = []
+        for medicamento in dict.fromkeys(map(normalizar_medicamento, receta.obtener_medicamentos())):
+            recetas = self.__recetas__.get(medicamento)
+            if recetas is None:
+                recetas = self.__recetas__[medicamento] = []
+                self.__medicamentos_nuevos__.append(medicamento)
+            listas.append(recetas)
+        return listas
+
+    def _preparar(self) -> None:
+        if not self.__construido__:
+            try:
+                for receta in self.__origen__():
+                    for recetas in self._listas_de(receta):
+                        recetas.append(receta)
+            except BaseException:
+                # Sin índice a medias: la próxima consulta lo vuelve a construir (y vuelve a informar el error)
+                self.__recetas__, self.__medicamentos_nuevos__ = {}, []
+                raise
+            # El origen recorre paciente por paciente: se ordena cada lista una sola vez al final
+            for recetas in self.__recetas__.values():
+                recetas.sort(key=Receta.obtener_fecha_emision)
+            self.__construido__ = True
+        if self.__medicamentos_nuevos__:
+            self.__medicamentos__ = sorted(self.__medicamentos__ + self.__medicamentos_nuevos__)
+            self.__medicamentos_nuevos__ = []
+
+    def buscar(self, medicamento: str, desde: datetime | None = None, hasta: datetime | None = None) -> list[Receta]:
+        # "ibuprofeno" encuentra "Ibuprofeno 400mg" e "IBUPROFENO 600 mg", pero no "Ibuprofenol": el texto
+        # buscado debe coincidir con el nombre completo o con sus primeras palabras. De la más reciente a la más antigua.
+        buscado = normalizar_medicamento(medicamento)
+        if not buscado:
+            return []
+        with self.__bloqueo__:
+            self._preparar()
+            inicio = bisect_left(self.__medicamentos__, buscado)
+            fin = bisect_left(self.__medicamentos__, buscado + FIN_PREFIJO, lo=inicio)
+            rangos = []
+            for clave in self.__medicamentos__[inicio:fin]:
+                if clave != buscado and not clave.startswith(buscado + " "):
+                    continue
+                recetas = self.__recetas__[clave]
+                desde_posicion = 0 if desde is None else bisect_left(recetas, desde, key=Receta.obtener_fecha_emision)
+                hasta_posicion = len(recetas) if hasta is None else bisect_right(
+                    recetas, hasta, lo=desde_posicion, key=Receta.obtener_fecha_emision
+                )
+                rangos.append(recetas[desde_posicion:hasta_posicion])
+        if len(rangos) == 1:
+            return rangos[0][::-1]
+        # Una receta con dos presentaciones del mismo medicamento aparece en dos listas: se cuenta una vez
+        return list(dict.fromkeys(heapq.merge(*(rango[::-1] for rango in rangos), key=Receta.obtener_fecha_emision, reverse=True)))
@@ -1,129 +1,605 @@
-
-from datetime import datetime
-from src.clinica_gestion.modelo.excepciones import PacienteDuplicadoException, PacienteNoEncontradoException, \
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from datetime import datetime, timedelta
+from src.clinica_gestion.modelo.excepciones import ClinicaException, PacienteDuplicadoException, PacienteNoEncontradoException, \
     MedicoDuplicadoException, MedicoNoEncontradoException, MedicoNoDisponibleException, \
-    EspecialidadNoValidaParaDiaException, TurnoOcupadoException, RecetaInvalidaException
+    EspecialidadNoValidaParaDiaException, TurnoOcupadoException, TurnoNoEncontradoException, RecetaInvalidaException, \
+    SerieTurnosNoDisponibleException
+from src.clinica_gestion.modelo.busqueda import LIMITE_RESULTADOS, IndiceEspecialidades, IndiceMedicamentos, IndiceNombres
+from src.clinica_gestion.modelo.concurrencia import BloqueosClinica
+from src.clinica_gestion.modelo.especialidad import Especialidad
+from src.clinica_gestion.modelo.fechas import DIAS_SEMANA_ES, HORA_FIN_ATENCION, HORA_INICIO_ATENCION, MINUTOS_TURNO, \
+    parse_fecha_hora
 from src.clinica_gestion.modelo.historia_clinica import HistoriaClinica
 from src.clinica_gestion.modelo.medico import Medico
+from src.clinica_gestion.modelo.metricas import MetricasClinica
+from src.clinica_gestion.modelo.nombres import ESPECIALIDADES
 from src.clinica_gestion.modelo.paciente import Paciente
 from src.clinica_gestion.modelo.receta import Receta
+from src.clinica_gestion.modelo.repositorio import RepositorioClinica, RepositorioEnMemoria
 from src.clinica_gestion.modelo.turno import Turno
 
 
 class Clinica:
-    DIAS_SEMANA_ES = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+    DIAS_SEMANA_ES = list(DIAS_SEMANA_ES)
+    # Hasta cuántos días hacia adelante se buscan turnos libres
+    DIAS_BUSQUEDA_TURNO_LIBRE = 365
+    # Máximo de turnos de una serie (dos años de turnos semanales)
+    MAX_TURNOS_SERIE = 104
+    # Duración máxima de un turno: con un día como máximo, los turnos de una serie nunca se superponen entre sí
+    MAX_MINUTOS_TURNO = 24 * 60
+    # Métodos públicos que se miden cuando las métricas están habilitadas
+    METODOS_MEDIDOS = (
+        "agregar_paciente", "obtener_pacientes", "obtener_paciente_por_matricula", "buscar_pacientes",
+        "agregar_medico", "agregar_especialidad", "obtener_medicos", "obtener_medico_por_matricula", "buscar_medicos",
+        "obtener_historia_clinica", "emitir_receta", "buscar_recetas_por_medicamento", "obtener_pacientes_con_medicamento",
+        "obtener_turnos", "obtener_turnos_medico_entre", "obtener_proximo_turno_medico",
+        "buscar_proximo_turno_libre", "agendar_turno", "agendar_turnos_lote", "agendar_serie_turnos",
+        "restaurar_turno",
+        "obtener_turno", "cancelar_turno", "reprogramar_turno",
+    )
+
+    def __init__(self, repositorio: RepositorioClinica | None = None, concurrente: bool = False, metricas: bool = False):
+        # Pacientes, médicos, turnos e historias clínicas se guardan en el repositorio (en memoria por defecto)
+        self.__repositorio__: RepositorioClinica = repositorio if repositorio is not None else RepositorioEnMemoria()
+        # Journal opcional donde se registra cada modificación antes de aplicarla (ver persistencia/journal.py)
+        self.__journal__ = None
+        # Locks por médico y por paciente, solo si la clínica se comparte entre hilos (ver concurrencia.py)
+        self.__bloqueos__: BloqueosClinica | None = BloqueosClinica() if concurrente else None
+        # Contadores y latencias por método, solo si se piden (ver metricas.py)
+        self.__metricas__: MetricasClinica | None = None
+        # Índices de búsqueda por nombre: se construyen desde el repositorio en la primera búsqueda (ver busqueda.py)
+        self.__indice_pacientes__: IndiceNombres = IndiceNombres(
+            self.__repositorio__.iterar_pacientes, Paciente.obtener_nombre, Paciente.obtener_dni
+        )
+        self.__indice_medicos__: IndiceNombres = IndiceNombres(
+            self.__repositorio__.iterar_medicos, Medico.obtener_nombre, Medico.obtener_matricula
+        )
+        self.__indice_especialidades__: IndiceEspecialidades = IndiceEspecialidades(self.__repositorio__.iterar_medicos)
+        self.__indice_medicamentos__: IndiceMedicamentos = IndiceMedicamentos(self.__repositorio__.iterar_recetas)
+        # Último ID de turno asignado: los IDs no se reutilizan aunque el turno se cancele
+        self.__ultimo_id_turno__: int = self.__repositorio__.obtener_ultimo_id_turno()
+        if metricas:
+            self.habilitar_metricas()
+
+
+    # Persistencia
+    def conectar_journal(self, journal) -> None:
+        self.__journal__ = journal
+
+    def transaccion(self) -> AbstractContextManager:
+        # Agrupa varias operaciones en una sola escritura del repositorio (por ejemplo, en importaciones masivas).
+        # En modo concurrente cada escritura se confirma sola: una transacción abierta retendría el repositorio
+        # mientras se esperan los locks de médicos y pacientes, invirtiendo el orden de adquisición.
+        if self.__bloqueos__ is not None:
+            return nullcontext()
+        return self.__repositorio__.transaccion()
+
+    @contextmanager
+    def _escritura(self) -> Iterator[object | None]:
+        # Registra en el journal y aplica el cambio sin que otro hilo se intercale entre ambos pasos,
+        # así un snapshot nunca omite un evento ya registrado pero todavía no aplicado
+        journal = self.__journal__
+        if journal is None:
+            yield None
+        else:
+            with journal.obtener_bloqueo():
+                yield journal
+
+
+    # Concurrencia
+    def es_concurrente(self) -> bool:
+        return self.__bloqueos__ is not None
+
+    def _bloqueo_medico(self, matricula_medico: str) -> AbstractContextManager:
+        if self.__bloqueos__ is None:
+            return nullcontext()
+        return self.__bloqueos__.medico(matricula_medico)
+
+    def _bloqueo_paciente(self, dni_paciente: str) -> AbstractContextManager:
+        if self.__bloqueos__ is None:
+            return nullcontext()
+        return self.__bloqueos__.paciente(dni_paciente)
+
+    def _bloqueo_ids_turnos(self) -> AbstractContextManager:
+        if self.__bloqueos__ is None:
+            return nullcontext()
+        return self.__bloqueos__.ids_turnos()
+
+
+    # Métricas
+    def habilitar_metricas(self) -> None:
+        # Los métodos medidos se reemplazan en esta instancia por versiones que registran cada llamada;
+        # sin métricas se llama directo a los de la clase, sin ningún costo adicional
+        if self.__metricas__ is not None:
+            return
+        self.__metricas__ = MetricasClinica()
+        for nombre in self.METODOS_MEDIDOS:
+            setattr(self, nombre, self.__metricas__.instrumentar(nombre, getattr(self, nombre)))
+
+    def deshabilitar_metricas(self) -> None:
+        if self.__metricas__ is None:
+            return
+        for nombre in self.METODOS_MEDIDOS:
+            delattr(self, nombre)
+        self.__metricas__ = None
+
+    def metricas(self) -> dict[str, dict]:
+        # Llamadas, errores por tipo y latencias por método; vacío si las métricas no están habilitadas
+        if self.__metricas__ is None:
+            return {}
+        return self.__metricas__.instantanea()
 
-    def __init__(self):
-        self.__pacientes__: dict[str, Paciente] = {}
-        self.__medicos__: dict[str, Medico] = {}
-        self.__turnos__: list[Turno] = []
-        self.__historias_clinicas__: dict[str, HistoriaClinica] = {}
+    def obtener_metricas(self) -> MetricasClinica | None:
+        return self.__metricas__
 
 
     # Paciente
     def agregar_paciente(self, paciente: Paciente) -> None:
         dni_paciente = paciente.obtener_dni()
-        if dni_paciente in self.__pacientes__:
-            raise PacienteDuplicadoException(f"El paciente con DNI {dni_paciente} ya existe.")
-        self.__pacientes__[dni_paciente] = paciente
-        self.__historias_clinicas__[dni_paciente] = HistoriaClinica(paciente)
+        with self._bloqueo_paciente(dni_paciente):
+            if self.__repositorio__.obtener_paciente(dni_paciente) is not None:
+                raise PacienteDuplicadoException(f"El paciente con DNI {dni_paciente} ya existe.")
+            with self._escritura() as journal:
+                if journal is not None:
+                    journal.registrar_paciente(paciente)
+                self.__repositorio__.agregar_paciente(paciente)
+            self.__indice_pacientes__.agregar(paciente)
 
     def obtener_pacientes(self) -> list[Paciente]:
-        return list(self.__pacientes__.values())
+        return self.__repositorio__.obtener_pacientes()
+
+    def iterar_pacientes(self, desde: int = 0, cantidad: int | None = None, nombre: str | None = None) -> Iterator[Paciente]:
+        # Recorre una página de pacientes sin copiar la lista completa (ver RepositorioClinica.iterar_pacientes)
+        return self.__repositorio__.iterar_pacientes(desde, cantidad, nombre)
 
     def obtener_paciente_por_matricula(self, dni: str) -> Paciente:
-        if dni in self.__pacientes__:
-            return self.__pacientes__[dni]
+        paciente = self.__repositorio__.obtener_paciente(dni)
+        if paciente is not None:
+            return paciente
         else:
             raise PacienteNoEncontradoException(f"No se encontró el paciente con DNI {dni}.")
 
+    def buscar_pacientes(self, texto: str, limite: int = LIMITE_RESULTADOS) -> list[Paciente]:
+        # Por partes del nombre, sin distinguir acentos ni mayúsculas; los mejores resultados primero
+        return self.__indice_pacientes__.buscar(texto, limite)
+
 
     # Medico
     def agregar_medico(self, medico: Medico) -> None:
         matricula_medico = medico.obtener_matricula()
-        if matricula_medico in self.__medicos__:
-            raise MedicoDuplicadoException(f"El médico con matrícula {matricula_medico} ya existe.")
-
-        self.__medicos__[matricula_medico] = medico
+        with self._bloqueo_medico(matricula_medico):
+            if self.__repositorio__.obtener_medico(matricula_medico) is not None:
+                raise MedicoDuplicadoException(f"El médico con matrícula {matricula_medico} ya existe.")
+            with self._escritura() as journal:
+                if journal is not None:
+                    journal.registrar_medico(medico)
+                self.__repositorio__.agregar_medico(medico)
+            self.__indice_medicos__.agregar(medico)
+            self.__indice_especialidades__.agregar_medico(medico)
+
+    def agregar_especialidad(self, matricula_medico: str, especialidad: Especialidad) -> None:
+        with self._bloqueo_medico(matricula_medico):
+            medico = self.obtener_medico_por_matricula(matricula_medico) # Lanza MedicoNoEncontradoException
+            with self._escritura() as journal:
+                if journal is not None:
+                    journal.registrar_especialidad(matricula_medico, especialidad)
+                self.__repositorio__.agregar_especialidad(medico, especialidad)
+            self.__indice_especialidades__.agregar_especialidad(matricula_medico, especialidad)
 
     def obtener_medicos(self) -> list[Medico]:
-        return list(self.__medicos__.values())
+        return self.__repositorio__.obtener_medicos()
+
+    def iterar_medicos(self, desde: int = 0, cantidad: int | None = None, especialidad: str | None = None) -> Iterator[Medico]:
+        return self.__repositorio__.iterar_medicos(desde, cantidad, especialidad)
 
     def obtener_medico_por_matricula(self, matricula: str) -> Medico:
-        if matricula in self.__medicos__:
-            return self.__medicos__[matricula]
+        medico = self.__repositorio__.obtener_medico(matricula)
+        if medico is not None:
+            return medico
         else:
             raise MedicoNoEncontradoException(f"No se encontró el médico con matrícula {matricula}.")
 
+    def buscar_medicos(self, texto: str, limite: int = LIMITE_RESULTADOS) -> list[Medico]:
+        return self.__indice_medicos__.buscar(texto, limite)
+
 
     # Historia clinica
     def obtener_historia_clinica(self, dni_paciente: str) -> HistoriaClinica:
         self.obtener_paciente_por_matricula(dni_paciente)
-        return self.__historias_clinicas__[dni_paciente]
+        return self.__repositorio__.obtener_historia_clinica(dni_paciente)
 
 
     # Receta
-    def emitir_receta(self, dni_paciente: str, matricula_medico: str, medicamentos: list[str] ) -> Receta:
+    def emitir_receta(self, dni_paciente: str, matricula_medico: str, medicamentos: list[str], fecha: datetime | None = None) -> Receta:
+        # Se valida antes de registrar nada: una receta inválida no debe llegar al journal, al repositorio ni al índice
+        self._validar_medicamentos(medicamentos)
         paciente = self.obtener_paciente_por_matricula(dni_paciente)
         medico = self.obtener_medico_por_matricula(matricula_medico)
 
-        nueva_receta = Receta(paciente, medico, medicamentos)
-
-        historia_paciente = self.obtener_historia_clinica(dni_paciente)
-        historia_paciente.agregar_receta(nueva_receta)
+        nueva_receta = Receta(paciente, medico, medicamentos, fecha if fecha is not None else datetime.now())
+        with self._bloqueo_paciente(dni_paciente), self._escritura() as journal:
+            if journal is not None:
+                journal.registrar_receta(nueva_receta)
+            self.__indice_medicamentos__.agregar(nueva_receta, lambda: self.__repositorio__.agregar_receta(nueva_receta))
 
         return nueva_receta
 
+    def buscar_recetas_por_medicamento(self, medicamento: str, desde: datetime | None = None,
+                                       hasta: datetime | None = None) -> list[Receta]:
+        # Recetas con ese medicamento (en cualquier presentación: "ibuprofeno" incluye "Ibuprofeno 400mg")
+        # emitidas entre `desde` y `hasta`, de la más reciente a la más antigua
+        return self.__indice_medicamentos__.buscar(medicamento, desde, hasta)
+
+    def obtener_pacientes_con_medicamento(self, medicamento: str, desde: datetime | None = None,
+                                          hasta: datetime | None = None) -> list[Paciente]:
+        # Cada paciente una vez, ordenados por su receta más reciente con ese medicamento
+        pacientes: dict[str, Paciente] = {}
+        for receta in self.buscar_recetas_por_medicamento(medicamento, desde, hasta):
+            pacientes.setdefault(receta.obtener_paciente().obtener_dni(), receta.obtener_paciente())
+        return list(pacientes.values())
+
 
     # Turno
     def obtener_turnos(self) -> list[Turno]:
-        return list(self.__turnos__)
+        return self.__repositorio__.obtener_turnos()
+
+    def iterar_turnos(self, desde: int = 0, cantidad: int | None = None, matricula_medico: str | None = None,
+                      dni_paciente: str | None = None, especialidad: str | None = None,
+                      fecha_desde: datetime | None = None, fecha_hasta: datetime | None = None) -> Iterator[Turno]:
+        return self.__repositorio__.iterar_turnos(desde, cantidad, matricula_medico, dni_paciente, especialidad,
+                                                  fecha_desde, fecha_hasta)
+
+    def obtener_turno(self, id_turno: int) -> Turno:
+        turno = self.__repositorio__.obtener_turno(id_turno)
+        if turno is not None:
+            return turno
+        else:
+            raise TurnoNoEncontradoException(f"No se encontró el turno con ID {id_turno}.")
+
+    def obtener_ultimo_id_turno(self) -> int:
+        return self.__ultimo_id_turno__
+
+    def reservar_ids_turno(self, ultimo_id: int) -> None:
+        # Los IDs hasta `ultimo_id` quedan usados (al reconstruir la clínica, también los de turnos ya cancelados)
+        self._reservar_id_turno(ultimo_id)
+
+    def obtener_turnos_medico_entre(self, matricula_medico: str, desde: datetime, hasta: datetime) -> list[Turno]:
+        self.obtener_medico_por_matricula(matricula_medico) # Lanza MedicoNoEncontradoException
+        return self.__repositorio__.obtener_turnos_medico_entre(matricula_medico, desde, hasta)
+
+    def obtener_proximo_turno_medico(self, matricula_medico: str, desde: datetime | None = None) -> Turno | None:
+        self.obtener_medico_por_matricula(matricula_medico) # Lanza MedicoNoEncontradoException
+        if desde is None:
+            desde = datetime.now()
+        return self.__repositorio__.obtener_proximo_turno_medico(matricula_medico, desde)
+
+    def buscar_proximo_turno_libre(self, especialidad: str, desde: datetime | None = None, minutos_turno: int = MINUTOS_TURNO,
+                                   cantidad: int = 1) -> list[tuple[datetime, Medico]]:
+        # Los primeros `cantidad` horarios libres para la especialidad entre todos los médicos que la atienden,
+        # ordenados por fecha (y por orden de alta del médico si coinciden). Los horarios salen de una grilla de
+        # `minutos_turno` dentro del horario de atención, y un horario está ocupado si se superpone con algún
+        # turno del médico. Solo se consultan los días en que algún médico atiende la especialidad.
+        if minutos_turno <= 0 or cantidad <= 0:
+            raise ValueError("La duración del turno y la cantidad de horarios deben ser mayores que cero.")
+        ahora = datetime.now()
+        desde = ahora if desde is None else max(desde, ahora)
+        duracion = timedelta(minutes=minutos_turno)
+        if not self.__indice_especialidades__.dias_con_atencion(especialidad):
+            return []
+
+        libres: list[tuple[datetime, Medico]] = []
+        dia = desde.replace(hour=0, minute=0, second=0, microsecond=0)
+        for _ in range(self.DIAS_BUSQUEDA_TURNO_LIBRE):
+            matriculas = self.__indice_especialidades__.obtener_matriculas(especialidad, dia.weekday())
+            if matriculas:
+                horarios = self._horarios_del_dia(dia, desde, duracion)
+                libres_del_dia = []
+                for orden, matricula in enumerate(matriculas):
+                    for horario in self._horarios_libres_medico(matricula, horarios, duracion):
+                        libres_del_dia.append((horario, orden, matricula))
+                # Los días se recorren en orden: alcanza con ordenar los horarios de este día
+                for horario, _, matricula in sorted(libres_del_dia)[:cantidad - len(libres)]:
+                    libres.append((horario, self.obtener_medico_por_matricula(matricula)))
+                if len(libres) == cantidad:
+                    break
+            dia += timedelta(days=1)
+        return libres
+
+    def _horarios_del_dia(self, dia: datetime, desde: datetime, duracion: timedelta) -> list[datetime]:
+        horario = dia.replace(hour=HORA_INICIO_ATENCION)
+        fin = dia.replace(hour=HORA_FIN_ATENCION)
+        if desde > horario:
+            # Primer horario de la grilla que no empezó todavía
+            horario += -((horario - desde) // duracion) * duracion
+        horarios = []
+        while horario + duracion <= fin:
+            horarios.append(horario)
+            horario += duracion
+        return horarios
+
+    def _horarios_libres_medico(self, matricula: str, horarios: list[datetime], duracion: timedelta) -> Iterator[datetime]:
+        if not horarios:
+            return
+        # Los turnos vienen ordenados y se recorren junto con la grilla: un horario está libre si todos los turnos
+        # que empiezan antes de que termine ya terminaron cuando empieza
+        turnos = iter(self._turnos_superpuestos_entre(matricula, horarios[0], horarios[-1] + duracion))
+        proximo_turno = next(turnos, None)
+        ocupado_hasta = horarios[0]
+        for horario in horarios:
+            while proximo_turno is not None and proximo_turno.obtener_fecha_hora() < horario + duracion:
+                ocupado_hasta = max(ocupado_hasta, proximo_turno.obtener_fecha_hora_fin())
+                proximo_turno = next(turnos, None)
+            if ocupado_hasta <= horario:
+                yield horario
+
+    def _turnos_superpuestos_entre(self, matricula: str, desde: datetime, hasta: datetime) -> list[Turno]:
+        # Turnos del médico que ocupan parte de [desde, hasta), ordenados por inicio: el que empezó antes y sigue
+        # en curso en `desde`, si lo hay, y los que empiezan dentro del rango. Son dos consultas en total.
+        turnos = self.__repositorio__.obtener_turnos_medico_entre(matricula, desde, hasta - timedelta(microseconds=1))
+        en_curso = self.__repositorio__.obtener_turno_superpuesto(matricula, desde, desde)
+        if en_curso is not None:
+            turnos.insert(0, en_curso)
+        return turnos
+
+    def agendar_turno(self, dni_paciente: str, matricula_medico: str, fecha_hora_str: str, nombre_especialidad_deseada: str,
+                      minutos: int = MINUTOS_TURNO) -> Turno:
+        self._validar_minutos_turno(minutos)
+        paciente = self.obtener_paciente_por_matricula(dni_paciente) # Lanza PacienteNoEncontradoException
+        medico = self.obtener_medico_por_matricula(matricula_medico) # Lanza MedicoNoEncontradoException
 
-    def agendar_turno(self, dni_paciente: str, matricula_medico: str, fecha_hora_str: str, nombre_especialidad_deseada: str) -> Turno:
+        fecha_hora_dt = self._validar_fecha_hora_turno(self._parse_fecha_hora(fecha_hora_str), datetime.now())
+
+        # La verificación del horario y el alta se hacen bajo el lock del médico para no dar dos veces el mismo turno
+        with self._bloqueo_medico(matricula_medico):
+            self._validar_especialidad_en_dia(medico, nombre_especialidad_deseada, fecha_hora_dt)
+            self._validar_turno_no_superpuesto(medico, fecha_hora_dt, minutos)
+
+            return self._registrar_turno(paciente, medico, fecha_hora_dt, nombre_especialidad_deseada, minutos=minutos)
+
+    def agendar_turnos_lote(self, solicitudes: Iterable[tuple[str, str, str, str]]) -> list[Turno | Exception]:
+        # Cada solicitud es (dni_paciente, matricula_medico, fecha_hora_str, nombre_especialidad), como en agendar_turno
+        # con la duración estándar.
+        # Devuelve, en el mismo orden, el turno agendado o la excepción que habría lanzado agendar_turno.
+        solicitudes = list(solicitudes)
+        resultados: list[Turno | Exception | None] = [None] * len(solicitudes)
+        ahora = datetime.now()
+        fechas_parseadas: dict[str, datetime | None] = {}
+
+        indices_por_medico: dict[str, list[int]] = {}
+        for indice, (_, matricula_medico, _, _) in enumerate(solicitudes):
+            indices_por_medico.setdefault(matricula_medico, []).append(indice)
+
+        with self.transaccion():
+            for matricula_medico, indices in indices_por_medico.items():
+                with self._bloqueo_medico(matricula_medico):
+                    self._agendar_turnos_lote_medico(
+                        matricula_medico, indices, solicitudes, resultados, ahora, fechas_parseadas
+                    )
+
+        return resultados
+
+    def _agendar_turnos_lote_medico(self, matricula_medico: str, indices: list[int], solicitudes: list[tuple[str, str, str, str]],
+                                    resultados: list[Turno | Exception | None], ahora: datetime,
+                                    fechas_parseadas: dict[str, datetime | None]) -> None:
+        medico = self.__repositorio__.obtener_medico(matricula_medico)
+
+        for indice in indices:
+            dni_paciente, _, fecha_hora_str, nombre_especialidad = solicitudes[indice]
+            try:
+                paciente = self.obtener_paciente_por_matricula(dni_paciente)
+                if medico is None:
+                    self.obtener_medico_por_matricula(matricula_medico)
+
+                if fecha_hora_str not in fechas_parseadas:
+                    fechas_parseadas[fecha_hora_str] = self._parse_fecha_hora(fecha_hora_str)
+                fecha_hora_dt = self._validar_fecha_hora_turno(fechas_parseadas[fecha_hora_str], ahora)
+
+                self._validar_especialidad_en_dia(medico, nombre_especialidad, fecha_hora_dt)
+                # La agenda del médico se actualiza con cada alta, así que también detecta conflictos dentro del lote
+                self._validar_turno_no_superpuesto(medico, fecha_hora_dt, MINUTOS_TURNO)
+
+                resultados[indice] = self._registrar_turno(paciente, medico, fecha_hora_dt, nombre_especialidad)
+            except (ClinicaException, ValueError) as e:
+                resultados[indice] = e
+
+    def agendar_serie_turnos(self, dni_paciente: str, matricula_medico: str, fecha_hora_str: str,
+                             nombre_especialidad_deseada: str, cantidad: int, dias_entre_turnos: int = 7,
+                             minutos: int = MINUTOS_TURNO) -> list[Turno]:
+        # Agenda `cantidad` turnos con el mismo médico y especialidad, el primero en `fecha_hora_str` y cada uno
+        # `dias_entre_turnos` días después del anterior (por defecto, semanales). Se agendan todos o ninguno: si alguna
+        # fecha no está disponible se lanza SerieTurnosNoDisponibleException con cada fecha que falló y su motivo.
+        if not 0 < cantidad <= self.MAX_TURNOS_SERIE:
+            raise ValueError(f"La cantidad de turnos de la serie debe estar entre 1 y {self.MAX_TURNOS_SERIE}.")
+        if dias_entre_turnos <= 0:
+            raise ValueError("Los días entre turnos deben ser mayores que cero.")
+        self._validar_minutos_turno(minutos)
         paciente = self.obtener_paciente_por_matricula(dni_paciente) # Lanza PacienteNoEncontradoException
         medico = self.obtener_medico_por_matricula(matricula_medico) # Lanza MedicoNoEncontradoException
 
-        fecha_hora_dt = self._parse_fecha_hora(fecha_hora_str)
-        if not fecha_hora_dt:
+        primera = self._validar_fecha_hora_turno(self._parse_fecha_hora(fecha_hora_str), datetime.now())
+        fechas = [primera + timedelta(days=dias_entre_turnos * numero) for numero in range(cantidad)]
+
+        with self._bloqueo_medico(matricula_medico):
+            conflictos = self._conflictos_serie(medico, nombre_especialidad_deseada, fechas, minutos)
+            if conflictos:
+                detalle = "; ".join(f"{fecha.strftime('%Y-%m-%d %H:%M')}: {error}" for fecha, error in conflictos)
+                raise SerieTurnosNoDisponibleException(
+                    f"No se agendó ningún turno de la serie: {len(conflictos)} de {cantidad} fechas no están disponibles. {detalle}",
+                    conflictos,
+                )
+            return self._registrar_serie_turnos(paciente, medico, fechas, nombre_especialidad_deseada, minutos)
+
+    def _conflictos_serie(self, medico: Medico, especialidad: str, fechas: list[datetime],
+                          minutos: int) -> list[tuple[datetime, ClinicaException]]:
+        # Una sola pasada: la especialidad se valida una vez por día de la semana y los turnos existentes
+        # se leen de una vez entre la primera y la última fecha; cada fecha se busca en ellos por bisección
+        duracion = timedelta(minutes=minutos)
+        existentes = self._turnos_superpuestos_entre(medico.obtener_matricula(), fechas[0], fechas[-1] + duracion)
+        inicios = [turno.obtener_fecha_hora() for turno in existentes]
+        errores_por_dia: dict[int, ClinicaException | None] = {}
+        conflictos = []
+        for fecha in fechas:
+            dia = fecha.weekday()
+            if dia not in errores_por_dia:
+                try:
+                    self._validar_especialidad_en_dia(medico, especialidad, fecha)
+                    errores_por_dia[dia] = None
+                except ClinicaException as e:
+                    errores_por_dia[dia] = e
+            if errores_por_dia[dia] is not None:
+                conflictos.append((fecha, errores_por_dia[dia]))
+            else:
+                # Como en la agenda, solo el último turno que empieza antes del final puede superponerse
+                posicion = bisect_left(inicios, fecha + duracion)
+                if posicion and existentes[posicion - 1].obtener_fecha_hora_fin() > fecha:
+                    conflictos.append((fecha, self._turno_ocupado(medico, existentes[posicion - 1])))
+        return conflictos
+
+    def _registrar_serie_turnos(self, paciente: Paciente, medico: Medico, fechas: list[datetime], nombre_especialidad: str,
+                                minutos: int) -> list[Turno]:
+        # Se llama con el lock del médico tomado. La serie se registra en el journal como un solo evento y se guarda
+        # en una sola transacción, así una caída no deja la serie a medias.
+        with self._bloqueo_paciente(paciente.obtener_dni()), self._escritura() as journal:
+            turnos = [Turno(paciente, medico, fecha, nombre_especialidad, self._reservar_id_turno(), minutos) for fecha in fechas]
+            if journal is not None:
+                journal.registrar_serie_turnos(turnos)
+            with self.__repositorio__.transaccion():
+                for turno in turnos:
+                    self.__repositorio__.agregar_turno(turno)
+        return turnos
+
+    def restaurar_turno(self, dni_paciente: str, matricula_medico: str, fecha_hora: datetime, nombre_especialidad: str,
+                        id_turno: int | None = None, minutos: int = MINUTOS_TURNO) -> Turno:
+        # Registra un turno ya validado al agendarse (por ejemplo, al reconstruir la clínica desde disco),
+        # por lo que no aplica las reglas de agenda: el turno puede estar en el pasado. Conserva su ID si lo tenía.
+        # Solo se rechaza otro turno del médico a la misma hora: los agendados antes de que los turnos tuvieran
+        # duración pueden superponerse y se cargan igual.
+        paciente = self.obtener_paciente_por_matricula(dni_paciente)
+        medico = self.obtener_medico_por_matricula(matricula_medico)
+        if id_turno is not None and self.__repositorio__.obtener_turno(id_turno) is not None:
+            raise ValueError(f"Ya existe un turno con ID {id_turno}.")
+        with self._bloqueo_medico(matricula_medico):
+            if self.__repositorio__.obtener_turnos_medico_entre(matricula_medico, fecha_hora, fecha_hora):
+                raise TurnoOcupadoException(
+                    f"El médico {medico.obtener_nombre()} ya tiene un turno agendado para {fecha_hora.strftime('%Y-%m-%d %H:%M')}."
+                )
+            return self._registrar_turno(paciente, medico, fecha_hora, nombre_especialidad, id_turno, minutos)
+
+    def _registrar_turno(self, paciente: Paciente, medico: Medico, fecha_hora: datetime, nombre_especialidad: str,
+                         id_turno: int | None = None, minutos: int = MINUTOS_TURNO) -> Turno:
+        # Se llama con el lock del médico tomado; el del paciente protege su historia clínica
+        with self._bloqueo_paciente(paciente.obtener_dni()), self._escritura() as journal:
+            nuevo_turno = Turno(paciente, medico, fecha_hora, nombre_especialidad, self._reservar_id_turno(id_turno), minutos)
+            if journal is not None:
+                journal.registrar_turno(nuevo_turno)
+            self.__repositorio__.agregar_turno(nuevo_turno)
+        return nuevo_turno
+
+    def _reservar_id_turno(self, id_turno: int | None = None) -> int:
+        # Sin ID se usa el siguiente; un ID dado (de un turno restaurado) adelanta el contador si hace falta
+        with self._bloqueo_ids_turnos():
+            if id_turno is None:
+                id_turno = self.__ultimo_id_turno__ + 1
+            self.__ultimo_id_turno__ = max(self.__ultimo_id_turno__, id_turno)
+            return id_turno
+
+    def cancelar_turno(self, id_turno: int) -> Turno:
+        # Quita el turno de la agenda del médico y de la historia clínica del paciente; devuelve el turno cancelado
+        matricula_medico = self.obtener_turno(id_turno).obtener_medico().obtener_matricula() # Lanza TurnoNoEncontradoException
+        with self._bloqueo_medico(matricula_medico):
+            # Otro hilo pudo cancelarlo o reprogramarlo mientras se esperaba el lock
+            turno = self.obtener_turno(id_turno)
+            with self._bloqueo_paciente(turno.obtener_paciente().obtener_dni()), self._escritura() as journal:
+                if journal is not None:
+                    journal.registrar_cancelacion_turno(turno)
+                self.__repositorio__.quitar_turno(turno)
+        return turno
+
+    def reprogramar_turno(self, id_turno: int, fecha_hora_str: str) -> Turno:
+        # Mueve el turno a otra fecha y hora con el mismo médico, paciente y especialidad, con las mismas reglas
+        # que al agendarlo. El turno conserva su ID y su duración; se devuelve el turno con la nueva fecha.
+        matricula_medico = self.obtener_turno(id_turno).obtener_medico().obtener_matricula() # Lanza TurnoNoEncontradoException
+        fecha_hora_dt = self._validar_fecha_hora_turno(self._parse_fecha_hora(fecha_hora_str), datetime.now())
+
+        with self._bloqueo_medico(matricula_medico):
+            anterior = self.obtener_turno(id_turno)
+            if anterior.obtener_fecha_hora() == fecha_hora_dt:
+                return anterior
+            medico = anterior.obtener_medico()
+            self._validar_especialidad_en_dia(medico, anterior.obtener_especialidad_atendida(), fecha_hora_dt)
+            self._validar_turno_no_superpuesto(medico, fecha_hora_dt, anterior.obtener_minutos(), anterior)
+
+            paciente = anterior.obtener_paciente()
+            nuevo_turno = Turno(
+                paciente, medico, fecha_hora_dt, anterior.obtener_especialidad_atendida(), id_turno, anterior.obtener_minutos()
+            )
+            with self._bloqueo_paciente(paciente.obtener_dni()), self._escritura() as journal:
+                if journal is not None:
+                    journal.registrar_reprogramacion_turno(nuevo_turno)
+                self.__repositorio__.reemplazar_turno(anterior, nuevo_turno)
+        return nuevo_turno
+
+
+    # Validaciones
+    def _validar_fecha_hora_turno(self, fecha_hora: datetime | None, ahora: datetime) -> datetime:
+        if not fecha_hora:
             raise ValueError("Formato de fecha y hora inválido. Use YYYY-MM-DD HH:MM.")
 
-        if fecha_hora_dt < datetime.now():
+        if fecha_hora < ahora:
             raise ValueError("No se pueden agendar turnos en el pasado.")
 
-        dia_semana = self._obtener_dia_semana_en_espanol(fecha_hora_dt)
-
-        especialidad_medico_ese_dia = medico.obtener_especialidades_para_dia(dia_semana)
+        return fecha_hora
 
-        if not especialidad_medico_ese_dia:
+    def _validar_especialidad_en_dia(self, medico: Medico, especialidad_solicitada: str, fecha_hora: datetime) -> None:
+        especialidades_del_dia = medico.obtener_especialidades_para_dia_semana(fecha_hora.weekday())
+        if not especialidades_del_dia:
+            dia_semana = self._obtener_dia_semana_en_espanol(fecha_hora)
             raise MedicoNoDisponibleException(f"El médico {medico.obtener_nombre()} no atiende ningún día {dia_semana}.")
 
-
-        if nombre_especialidad_deseada not in especialidad_medico_ese_dia:
+        # Los nombres de especialidad de los médicos son las instancias del registro: basta comparar identidades,
+        # y un nombre que no está registrado no lo atiende ningún médico
+        canonica = ESPECIALIDADES.buscar(especialidad_solicitada)
+        if not any(especialidad is canonica for especialidad in especialidades_del_dia):
+            dia_semana = self._obtener_dia_semana_en_espanol(fecha_hora)
             raise EspecialidadNoValidaParaDiaException(
-                f"El médico {medico.obtener_nombre()} no atiende la especialidad '{nombre_especialidad_deseada}' los días {dia_semana}."
+                f"El médico {medico.obtener_nombre()} no atiende la especialidad '{especialidad_solicitada}' los días {dia_semana}."
             )
 
-        for turno_existente in self.__turnos__:
-            if turno_existente.obtener_medico() == medico and turno_existente.obtener_fecha_hora() == fecha_hora_dt:
-                raise TurnoOcupadoException(
-                    f"El médico {medico.obtener_nombre()} ya tiene un turno agendado para {fecha_hora_dt.strftime('%Y-%m-%d %H:%M')}."
-                )
-
-        nuevo_turno = Turno(paciente, medico, fecha_hora_dt, nombre_especialidad_deseada)
-        self.__turnos__.append(nuevo_turno)
-
-        historia_paciente = self.obtener_historia_clinica(dni_paciente)
-        historia_paciente.agregar_turno(nuevo_turno)
-
-        return nuevo_turno
+    def _validar_medicamentos(self, medicamentos: list[str]) -> None:
+        if isinstance(medicamentos, str) or not medicamentos:
+            raise RecetaInvalidaException("La receta debe tener una lista con al menos un medicamento.")
+        for medicamento in medicamentos:
+            if not isinstance(medicamento, str) or not medicamento.strip():
+                raise RecetaInvalidaException(f"Medicamento inválido en la receta: {medicamento!r}.")
+
+    def _validar_minutos_turno(self, minutos: int) -> None:
+        if not 0 < minutos <= self.MAX_MINUTOS_TURNO:
+            raise ValueError(f"La duración del turno debe estar entre 1 y {self.MAX_MINUTOS_TURNO} minutos.")
+
+    def _validar_turno_no_superpuesto(self, medico: Medico, fecha_hora: datetime, minutos: int,
+                                      reprogramado: Turno | None = None) -> None:
+        # Un turno que se reprograma no choca consigo mismo. Si él es el último que empieza antes del nuevo final,
+        # ningún otro empieza entre su inicio y ese final, y basta buscar entre los que empiezan antes que él.
+        matricula = medico.obtener_matricula()
+        fin = fecha_hora + timedelta(minutes=minutos)
+        superpuesto = self.__repositorio__.obtener_turno_superpuesto(matricula, fecha_hora, fin)
+        if superpuesto is not None and reprogramado is not None and superpuesto.obtener_id() == reprogramado.obtener_id():
+            superpuesto = self.__repositorio__.obtener_turno_superpuesto(matricula, fecha_hora, reprogramado.obtener_fecha_hora())
+        if superpuesto is not None:
+            raise self._turno_ocupado(medico, superpuesto)
+
+    def _turno_ocupado(self, medico: Medico, ocupado: Turno) -> TurnoOcupadoException:
+        return TurnoOcupadoException(
+            f"El médico {medico.obtener_nombre()} ya tiene un turno agendado de "
+            f"{ocupado.obtener_fecha_hora().strftime('%Y-%m-%d %H:%M')} a {ocupado.obtener_fecha_hora_fin().strftime('%H:%M')}."
+        )
 
 
     # Fechas
     def _parse_fecha_hora(self, fecha_hora_str: str) -> datetime | None:
-        try:
-            return datetime.strptime(fecha_hora_str, "%Y-%m-%d %H:%M")
-        except ValueError:
-            return None
+        return parse_fecha_hora(fecha_hora_str)
 
     def _obtener_dia_semana_en_espanol(self, fecha_hora: datetime) -> str:
         return self.DIAS_SEMANA_ES[fecha_hora.weekday()]
\ No newline at end of file
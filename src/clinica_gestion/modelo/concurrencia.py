@@ -0,0 +1,31 @@
+import threading
+
+
+class BloqueosClinica:
+    # Locks de grano fino para usar una misma Clinica desde varios hilos: uno por médico (agenda de turnos,
+    # especialidades) y uno por paciente (historia clínica, recetas). Médicos distintos agendan en paralelo.
+    # Para evitar deadlocks se adquieren siempre en este orden: médico -> paciente -> journal -> índices de nombres
+    # (ver busqueda.py) -> repositorio. El de los IDs de turnos se toma solo y se suelta enseguida.
+
+    def __init__(self):
+        # Solo protege la creación de locks nuevos; una vez creado, el lock de cada clave se obtiene sin bloquear
+        self.__guardia__: threading.Lock = threading.Lock()
+        self.__medicos__: dict[str, threading.Lock] = {}
+        self.__pacientes__: dict[str, threading.Lock] = {}
+        self.__ids_turnos__: threading.Lock = threading.Lock()
+
+    def medico(self, matricula: str) -> threading.Lock:
+        return self._obtener(self.__medicos__, matricula)
+
+    def paciente(self, dni: str) -> threading.Lock:
+        return self._obtener(self.__pacientes__, dni)
+
+    def ids_turnos(self) -> threading.Lock:
+        return self.__ids_turnos__
+
+    def _obtener(self, bloqueos: dict[str, threading.Lock], clave: str) -> threading.Lock:
+        bloqueo = bloqueos.get(clave)
+        if bloqueo is None:
+            with self.__guardia__:
+                bloqueo = bloqueos.setdefault(clave, threading.Lock())
+        return bloqueo
@@ -1,11 +1,31 @@
+from .fechas import INDICE_DIA_SEMANA, dia_canonico
+from .nombres import ESPECIALIDADES
+
 class Especialidad:
+    __slots__ = ("__tipo__", "__dias__", "__mascara_dias__")
+
     def __init__(self, tipo: str, dias: list[str]):
-        self.__tipo__: str = tipo
-        self.__dias__: list[str] = [str(dia).lower() for dia in dias]
+        # El nombre y los días se guardan como instancias compartidas (ver nombres.py y fechas.dia_canonico)
+        self.__tipo__: str = ESPECIALIDADES.canonico(tipo)
+        self.__dias__: tuple[str, ...] = tuple(dia_canonico(str(dia).lower()) for dia in dias)
+        # Bit i encendido si se atiende el día de la semana i (0 = lunes, como datetime.weekday())
+        self.__mascara_dias__: int = 0
+        for dia in self.__dias__:
+            if dia in INDICE_DIA_SEMANA:
+                self.__mascara_dias__ |= 1 << INDICE_DIA_SEMANA[dia]
 
     def obtener_especialidad(self) -> str:
         return self.__tipo__
 
+    def obtener_dias(self) -> list[str]:
+        return list(self.__dias__)
+
+    def obtener_mascara_dias(self) -> int:
+        return self.__mascara_dias__
+
+    def atiende_dia_semana(self, dia_semana: int) -> bool:
+        return bool(self.__mascara_dias__ >> dia_semana & 1)
+
     def verificar_dia(self, dia: str) -> bool:
         if not isinstance(dia, str):
             return False
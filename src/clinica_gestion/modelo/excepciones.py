@@ -26,10 +26,27 @@ class TurnoOcupadoException(ClinicaException):
     """Excepción para cuando se intenta agendar un turno en un horario ya ocupado para el médico."""
     pass
 
+class TurnoNoEncontradoException(ClinicaException):
+    """Excepción para cuando no se encuentra un turno con un ID específico."""
+    pass
+
 class EspecialidadNoValidaParaDiaException(ClinicaException):
     """Excepción para cuando la especialidad del médico no es válida para el día solicitado."""
     pass
 
+class SerieTurnosNoDisponibleException(ClinicaException):
+    """Excepción para cuando no se puede agendar una serie de turnos porque alguna de sus fechas no está disponible."""
+    def __init__(self, mensaje: str, conflictos: list):
+        super().__init__(mensaje)
+        # (fecha y hora, excepción) de cada turno de la serie que no se pudo agendar
+        self.conflictos: list = conflictos
+
 class RecetaInvalidaException(ClinicaException):
     """Excepción para errores relacionados con la emisión o validación de recetas."""
     pass
+
+class ServicioClinicaException(ClinicaException):
+    """Excepción para errores informados por el servidor de la clínica a un cliente remoto."""
+    def __init__(self, tipo: str, mensaje: str):
+        super().__init__(mensaje)
+        self.tipo: str = tipo
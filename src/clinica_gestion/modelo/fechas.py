@@ -0,0 +1,62 @@
+import sys
+from datetime import datetime
+from functools import lru_cache
+
+FORMATO_FECHA_HORA = "%Y-%m-%d %H:%M"
+
+# Nombres de los días en el orden de datetime.weekday() (0 = lunes)
+DIAS_SEMANA_ES = ("lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo")
+INDICE_DIA_SEMANA = {dia: indice for indice, dia in enumerate(DIAS_SEMANA_ES)}
+
+
+def dia_canonico(dia: str) -> str:
+    # Los días de la semana se comparten con DIAS_SEMANA_ES; cualquier otro texto se internaliza
+    indice = INDICE_DIA_SEMANA.get(dia)
+    if indice is not None:
+        return DIAS_SEMANA_ES[indice]
+    return sys.intern(dia)
+
+
+# Horario de atención en el que se ofrecen turnos libres (de HORA_INICIO_ATENCION a HORA_FIN_ATENCION)
+HORA_INICIO_ATENCION = 8
+HORA_FIN_ATENCION = 18
+
+# Duración de un turno cuando no se indica otra
+MINUTOS_TURNO = 30
+
+# Las agendas suelen repetir los mismos horarios, así que se guardan los últimos textos interpretados.
+# Los datetime son inmutables, por lo que es seguro devolver la misma instancia.
+TAMANIO_CACHE_FECHAS = 4096
+
+
+def parse_fecha_hora_rapido(texto: str) -> datetime:
+    # Camino rápido para el formato exacto "YYYY-MM-DD HH:MM" con dígitos ASCII. Cualquier otra forma
+    # (por ejemplo "2025-1-5 9:30", que strptime también acepta) se delega en strptime, de modo que
+    # se aceptan y rechazan exactamente los mismos textos. Lanza ValueError si el texto no es válido.
+    if (
+        isinstance(texto, str)
+        and len(texto) == 16
+        and texto[4] == "-" and texto[7] == "-" and texto[10] == " " and texto[13] == ":"
+    ):
+        anio, mes, dia, hora, minuto = texto[0:4], texto[5:7], texto[8:10], texto[11:13], texto[14:16]
+        digitos = anio + mes + dia + hora + minuto
+        if digitos.isascii() and digitos.isdigit():
+            # datetime valida los rangos (mes 1-12, día según el mes, hora 0-23, minuto 0-59) igual que strptime
+            return datetime(int(anio), int(mes), int(dia), int(hora), int(minuto))
+    return datetime.strptime(texto, FORMATO_FECHA_HORA)
+
+
+@lru_cache(maxsize=TAMANIO_CACHE_FECHAS)
+def _parse_fecha_hora_cacheado(texto: str) -> datetime | None:
+    try:
+        return parse_fecha_hora_rapido(texto)
+    except ValueError:
+        return None
+
+
+def parse_fecha_hora(texto: str) -> datetime | None:
+    # Devuelve None si el texto no respeta el formato YYYY-MM-DD HH:MM o no es una fecha válida
+    if not isinstance(texto, str):
+        # Se conserva el TypeError de strptime para valores que no son texto
+        return datetime.strptime(texto, FORMATO_FECHA_HORA)
+    return _parse_fecha_hora_cacheado(texto)
@@ -1,36 +1,71 @@
+from bisect import bisect_left, bisect_right, insort_left, insort_right
+from datetime import datetime
 from .paciente import Paciente
 from .turno import Turno
 from .receta import Receta
 
 class HistoriaClinica:
+    __slots__ = ("__paciente__", "__turnos__", "__recetas__")
+
     def __init__(self, paciente: Paciente):
         self.__paciente__: Paciente = paciente
+        # Ambas listas se guardan en orden cronológico ascendente y se mantienen ordenadas al insertar
         self.__turnos__: list[Turno] = []
         self.__recetas__: list[Receta] = []
 
     def agregar_turno(self, turno: Turno) -> None:
         if isinstance(turno, Turno):
-            self.__turnos__.append(turno)
-            # Mantener los turnos ordenados por fecha, del más antiguo al más reciente
-            self.__turnos__.sort(key=lambda t: t.obtener_fecha_hora())
+            # Los turnos se exponen del más antiguo al más reciente; a igual fecha se respeta el orden de carga
+            insort_right(self.__turnos__, turno, key=Turno.obtener_fecha_hora)
+
+    def quitar_turno(self, turno: Turno) -> None:
+        # Se ubica por fecha con búsqueda binaria; entre los de igual fecha se reconoce por su ID. Quitarlo corre
+        # los turnos posteriores, pero solo los de este paciente (ver "Cancelar y reprogramar turnos" en la documentación)
+        id_turno = turno.obtener_id()
+        posicion = bisect_left(self.__turnos__, turno.obtener_fecha_hora(), key=Turno.obtener_fecha_hora)
+        while posicion < len(self.__turnos__) and self.__turnos__[posicion].obtener_fecha_hora() == turno.obtener_fecha_hora():
+            existente = self.__turnos__[posicion]
+            if existente is turno or (id_turno is not None and existente.obtener_id() == id_turno):
+                del self.__turnos__[posicion]
+                return
+            posicion += 1
 
     def obtener_turnos(self) -> list[Turno]:
         return list(self.__turnos__)
 
+    def obtener_turnos_entre(self, desde: datetime, hasta: datetime) -> list[Turno]:
+        inicio = bisect_left(self.__turnos__, desde, key=Turno.obtener_fecha_hora)
+        fin = bisect_right(self.__turnos__, hasta, lo=inicio, key=Turno.obtener_fecha_hora)
+        return self.__turnos__[inicio:fin]
+
+    def obtener_ultimos_turnos(self, cantidad: int) -> list[Turno]:
+        if cantidad <= 0:
+            return []
+        return self.__turnos__[-cantidad:]
+
     def agregar_receta(self, receta: Receta) -> None:
         if isinstance(receta, Receta):
-            self.__recetas__.append(receta)
-            # Mantener las recetas ordenadas por fecha de emisión, de la más reciente a la más antigua
-            self.__recetas__.sort(key=lambda r: r.obtener_fecha_emision(), reverse=True)
+            # Las recetas se exponen de la más reciente a la más antigua; a igual fecha se respeta el orden de carga
+            insort_left(self.__recetas__, receta, key=Receta.obtener_fecha_emision)
 
     def obtener_recetas(self) -> list[Receta]:
-        return list(self.__recetas__)
+        return self.__recetas__[::-1]
+
+    def obtener_recetas_entre(self, desde: datetime, hasta: datetime) -> list[Receta]:
+        inicio = bisect_left(self.__recetas__, desde, key=Receta.obtener_fecha_emision)
+        fin = bisect_right(self.__recetas__, hasta, lo=inicio, key=Receta.obtener_fecha_emision)
+        return self.__recetas__[inicio:fin][::-1]
+
+    def obtener_ultimas_recetas(self, cantidad: int) -> list[Receta]:
+        if cantidad <= 0:
+            return []
+        return self.__recetas__[-cantidad:][::-1]
 
     def __str__(self) -> str:
         return (
             f"HistoriaClinica("
             f"  Paciente({self.__paciente__}),\n"
             f"  {str(self.__turnos__)},\n"
-            f"  {str(self.__recetas__)}\n"
+            f"  {str(self.obtener_recetas())}\n"
             f")"
         )
@@ -0,0 +1,253 @@
+import csv
+import json
+import time
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from src.clinica_gestion.modelo.clinica import Clinica
+from src.clinica_gestion.modelo.especialidad import Especialidad
+from src.clinica_gestion.modelo.excepciones import ClinicaException
+from src.clinica_gestion.modelo.medico import Medico
+from src.clinica_gestion.modelo.paciente import Paciente
+
+# Una fila leída: número de línea en el archivo y el registro (o el error que impidió leerlo)
+FilaImportacion = tuple[int, dict | Exception]
+
+
+class ErrorImportacion:
+    def __init__(self, numero_fila: int, error: Exception):
+        self.__numero_fila__: int = numero_fila
+        self.__error__: Exception = error
+
+    def obtener_numero_fila(self) -> int:
+        return self.__numero_fila__
+
+    def obtener_error(self) -> Exception:
+        return self.__error__
+
+    def __str__(self) -> str:
+        return f"Fila {self.__numero_fila__}: {type(self.__error__).__name__}: {self.__error__}"
+
+
+class ResultadoImportacion:
+    def __init__(self, max_errores_detallados: int):
+        self.__importados__: int = 0
+        self.__cantidad_errores__: int = 0
+        # Solo se guarda el detalle de los primeros errores para que la memoria no crezca con el archivo
+        self.__errores__: list[ErrorImportacion] = []
+        self.__max_errores_detallados__: int = max_errores_detallados
+        self.__segundos__: float = 0.0
+
+    def registrar_importado(self) -> None:
+        self.__importados__ += 1
+
+    def registrar_error(self, numero_fila: int, error: Exception) -> None:
+        self._agregar_error(ErrorImportacion(numero_fila, error))
+
+    def _agregar_error(self, error: ErrorImportacion) -> None:
+        self.__cantidad_errores__ += 1
+        if len(self.__errores__) < self.__max_errores_detallados__:
+            self.__errores__.append(error)
+
+    def registrar_duracion(self, segundos: float) -> None:
+        self.__segundos__ = segundos
+
+    def obtener_importados(self) -> int:
+        return self.__importados__
+
+    def obtener_cantidad_errores(self) -> int:
+        return self.__cantidad_errores__
+
+    def obtener_errores(self) -> list[ErrorImportacion]:
+        return list(self.__errores__)
+
+    def obtener_total_filas(self) -> int:
+        return self.__importados__ + self.__cantidad_errores__
+
+    def obtener_segundos(self) -> float:
+        return self.__segundos__
+
+    def obtener_filas_por_segundo(self) -> float:
+        if self.__segundos__ <= 0:
+            return 0.0
+        return self.obtener_total_filas() / self.__segundos__
+
+    def __str__(self) -> str:
+        return (
+            f"Filas procesadas: {self.obtener_total_filas()}, importadas: {self.__importados__}, "
+            f"con error: {self.__cantidad_errores__} "
+            f"({self.__segundos__:.3f} s, {self.obtener_filas_por_segundo():.0f} filas/s)"
+        )
+
+
+def _es_utf8(texto: str) -> bool:
+    # Un byte inválido leído con errors="surrogateescape" queda como un sustituto suelto, que no se puede codificar
+    try:
+        texto.encode("utf-8")
+    except UnicodeEncodeError:
+        return False
+    return True
+
+
+class ImportadorClinica:
+    FORMATOS = ("csv", "jsonl")
+
+    def __init__(self, clinica: Clinica, max_errores_detallados: int = 100, filas_por_transaccion: int = 1000):
+        if filas_por_transaccion < 1:
+            raise ValueError("La cantidad de filas por transacción debe ser mayor que cero.")
+        self.__clinica__: Clinica = clinica
+        self.__max_errores_detallados__: int = max_errores_detallados
+        self.__filas_por_transaccion__: int = filas_por_transaccion
+
+    # Lectura
+    def leer_filas(self, ruta: str, formato: str | None = None) -> Iterator[FilaImportacion]:
+        formato = (formato or ruta.rsplit(".", 1)[-1]).lower()
+        if formato not in self.FORMATOS:
+            raise ValueError(f"Formato de archivo no soportado: '{formato}'. Use {' o '.join(self.FORMATOS)}.")
+
+        # Los bytes que no son UTF-8 no cortan la lectura: quedan como sustitutos y esa fila se informa como error
+        with open(ruta, encoding="utf-8-sig", errors="surrogateescape", newline="") as archivo:
+            if formato == "csv":
+                yield from self._leer_filas_csv(archivo)
+            else:
+                yield from self._leer_filas_jsonl(archivo)
+
+    def _leer_filas_csv(self, lineas: Iterable[str]) -> Iterator[FilaImportacion]:
+        # Las líneas se cuentan aparte: ante un csv.Error, line_num del lector no siempre incluye la línea fallida
+        leidas = 0
+
+        def contar_lineas() -> Iterator[str]:
+            nonlocal leidas
+            for linea in lineas:
+                leidas += 1
+                yield linea
+
+        lector = csv.DictReader(contar_lineas())
+        try:
+            lector.fieldnames
+        except csv.Error as e:
+            # Sin encabezado no se puede interpretar ninguna de las filas siguientes
+            yield leidas, ValueError(f"Encabezado CSV inválido: {e}")
+            return
+        while True:
+            try:
+                fila = next(lector)
+            except StopIteration:
+                return
+            except csv.Error as e:
+                yield leidas, ValueError(f"CSV inválido: {e}")
+                continue
+            if not all(_es_utf8(valor) for valor in fila.values() if isinstance(valor, str)):
+                yield leidas, ValueError("La fila tiene caracteres que no son UTF-8 válido.")
+                continue
+            yield leidas, fila
+
+    def _leer_filas_jsonl(self, lineas: Iterable[str]) -> Iterator[FilaImportacion]:
+        for numero_linea, linea in enumerate(lineas, start=1):
+            if not linea.strip():
+                continue
+            if not _es_utf8(linea):
+                yield numero_linea, ValueError("La línea tiene caracteres que no son UTF-8 válido.")
+                continue
+            try:
+                fila = json.loads(linea)
+            except ValueError as e:
+                yield numero_linea, ValueError(f"JSON inválido: {e}")
+                continue
+            if not isinstance(fila, dict):
+                yield numero_linea, ValueError("Cada línea debe ser un objeto JSON.")
+                continue
+            yield numero_linea, fila
+
+    # Importación
+    def importar_pacientes(self, filas: Iterable[FilaImportacion]) -> ResultadoImportacion:
+        return self._importar(filas, self._crear_paciente, self.__clinica__.agregar_paciente)
+
+    def importar_medicos(self, filas: Iterable[FilaImportacion]) -> ResultadoImportacion:
+        return self._importar(filas, self._crear_medico, self.__clinica__.agregar_medico)
+
+    def importar_pacientes_desde_archivo(self, ruta: str, formato: str | None = None) -> ResultadoImportacion:
+        return self.importar_pacientes(self.leer_filas(ruta, formato))
+
+    def importar_medicos_desde_archivo(self, ruta: str, formato: str | None = None) -> ResultadoImportacion:
+        return self.importar_medicos(self.leer_filas(ruta, formato))
+
+    def _importar(self, filas: Iterable[FilaImportacion], crear: Callable[[dict], object],
+                  agregar: Callable[[object], None]) -> ResultadoImportacion:
+        resultado = ResultadoImportacion(self.__max_errores_detallados__)
+        inicio = time.perf_counter()
+        filas = iter(filas)
+        procesadas = self.__filas_por_transaccion__
+        # Las filas se confirman de a bloques para no pagar una escritura a disco por cada una. Una fila con error
+        # no deshace el bloque: las escrituras de varios pasos del repositorio (un médico con sus especialidades)
+        # van en una transacción anidada que, si falla, deshace solo lo suyo, y el resto del bloque se confirma.
+        while procesadas == self.__filas_por_transaccion__:
+            procesadas = 0
+            with self.__clinica__.transaccion():
+                for numero_fila, fila in islice(filas, self.__filas_por_transaccion__):
+                    procesadas += 1
+                    try:
+                        if isinstance(fila, Exception):
+                            raise fila
+                        agregar(crear(fila))
+                    except (ClinicaException, ValueError, TypeError) as e:
+                        resultado.registrar_error(numero_fila, e)
+                    else:
+                        resultado.registrar_importado()
+        resultado.registrar_duracion(time.perf_counter() - inicio)
+        return resultado
+
+    # Conversión de filas
+    def _crear_paciente(self, fila: dict) -> Paciente:
+        return Paciente(
+            self._obtener_campo(fila, "nombre"),
+            self._obtener_campo(fila, "dni"),
+            self._obtener_campo(fila, "fecha_nacimiento"),
+        )
+
+    def _crear_medico(self, fila: dict) -> Medico:
+        medico = Medico(self._obtener_campo(fila, "nombre"), self._obtener_campo(fila, "matricula"))
+        for especialidad in self._parse_especialidades(fila.get("especialidades")):
+            medico.agregar_especialidad(especialidad)
+        return medico
+
+    def _obtener_campo(self, fila: dict, campo: str) -> str:
+        valor = fila.get(campo)
+        if valor is None or not str(valor).strip():
+            raise ValueError(f"Falta el campo obligatorio '{campo}'.")
+        return str(valor).strip()
+
+    def _parse_especialidades(self, valor: str | list | None) -> list[Especialidad]:
+        # En CSV: "Cardiología:lunes|miércoles;Pediatría:martes"
+        # En JSONL: también se acepta [{"tipo": "Cardiología", "dias": ["lunes", "miércoles"]}, ...]
+        if not valor:
+            return []
+
+        if isinstance(valor, str):
+            pares = []
+            for parte in valor.split(";"):
+                if not parte.strip():
+                    continue
+                tipo, separador, dias_str = parte.partition(":")
+                if not separador:
+                    raise ValueError(f"Especialidad sin días de atención: '{parte.strip()}'.")
+                pares.append((tipo, dias_str.split("|")))
+        elif isinstance(valor, list):
+            if not all(isinstance(esp, dict) for esp in valor):
+                raise ValueError('Cada especialidad debe ser un objeto {"tipo": ..., "dias": [...]}.')
+            pares = [(esp.get("tipo", ""), esp.get("dias", [])) for esp in valor]
+        else:
+            raise ValueError("El campo 'especialidades' tiene un formato inválido.")
+
+        especialidades = []
+        for tipo, dias in pares:
+            if not isinstance(dias, list):
+                raise ValueError(f"Los días de la especialidad '{tipo}' deben ser una lista, por ejemplo [\"lunes\"].")
+            tipo = str(tipo).strip()
+            dias = [str(dia).strip().lower() for dia in dias if str(dia).strip()]
+            if not tipo or not dias:
+                raise ValueError("Cada especialidad debe tener nombre y al menos un día de atención.")
+            for dia in dias:
+                if dia not in Clinica.DIAS_SEMANA_ES:
+                    raise ValueError(f"Día '{dia}' no reconocido para la especialidad '{tipo}'.")
+            especialidades.append(Especialidad(tipo, dias))
+        return especialidades
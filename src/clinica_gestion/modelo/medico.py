@@ -1,10 +1,15 @@
 from .especialidad import Especialidad
+from .fechas import DIAS_SEMANA_ES, INDICE_DIA_SEMANA
 
 class Medico:
+    __slots__ = ("__nombre__", "__matricula__", "__especialidades__", "__especialidades_por_dia__")
+
     def __init__(self, nombre: str, matricula: str):
         self.__nombre__: str = nombre
         self.__matricula__: str = matricula
         self.__especialidades__: list[Especialidad] = []
+        # Nombres de las especialidades que atiende cada día de la semana (índice = datetime.weekday())
+        self.__especialidades_por_dia__: list[tuple[str, ...]] = [()] * len(DIAS_SEMANA_ES)
 
     def obtener_nombre(self) -> str:
         return self.__nombre__
@@ -18,10 +23,20 @@ class Medico:
     def agregar_especialidad(self, especialidad: Especialidad) -> None:
         if isinstance(especialidad, Especialidad):
             self.__especialidades__.append(especialidad)
+            for dia in range(len(DIAS_SEMANA_ES)):
+                if especialidad.atiende_dia_semana(dia):
+                    self.__especialidades_por_dia__[dia] += (especialidad.obtener_especialidad(),)
+
+    def obtener_especialidades_para_dia_semana(self, dia_semana: int) -> tuple[str, ...]:
+        return self.__especialidades_por_dia__[dia_semana]
 
     def obtener_especialidades_para_dia(self, dia: str) -> list[str]:
-        especialidades = []
         dia_lower = dia.lower()
+        if dia_lower in INDICE_DIA_SEMANA:
+            return list(self.__especialidades_por_dia__[INDICE_DIA_SEMANA[dia_lower]])
+
+        # Días que no son de la semana: se conserva la búsqueda por nombre de cada especialidad
+        especialidades = []
         for esp in self.__especialidades__:
             if esp.verificar_dia(dia_lower):
                 especialidades.append(esp.obtener_especialidad())
@@ -0,0 +1,159 @@
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable
+from functools import wraps
+
+# Límites superiores (en segundos) de los intervalos del histograma de latencias, de 10 µs a 5 s
+LIMITES_LATENCIA = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+                    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+ETIQUETAS_LIMITES = tuple(repr(limite) for limite in LIMITES_LATENCIA) + ("+Inf",)
+
+
+class HistogramaLatencia:
+    __slots__ = ("__conteos__", "__suma__", "__cantidad__")
+
+    def __init__(self):
+        # Un conteo por intervalo más uno final para lo que supera el último límite
+        self.__conteos__: list[int] = [0] * (len(LIMITES_LATENCIA) + 1)
+        self.__suma__: float = 0.0
+        self.__cantidad__: int = 0
+
+    def registrar(self, segundos: float) -> None:
+        self.__conteos__[bisect_left(LIMITES_LATENCIA, segundos)] += 1
+        self.__suma__ += segundos
+        self.__cantidad__ += 1
+
+    def obtener_cantidad(self) -> int:
+        return self.__cantidad__
+
+    def obtener_suma(self) -> float:
+        return self.__suma__
+
+    def obtener_acumulados(self) -> dict[str, int]:
+        # Observaciones menores o iguales a cada límite, con los límites escritos como en las etiquetas
+        # "le" de Prometheus (el último es "+Inf"); así la instantánea también se puede enviar como JSON
+        acumulados = {}
+        total = 0
+        for limite, conteo in zip(ETIQUETAS_LIMITES, self.__conteos__):
+            total += conteo
+            acumulados[limite] = total
+        return acumulados
+
+
+class MetricasMetodo:
+    __slots__ = ("__llamadas__", "__errores__", "__latencia__")
+
+    def __init__(self):
+        self.__llamadas__: int = 0
+        self.__errores__: dict[str, int] = {}
+        self.__latencia__: HistogramaLatencia = HistogramaLatencia()
+
+    def registrar(self, segundos: float, error: Exception | None) -> None:
+        self.__llamadas__ += 1
+        if error is not None:
+            tipo = type(error).__name__
+            self.__errores__[tipo] = self.__errores__.get(tipo, 0) + 1
+        self.__latencia__.registrar(segundos)
+
+    def obtener_llamadas(self) -> int:
+        return self.__llamadas__
+
+    def obtener_errores(self) -> dict[str, int]:
+        return dict(self.__errores__)
+
+    def obtener_latencia(self) -> HistogramaLatencia:
+        return self.__latencia__
+
+
+class MetricasClinica:
+    # Cuenta llamadas, errores por tipo de excepción y latencias de los métodos públicos de una Clinica.
+    # Solo existe si se habilitan las métricas: sin ellas los métodos no se envuelven y no cuestan nada.
+
+    def __init__(self):
+        self.__metodos__: dict[str, MetricasMetodo] = {}
+        self.__bloqueo__: threading.Lock = threading.Lock()
+        # Marca si el hilo ya está dentro de un método medido: las llamadas internas (por ejemplo, la búsqueda
+        # del paciente dentro de agendar_turno) son parte de la operación externa y no se cuentan aparte
+        self.__en_curso__: threading.local = threading.local()
+
+    def instrumentar(self, nombre: str, metodo: Callable) -> Callable:
+        metricas = self.__metodos__.setdefault(nombre, MetricasMetodo())
+        en_curso = self.__en_curso__
+        bloqueo = self.__bloqueo__
+        reloj = time.perf_counter
+
+        @wraps(metodo)
+        def medido(*args, **kwargs):
+            if getattr(en_curso, "activo", False):
+                return metodo(*args, **kwargs)
+            en_curso.activo = True
+            error = None
+            inicio = reloj()
+            try:
+                return metodo(*args, **kwargs)
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                segundos = reloj() - inicio
+                en_curso.activo = False
+                with bloqueo:
+                    metricas.registrar(segundos, error)
+
+        return medido
+
+    def instantanea(self) -> dict[str, dict]:
+        with self.__bloqueo__:
+            return {
+                nombre: {
+                    "llamadas": metricas.obtener_llamadas(),
+                    "errores": metricas.obtener_errores(),
+                    "latencia": {
+                        "cantidad": metricas.obtener_latencia().obtener_cantidad(),
+                        "suma_segundos": metricas.obtener_latencia().obtener_suma(),
+                        "buckets": metricas.obtener_latencia().obtener_acumulados(),
+                    },
+                }
+                for nombre, metricas in self.__metodos__.items()
+            }
+
+
+    # Exportación en el formato de texto de Prometheus
+    def a_prometheus(self) -> str:
+        instantanea = self.instantanea()
+        lineas = [
+            "# HELP clinica_llamadas_total Llamadas a los métodos públicos de Clinica.",
+            "# TYPE clinica_llamadas_total counter",
+        ]
+        for nombre, datos in instantanea.items():
+            lineas.append(f'clinica_llamadas_total{{metodo="{nombre}"}} {datos["llamadas"]}')
+
+        lineas += [
+            "# HELP clinica_errores_total Excepciones lanzadas por los métodos de Clinica, por tipo.",
+            "# TYPE clinica_errores_total counter",
+        ]
+        for nombre, datos in instantanea.items():
+            for tipo, cantidad in sorted(datos["errores"].items()):
+                lineas.append(f'clinica_errores_total{{metodo="{nombre}",tipo="{tipo}"}} {cantidad}')
+
+        lineas += [
+            "# HELP clinica_latencia_segundos Duración de las llamadas a los métodos de Clinica.",
+            "# TYPE clinica_latencia_segundos histogram",
+        ]
+        for nombre, datos in instantanea.items():
+            latencia = datos["latencia"]
+            for limite, acumulado in latencia["buckets"].items():
+                lineas.append(f'clinica_latencia_segundos_bucket{{metodo="{nombre}",le="{limite}"}} {acumulado}')
+            lineas.append(f'clinica_latencia_segundos_sum{{metodo="{nombre}"}} {latencia["suma_segundos"]!r}')
+            lineas.append(f'clinica_latencia_segundos_count{{metodo="{nombre}"}} {latencia["cantidad"]}')
+        return "\n".join(lineas) + "\n"
+
+    def escribir_prometheus(self, ruta: str) -> None:
+        # Se reemplaza el archivo de una vez para que quien lo lea (por ejemplo, el textfile collector
+        # de node_exporter) nunca vea un archivo a medio escribir
+        ruta_temporal = ruta + ".tmp"
+        with open(ruta_temporal, "w", encoding="utf-8") as archivo:
+            archivo.write(self.a_prometheus())
+        os.replace(ruta_temporal, ruta)
@@ -0,0 +1,22 @@
+class RegistroNombres:
+    # Flyweight de textos: guarda una única instancia de cada nombre y es la que reciben todos los objetos que
+    # lo usan. Así millones de turnos comparten el mismo str por especialidad, y comparar dos nombres ya
+    # registrados es comparar identidades.
+
+    def __init__(self):
+        self.__nombres__: dict[str, str] = {}
+
+    def canonico(self, nombre: str) -> str:
+        # setdefault es atómico con el GIL: dos hilos que registran el mismo nombre reciben la misma instancia
+        return self.__nombres__.setdefault(nombre, nombre)
+
+    def buscar(self, nombre: str) -> str | None:
+        # Instancia registrada del nombre, sin registrarlo si no existe (para textos ingresados por el usuario)
+        return self.__nombres__.get(nombre)
+
+    def __len__(self) -> int:
+        return len(self.__nombres__)
+
+
+# Nombres de especialidad de todas las clínicas del proceso: los usan Especialidad, Turno y Medico
+ESPECIALIDADES = RegistroNombres()
@@ -1,4 +1,6 @@
 class Paciente:
+    __slots__ = ("__nombre__", "__dni__", "__fecha_nacimiento__")
+
     def __init__(self, nombre: str, dni: str, fecha_nacimiento: str):
         self.__nombre__: str = nombre
         self.__dni__: str = dni
@@ -10,5 +12,8 @@ class Paciente:
     def obtener_nombre(self) -> str:
         return self.__nombre__
 
+    def obtener_fecha_nacimiento(self) -> str:
+        return self.__fecha_nacimiento__
+
     def __str__(self) -> str:
         return f"{self.__nombre__}, {self.__dni__}, {self.__fecha_nacimiento__}"
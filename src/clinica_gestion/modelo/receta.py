@@ -1,13 +1,29 @@
+import sys
 from datetime import datetime
 from .paciente import Paciente
 from .medico import Medico
 
 class Receta:
-    def __init__(self, paciente: Paciente, medico: Medico, medicamentos: list[str], fecha: datetime = datetime.now()):
+    __slots__ = ("__paciente__", "__medico__", "__medicamentos__", "__fecha__")
+
+    def __init__(self, paciente: Paciente, medico: Medico, medicamentos: list[str], fecha: datetime | None = None):
         self.__paciente__: Paciente = paciente
         self.__medico__: Medico = medico
-        self.__medicamentos__: list[str] = medicamentos
-        self.__fecha__: datetime = fecha
+        # Los mismos medicamentos se repiten en millones de recetas: con sys.intern todas comparten un único str
+        # por nombre (también los leídos de disco), y la tupla ocupa menos que una lista
+        self.__medicamentos__: tuple[str, ...] = tuple(
+            sys.intern(medicamento) if type(medicamento) is str else medicamento for medicamento in medicamentos
+        )
+        self.__fecha__: datetime = fecha if fecha is not None else datetime.now()
+
+    def obtener_paciente(self) -> Paciente:
+        return self.__paciente__
+
+    def obtener_medico(self) -> Medico:
+        return self.__medico__
+
+    def obtener_medicamentos(self) -> list[str]:
+        return list(self.__medicamentos__)
 
     def obtener_fecha_emision(self) -> datetime:
         return self.__fecha__
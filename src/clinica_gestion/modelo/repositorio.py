@@ -0,0 +1,421 @@
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager, nullcontext
+from datetime import datetime, timedelta
+from itertools import accumulate, islice, takewhile
+from src.clinica_gestion.modelo.especialidad import Especialidad
+from src.clinica_gestion.modelo.historia_clinica import HistoriaClinica
+from src.clinica_gestion.modelo.medico import Medico
+from src.clinica_gestion.modelo.paciente import Paciente
+from src.clinica_gestion.modelo.receta import Receta
+from src.clinica_gestion.modelo.turno import Turno
+
+
+class RepositorioClinica(ABC):
+    # Almacenamiento de los datos de la clínica. Las reglas de negocio (duplicados, disponibilidad,
+    # existencia de pacientes y médicos) se validan en Clinica antes de llamar a estos métodos.
+
+    # Pacientes
+    @abstractmethod
+    def agregar_paciente(self, paciente: Paciente) -> None: ...
+
+    @abstractmethod
+    def obtener_paciente(self, dni: str) -> Paciente | None: ...
+
+    @abstractmethod
+    def obtener_pacientes(self) -> list[Paciente]: ...
+
+    # Médicos
+    @abstractmethod
+    def agregar_medico(self, medico: Medico) -> None: ...
+
+    @abstractmethod
+    def obtener_medico(self, matricula: str) -> Medico | None: ...
+
+    @abstractmethod
+    def obtener_medicos(self) -> list[Medico]: ...
+
+    @abstractmethod
+    def agregar_especialidad(self, medico: Medico, especialidad: Especialidad) -> None: ...
+
+    # Turnos
+    @abstractmethod
+    def agregar_turno(self, turno: Turno) -> None: ...
+
+    @abstractmethod
+    def obtener_turno(self, id_turno: int) -> Turno | None: ...
+
+    @abstractmethod
+    def quitar_turno(self, turno: Turno) -> None: ...
+
+    def reemplazar_turno(self, anterior: Turno, nuevo: Turno) -> None:
+        # Cambia un turno por otro con el mismo ID (por ejemplo, al reprogramarlo)
+        with self.transaccion():
+            self.quitar_turno(anterior)
+            self.agregar_turno(nuevo)
+
+    @abstractmethod
+    def obtener_ultimo_id_turno(self) -> int: ...
+
+    @abstractmethod
+    def obtener_turno_superpuesto(self, matricula: str, inicio: datetime, fin: datetime) -> Turno | None: ...
+
+    @abstractmethod
+    def obtener_turnos(self) -> list[Turno]: ...
+
+    @abstractmethod
+    def obtener_turnos_medico_entre(self, matricula: str, desde: datetime, hasta: datetime) -> list[Turno]: ...
+
+    @abstractmethod
+    def obtener_proximo_turno_medico(self, matricula: str, desde: datetime) -> Turno | None: ...
+
+    # Recetas e historias clínicas
+    @abstractmethod
+    def agregar_receta(self, receta: Receta) -> None: ...
+
+    @abstractmethod
+    def obtener_historia_clinica(self, dni: str) -> HistoriaClinica: ...
+
+    def iterar_recetas(self) -> Iterator[Receta]:
+        # Todas las recetas, paciente por paciente (la usa el índice de medicamentos al construirse)
+        for paciente in self.iterar_pacientes():
+            yield from self.obtener_historia_clinica(paciente.obtener_dni()).obtener_recetas()
+
+    # Listados paginados: `desde` es la cantidad de resultados (ya filtrados) que se saltean y `cantidad`
+    # el máximo a devolver (None = todos). Estas versiones recorren las listas completas; los repositorios
+    # las reemplazan por otras que no copian la colección.
+    def iterar_pacientes(self, desde: int = 0, cantidad: int | None = None, nombre: str | None = None) -> Iterator[Paciente]:
+        return _pagina(filtrar_pacientes(self.obtener_pacientes(), nombre), desde, cantidad)
+
+    def iterar_medicos(self, desde: int = 0, cantidad: int | None = None, especialidad: str | None = None) -> Iterator[Medico]:
+        return _pagina(filtrar_medicos(self.obtener_medicos(), especialidad), desde, cantidad)
+
+    def iterar_turnos(self, desde: int = 0, cantidad: int | None = None, matricula: str | None = None,
+                      dni: str | None = None, especialidad: str | None = None,
+                      fecha_desde: datetime | None = None, fecha_hasta: datetime | None = None) -> Iterator[Turno]:
+        turnos = filtrar_turnos(self.obtener_turnos(), matricula, dni, especialidad, fecha_desde, fecha_hasta)
+        return _pagina(turnos, desde, cantidad)
+
+    # Agrupa varias escrituras en una sola transacción (en memoria no hace nada)
+    def transaccion(self) -> AbstractContextManager:
+        return nullcontext()
+
+
+# Filtros de los listados: el nombre se busca como parte del texto sin distinguir mayúsculas,
+# la especialidad debe coincidir exactamente y el rango de fechas incluye ambos extremos
+def filtrar_pacientes(pacientes: Iterable[Paciente], nombre: str | None) -> Iterable[Paciente]:
+    if not nombre:
+        return pacientes
+    buscado = nombre.casefold()
+    return (paciente for paciente in pacientes if buscado in paciente.obtener_nombre().casefold())
+
+
+def filtrar_medicos(medicos: Iterable[Medico], especialidad: str | None) -> Iterable[Medico]:
+    if not especialidad:
+        return medicos
+    return (
+        medico for medico in medicos
+        if any(esp.obtener_especialidad() == especialidad for esp in medico.obtener_especialidades())
+    )
+
+
+def filtrar_turnos(turnos: Iterable[Turno], matricula: str | None, dni: str | None, especialidad: str | None,
+                   fecha_desde: datetime | None, fecha_hasta: datetime | None) -> Iterable[Turno]:
+    if matricula:
+        turnos = (turno for turno in turnos if turno.obtener_medico().obtener_matricula() == matricula)
+    if dni:
+        turnos = (turno for turno in turnos if turno.obtener_paciente().obtener_dni() == dni)
+    if especialidad:
+        turnos = (turno for turno in turnos if turno.obtener_especialidad_atendida() == especialidad)
+    if fecha_desde is not None:
+        turnos = (turno for turno in turnos if turno.obtener_fecha_hora() >= fecha_desde)
+    if fecha_hasta is not None:
+        turnos = (turno for turno in turnos if turno.obtener_fecha_hora() <= fecha_hasta)
+    return turnos
+
+
+def _pagina(elementos: Iterable, desde: int, cantidad: int | None) -> Iterator:
+    return islice(elementos, desde, None if cantidad is None else desde + cantidad)
+
+
+def _desde_posicion(lista: list, desde: int) -> Iterator:
+    # Recorre la lista a partir de una posición sin copiarla; ve los elementos que se agreguen mientras tanto
+    posicion = desde
+    while posicion < len(lista):
+        yield lista[posicion]
+        posicion += 1
+
+
+def _clave_fecha(fecha_hora: datetime) -> int:
+    # Microsegundos desde datetime.min: un entero en el mismo orden que las fechas, para ListaPorId
+    return (fecha_hora - datetime.min) // timedelta(microseconds=1)
+
+
+def _clave_agenda(turno: Turno) -> int:
+    # En la agenda de un médico no hay dos turnos que empiecen a la misma hora
+    return _clave_fecha(turno.obtener_fecha_hora())
+
+
+class ListaPorId:
+    # Elementos ordenados por un ID entero, guardados en bloques de a lo sumo TAMANIO_BLOQUE (el doble si se
+    # insertan en el medio): un ID se ubica con una búsqueda binaria entre los primeros IDs de los bloques y otra
+    # dentro del bloque, y quitarlo solo mueve los elementos de ese bloque. Los IDs nuevos suelen ser mayores
+    # que todos los anteriores, y entonces se agregan al final.
+    TAMANIO_BLOQUE = 1024
+
+    def __init__(self, obtener_id: Callable[[object], int]):
+        self.__obtener_id__: Callable[[object], int] = obtener_id
+        self.__bloques__: list[list] = []
+        # IDs de cada bloque (en paralelo a los bloques) y primer ID de cada uno; no hay bloques vacíos
+        self.__ids__: list[list[int]] = []
+        self.__primeros__: list[int] = []
+        # Cantidad de elementos antes de cada bloque, para empezar un recorrido en una posición; None si cambió
+        self.__anteriores__: list[int] | None = []
+        self.__cantidad__: int = 0
+        # Varios hilos pueden agregar y quitar a la vez (médicos distintos no comparten lock)
+        self.__bloqueo__: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.__cantidad__
+
+    def __iter__(self) -> Iterator:
+        return self.iterar()
+
+    def agregar(self, elemento: object) -> None:
+        id_elemento = self.__obtener_id__(elemento)
+        with self.__bloqueo__:
+            if not self.__bloques__ or id_elemento > self.__ids__[-1][-1]:
+                if not self.__bloques__ or len(self.__bloques__[-1]) >= self.TAMANIO_BLOQUE:
+                    if self.__anteriores__ is not None:
+                        self.__anteriores__.append(self.__cantidad__)
+                    self.__bloques__.append([])
+                    self.__ids__.append([])
+                    self.__primeros__.append(id_elemento)
+                self.__bloques__[-1].append(elemento)
+                self.__ids__[-1].append(id_elemento)
+            else:
+                self._insertar(id_elemento, elemento)
+            self.__cantidad__ += 1
+
+    def _insertar(self, id_elemento: int, elemento: object) -> None:
+        bloque = max(bisect_right(self.__primeros__, id_elemento) - 1, 0)
+        ids = self.__ids__[bloque]
+        posicion = bisect_left(ids, id_elemento)
+        if posicion < len(ids) and ids[posicion] == id_elemento:
+            raise ValueError(f"Ya existe un elemento con ID {id_elemento}.")
+        ids.insert(posicion, id_elemento)
+        self.__bloques__[bloque].insert(posicion, elemento)
+        self.__primeros__[bloque] = ids[0]
+        if len(ids) > 2 * self.TAMANIO_BLOQUE:
+            mitad = len(ids) // 2
+            self.__bloques__.insert(bloque + 1, self.__bloques__[bloque][mitad:])
+            self.__ids__.insert(bloque + 1, ids[mitad:])
+            self.__primeros__.insert(bloque + 1, ids[mitad])
+            del self.__bloques__[bloque][mitad:], ids[mitad:]
+        self.__anteriores__ = None
+
+    def quitar(self, id_elemento: int) -> object | None:
+        with self.__bloqueo__:
+            bloque, posicion = self._ubicar_id(id_elemento)
+            if bloque is None:
+                return None
+            elemento = self.__bloques__[bloque].pop(posicion)
+            ids = self.__ids__[bloque]
+            del ids[posicion]
+            if ids:
+                self.__primeros__[bloque] = ids[0]
+            else:
+                del self.__bloques__[bloque], self.__ids__[bloque], self.__primeros__[bloque]
+            self.__anteriores__ = None
+            self.__cantidad__ -= 1
+            return elemento
+
+    def obtener(self, id_elemento: int) -> object | None:
+        with self.__bloqueo__:
+            bloque, posicion = self._ubicar_id(id_elemento)
+            return None if bloque is None else self.__bloques__[bloque][posicion]
+
+    def _ubicar_id(self, id_elemento: int) -> tuple[int | None, int]:
+        bloque = bisect_right(self.__primeros__, id_elemento) - 1
+        if bloque < 0:
+            return None, 0
+        ids = self.__ids__[bloque]
+        posicion = bisect_left(ids, id_elemento)
+        if posicion == len(ids) or ids[posicion] != id_elemento:
+            return None, 0
+        return bloque, posicion
+
+    def anterior(self, id_elemento: int) -> object | None:
+        # El elemento de mayor ID entre los que tienen un ID menor que id_elemento
+        with self.__bloqueo__:
+            bloque = bisect_left(self.__primeros__, id_elemento) - 1
+            if bloque < 0:
+                return None
+            return self.__bloques__[bloque][bisect_left(self.__ids__[bloque], id_elemento) - 1]
+
+    def siguiente(self, id_elemento: int) -> object | None:
+        # El elemento de menor ID entre los que tienen un ID mayor o igual que id_elemento
+        with self.__bloqueo__:
+            bloque, posicion = self._posterior(id_elemento - 1)
+            return None if bloque >= len(self.__bloques__) else self.__bloques__[bloque][posicion]
+
+    def iterar(self, desde: int = 0) -> Iterator:
+        # Recorre a partir de una posición de a un bloque, copiado bajo el lock: ve los elementos que se agreguen
+        # mientras tanto, y una baja concurrente no hace saltear ni repetir elementos porque cada bloque
+        # siguiente se busca por el último ID recorrido
+        with self.__bloqueo__:
+            tramo, ultimo_id = self._tramo(*self._ubicar_posicion(desde))
+        return self._recorrer(tramo, ultimo_id)
+
+    def iterar_desde_id(self, id_minimo: int) -> Iterator:
+        # Como iterar, pero a partir del primer elemento con ID mayor o igual que id_minimo
+        with self.__bloqueo__:
+            tramo, ultimo_id = self._tramo(*self._posterior(id_minimo - 1))
+        return self._recorrer(tramo, ultimo_id)
+
+    def _recorrer(self, tramo: list, ultimo_id: int | None) -> Iterator:
+        while tramo:
+            yield from tramo
+            with self.__bloqueo__:
+                tramo, ultimo_id = self._tramo(*self._posterior(ultimo_id))
+
+    def _ubicar_posicion(self, desde: int) -> tuple[int, int]:
+        if self.__anteriores__ is None:
+            self.__anteriores__ = list(accumulate(map(len, self.__bloques__[:-1]), initial=0))
+        bloque = bisect_right(self.__anteriores__, desde) - 1
+        if bloque < 0:
+            return len(self.__bloques__), 0
+        return bloque, desde - self.__anteriores__[bloque]
+
+    def _posterior(self, ultimo_id: int) -> tuple[int, int]:
+        bloque = max(bisect_right(self.__primeros__, ultimo_id) - 1, 0)
+        if bloque >= len(self.__bloques__):
+            return bloque, 0
+        posicion = bisect_right(self.__ids__[bloque], ultimo_id)
+        if posicion == len(self.__ids__[bloque]):
+            return bloque + 1, 0
+        return bloque, posicion
+
+    def _tramo(self, bloque: int, posicion: int) -> tuple[list, int | None]:
+        if bloque >= len(self.__bloques__):
+            return [], None
+        return self.__bloques__[bloque][posicion:], self.__ids__[bloque][-1]
+
+
+class RepositorioEnMemoria(RepositorioClinica):
+    def __init__(self):
+        self.__pacientes__: dict[str, Paciente] = {}
+        self.__medicos__: dict[str, Medico] = {}
+        # Pacientes y médicos en orden de alta, para los listados paginados: se puede empezar en cualquier
+        # posición sin recorrer las anteriores, y agregar mientras otro hilo lista no invalida el recorrido
+        self.__lista_pacientes__: list[Paciente] = []
+        self.__lista_medicos__: list[Medico] = []
+        # Turnos ordenados por ID (el orden de alta), con bajas en tiempo logarítmico
+        self.__turnos__: ListaPorId = ListaPorId(Turno.obtener_id)
+        self.__ultimo_id_turno__: int = 0
+        self.__historias_clinicas__: dict[str, HistoriaClinica] = {}
+        # Agenda de cada médico (matrícula -> turnos ordenados por fecha_hora), en bloques como los turnos para
+        # cancelar y reprogramar en tiempo logarítmico. Los turnos de un médico no se superponen, así que sus
+        # fines quedan en el mismo orden que sus inicios
+        self.__agendas_medicos__: dict[str, ListaPorId] = {}
+
+    # Pacientes
+    def agregar_paciente(self, paciente: Paciente) -> None:
+        dni = paciente.obtener_dni()
+        self.__pacientes__[dni] = paciente
+        self.__lista_pacientes__.append(paciente)
+        self.__historias_clinicas__[dni] = HistoriaClinica(paciente)
+
+    def obtener_paciente(self, dni: str) -> Paciente | None:
+        return self.__pacientes__.get(dni)
+
+    def obtener_pacientes(self) -> list[Paciente]:
+        return list(self.__pacientes__.values())
+
+    # Médicos
+    def agregar_medico(self, medico: Medico) -> None:
+        self.__medicos__[medico.obtener_matricula()] = medico
+        self.__lista_medicos__.append(medico)
+
+    def obtener_medico(self, matricula: str) -> Medico | None:
+        return self.__medicos__.get(matricula)
+
+    def obtener_medicos(self) -> list[Medico]:
+        return list(self.__medicos__.values())
+
+    def agregar_especialidad(self, medico: Medico, especialidad: Especialidad) -> None:
+        medico.agregar_especialidad(especialidad)
+
+    # Listados paginados
+    def iterar_pacientes(self, desde: int = 0, cantidad: int | None = None, nombre: str | None = None) -> Iterator[Paciente]:
+        if not nombre:
+            return _pagina(_desde_posicion(self.__lista_pacientes__, desde), 0, cantidad)
+        return _pagina(filtrar_pacientes(_desde_posicion(self.__lista_pacientes__, 0), nombre), desde, cantidad)
+
+    def iterar_medicos(self, desde: int = 0, cantidad: int | None = None, especialidad: str | None = None) -> Iterator[Medico]:
+        if not especialidad:
+            return _pagina(_desde_posicion(self.__lista_medicos__, desde), 0, cantidad)
+        return _pagina(filtrar_medicos(_desde_posicion(self.__lista_medicos__, 0), especialidad), desde, cantidad)
+
+    def iterar_turnos(self, desde: int = 0, cantidad: int | None = None, matricula: str | None = None,
+                      dni: str | None = None, especialidad: str | None = None,
+                      fecha_desde: datetime | None = None, fecha_hasta: datetime | None = None) -> Iterator[Turno]:
+        if not (matricula or dni or especialidad or fecha_desde or fecha_hasta):
+            return _pagina(self.__turnos__.iterar(desde), 0, cantidad)
+        turnos = filtrar_turnos(self.__turnos__.iterar(), matricula, dni, especialidad, fecha_desde, fecha_hasta)
+        return _pagina(turnos, desde, cantidad)
+
+    # Turnos
+    def agregar_turno(self, turno: Turno) -> None:
+        matricula = turno.obtener_medico().obtener_matricula()
+        self.__turnos__.agregar(turno)
+        self.__ultimo_id_turno__ = max(self.__ultimo_id_turno__, turno.obtener_id())
+        agenda = self.__agendas_medicos__.get(matricula)
+        if agenda is None:
+            agenda = self.__agendas_medicos__[matricula] = ListaPorId(_clave_agenda)
+        agenda.agregar(turno)
+        self.__historias_clinicas__[turno.obtener_paciente().obtener_dni()].agregar_turno(turno)
+
+    def obtener_turno(self, id_turno: int) -> Turno | None:
+        return self.__turnos__.obtener(id_turno)
+
+    def quitar_turno(self, turno: Turno) -> None:
+        # Cada estructura se actualiza por búsqueda binaria o por clave, sin recorrer los demás turnos
+        self.__turnos__.quitar(turno.obtener_id())
+        self.__agendas_medicos__[turno.obtener_medico().obtener_matricula()].quitar(_clave_agenda(turno))
+        self.__historias_clinicas__[turno.obtener_paciente().obtener_dni()].quitar_turno(turno)
+
+    def obtener_ultimo_id_turno(self) -> int:
+        return self.__ultimo_id_turno__
+
+    def obtener_turno_superpuesto(self, matricula: str, inicio: datetime, fin: datetime) -> Turno | None:
+        # Solo el último turno que empieza antes de `fin` puede terminar después de `inicio`: los anteriores
+        # terminan antes que él. Una búsqueda binaria en la agenda alcanza.
+        agenda = self.__agendas_medicos__.get(matricula)
+        turno = agenda.anterior(_clave_fecha(fin)) if agenda is not None else None
+        if turno is not None and turno.obtener_fecha_hora_fin() > inicio:
+            return turno
+        return None
+
+    def obtener_turnos(self) -> list[Turno]:
+        return list(self.__turnos__)
+
+    def obtener_turnos_medico_entre(self, matricula: str, desde: datetime, hasta: datetime) -> list[Turno]:
+        agenda = self.__agendas_medicos__.get(matricula)
+        if agenda is None:
+            return []
+        turnos = agenda.iterar_desde_id(_clave_fecha(desde))
+        return list(takewhile(lambda turno: turno.obtener_fecha_hora() <= hasta, turnos))
+
+    def obtener_proximo_turno_medico(self, matricula: str, desde: datetime) -> Turno | None:
+        agenda = self.__agendas_medicos__.get(matricula)
+        return agenda.siguiente(_clave_fecha(desde)) if agenda is not None else None
+
+    # Recetas e historias clínicas
+    def agregar_receta(self, receta: Receta) -> None:
+        self.__historias_clinicas__[receta.obtener_paciente().obtener_dni()].agregar_receta(receta)
+
+    def obtener_historia_clinica(self, dni: str) -> HistoriaClinica:
+        return self.__historias_clinicas__[dni]
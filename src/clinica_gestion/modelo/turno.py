@@ -1,13 +1,26 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from .paciente import Paciente
 from .medico import Medico
+from .nombres import ESPECIALIDADES
+from .fechas import MINUTOS_TURNO
 
 class Turno:
-    def __init__(self, paciente: Paciente, medico: Medico, fecha_hora: datetime, nombre_especialidad: str):
+    __slots__ = ("__id__", "__paciente__", "__medico__", "__fecha_hora__", "__nombre_especialidad_atendida__",
+                 "__minutos__")
+
+    def __init__(self, paciente: Paciente, medico: Medico, fecha_hora: datetime, nombre_especialidad: str,
+                 id_turno: int | None = None, minutos: int = MINUTOS_TURNO):
+        # Lo asigna la clínica al agendarlo y no cambia aunque el turno se reprograme
+        self.__id__: int | None = id_turno
         self.__paciente__: Paciente = paciente
         self.__medico__: Medico = medico
         self.__fecha_hora__: datetime = fecha_hora
-        self.__nombre_especialidad_atendida__: str = nombre_especialidad
+        self.__nombre_especialidad_atendida__: str = ESPECIALIDADES.canonico(nombre_especialidad)
+        # El turno ocupa la agenda del médico desde fecha_hora hasta fecha_hora + minutos (sin incluir el final)
+        self.__minutos__: int = minutos
+
+    def obtener_id(self) -> int | None:
+        return self.__id__
 
     def obtener_paciente(self) -> Paciente:
         return self.__paciente__
@@ -18,15 +31,23 @@ class Turno:
     def obtener_fecha_hora(self) -> datetime:
         return self.__fecha_hora__
 
+    def obtener_minutos(self) -> int:
+        return self.__minutos__
+
+    def obtener_fecha_hora_fin(self) -> datetime:
+        return self.__fecha_hora__ + timedelta(minutes=self.__minutos__)
+
     def obtener_especialidad_atendida(self) -> str:
         return self.__nombre_especialidad_atendida__
 
     def __str__(self) -> str:
         return (
             f"Turno(\n"
+            f"  ID: {self.__id__},\n"
             f"  Paciente: {str(self.__paciente__)},\n"
             f"  {str(self.__medico__)},\n"
             f"  {str(self.__fecha_hora__)},\n"
+            f"  Duración: {self.__minutos__} minutos,\n"
             f"  {self.__nombre_especialidad_atendida__}\n"
             f")"
         )
\ No newline at end of file
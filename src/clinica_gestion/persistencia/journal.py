@@ -0,0 +1,253 @@
+import json
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from typing import TextIO
+from src.clinica_gestion.modelo.clinica import Clinica
+from src.clinica_gestion.modelo.especialidad import Especialidad
+from src.clinica_gestion.modelo.fechas import MINUTOS_TURNO
+from src.clinica_gestion.modelo.medico import Medico
+from src.clinica_gestion.modelo.paciente import Paciente
+from src.clinica_gestion.modelo.receta import Receta
+from src.clinica_gestion.modelo.turno import Turno
+from src.clinica_gestion.persistencia.serializacion import serializar_paciente, deserializar_paciente, \
+    serializar_medico, deserializar_medico, serializar_especialidad, deserializar_especialidad, \
+    serializar_turno, serializar_receta
+
+# json.dumps con argumentos crea un codificador nuevo en cada llamada; se reutiliza uno solo
+CODIFICADOR_JSON = json.JSONEncoder(ensure_ascii=False)
+
+# Cada evento se guarda como una línea JSON: {"seq": n, "op": "<operación>", "datos": {...}}.
+# El snapshot usa el mismo formato: una cabecera con la última secuencia incluida y luego
+# los eventos mínimos para reconstruir el estado completo, de modo que se restaura igual que el journal.
+
+
+class JournalClinica:
+    ARCHIVO_JOURNAL = "journal.jsonl"
+    ARCHIVO_SNAPSHOT = "snapshot.jsonl"
+    VERSION_SNAPSHOT = 1
+
+    def __init__(self, directorio: str, eventos_por_snapshot: int = 1000, sincronizar: bool = True):
+        self.__directorio__: str = directorio
+        self.__eventos_por_snapshot__: int = eventos_por_snapshot
+        self.__sincronizar__: bool = sincronizar
+        self.__clinica__: Clinica | None = None
+        self.__archivo_journal__: TextIO | None = None
+        self.__secuencia__: int = 0
+        self.__eventos_desde_snapshot__: int = 0
+        # Serializa las escrituras cuando la clínica se usa desde varios hilos (ver Clinica._escritura)
+        self.__bloqueo__: threading.RLock = threading.RLock()
+
+    def obtener_ruta_journal(self) -> str:
+        return os.path.join(self.__directorio__, self.ARCHIVO_JOURNAL)
+
+    def obtener_ruta_snapshot(self) -> str:
+        return os.path.join(self.__directorio__, self.ARCHIVO_SNAPSHOT)
+
+    def obtener_secuencia(self) -> int:
+        return self.__secuencia__
+
+    def obtener_bloqueo(self) -> threading.RLock:
+        return self.__bloqueo__
+
+
+    # Apertura y cierre
+    def abrir(self, clinica: Clinica | None = None) -> Clinica:
+        if self.__clinica__ is not None:
+            raise RuntimeError("El journal ya está abierto.")
+        os.makedirs(self.__directorio__, exist_ok=True)
+        clinica = clinica if clinica is not None else Clinica()
+
+        self.__secuencia__ = self._cargar_snapshot(clinica)
+        self.__eventos_desde_snapshot__ = 0
+        for secuencia, operacion, datos in self._leer_eventos(self.obtener_ruta_journal()):
+            # Los eventos ya incluidos en el snapshot pueden seguir en el journal si hubo una caída al compactar
+            if secuencia <= self.__secuencia__:
+                continue
+            self._aplicar_evento(clinica, operacion, datos)
+            self.__secuencia__ = secuencia
+            self.__eventos_desde_snapshot__ += 1
+
+        self.__archivo_journal__ = open(self.obtener_ruta_journal(), "a", encoding="utf-8")
+        self.__clinica__ = clinica
+        clinica.conectar_journal(self)
+        return clinica
+
+    def cerrar(self, crear_snapshot: bool = True) -> None:
+        with self.__bloqueo__:
+            if self.__clinica__ is None:
+                return
+            if crear_snapshot and self.__eventos_desde_snapshot__ > 0:
+                self.crear_snapshot()
+            self.__clinica__.conectar_journal(None)
+            self.__clinica__ = None
+            self.__archivo_journal__.close()
+            self.__archivo_journal__ = None
+
+
+    # Registro de operaciones (write-ahead: Clinica lo llama antes de aplicar cada cambio)
+    def registrar_paciente(self, paciente: Paciente) -> None:
+        self._registrar("agregar_paciente", serializar_paciente(paciente))
+
+    def registrar_medico(self, medico: Medico) -> None:
+        self._registrar("agregar_medico", serializar_medico(medico))
+
+    def registrar_especialidad(self, matricula_medico: str, especialidad: Especialidad) -> None:
+        datos = {"matricula": matricula_medico}
+        datos.update(serializar_especialidad(especialidad))
+        self._registrar("agregar_especialidad", datos)
+
+    def registrar_turno(self, turno: Turno) -> None:
+        self._registrar("agendar_turno", serializar_turno(turno))
+
+    def registrar_serie_turnos(self, turnos: list[Turno]) -> None:
+        self._registrar("agendar_serie_turnos", {"turnos": [serializar_turno(turno) for turno in turnos]})
+
+    def registrar_cancelacion_turno(self, turno: Turno) -> None:
+        self._registrar("cancelar_turno", {"id": turno.obtener_id()})
+
+    def registrar_reprogramacion_turno(self, turno: Turno) -> None:
+        self._registrar("reprogramar_turno", {"id": turno.obtener_id(), "fecha_hora": turno.obtener_fecha_hora().isoformat()})
+
+    def registrar_receta(self, receta: Receta) -> None:
+        self._registrar("emitir_receta", serializar_receta(receta))
+
+    def _registrar(self, operacion: str, datos: dict) -> None:
+        with self.__bloqueo__:
+            if self.__archivo_journal__ is None:
+                raise RuntimeError("El journal no está abierto.")
+            # Se compacta antes de escribir el nuevo evento: en este punto la clínica ya aplicó todos los anteriores
+            if self.__eventos_desde_snapshot__ >= self.__eventos_por_snapshot__:
+                self.crear_snapshot()
+
+            self.__secuencia__ += 1
+            self._escribir_evento(self.__archivo_journal__, self.__secuencia__, operacion, datos)
+            self.__archivo_journal__.flush()
+            if self.__sincronizar__:
+                os.fsync(self.__archivo_journal__.fileno())
+
+            self.__eventos_desde_snapshot__ += 1
+
+
+    # Snapshots
+    def crear_snapshot(self) -> None:
+        with self.__bloqueo__:
+            if self.__clinica__ is None:
+                raise RuntimeError("El journal no está abierto.")
+            self.escribir_snapshot(self.obtener_ruta_snapshot(), self.__secuencia__, self._eventos_del_estado(self.__clinica__),
+                                   self.__clinica__.obtener_ultimo_id_turno())
+
+            # Todo lo registrado hasta ahora ya está en el snapshot: se vacía el journal
+            self.__archivo_journal__.close()
+            self.__archivo_journal__ = open(self.obtener_ruta_journal(), "w", encoding="utf-8")
+            self.__eventos_desde_snapshot__ = 0
+
+    @classmethod
+    def escribir_snapshot(cls, ruta_snapshot: str, secuencia: int, eventos: Iterable[tuple[str, dict]],
+                          ultimo_id_turno: int = 0) -> None:
+        # Se escribe en un archivo temporal y se reemplaza el anterior de una vez: una caída a mitad
+        # de la escritura deja intacto el snapshot previo. La cabecera guarda el último ID de turno asignado,
+        # para no volver a usar el de un turno cancelado que ya no figura en el snapshot.
+        ruta_temporal = ruta_snapshot + ".tmp"
+        with open(ruta_temporal, "w", encoding="utf-8") as archivo:
+            cabecera = {"version": cls.VERSION_SNAPSHOT, "seq": secuencia, "ultimo_id_turno": ultimo_id_turno}
+            archivo.write(json.dumps(cabecera) + "\n")
+            for operacion, datos in eventos:
+                cls._escribir_evento(archivo, 0, operacion, datos)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(ruta_temporal, ruta_snapshot)
+
+    def _eventos_del_estado(self, clinica: Clinica) -> Iterator[tuple[str, dict]]:
+        pacientes = clinica.obtener_pacientes()
+        for paciente in pacientes:
+            yield "agregar_paciente", serializar_paciente(paciente)
+        for medico in clinica.obtener_medicos():
+            yield "agregar_medico", serializar_medico(medico)
+        for turno in clinica.obtener_turnos():
+            yield "agendar_turno", serializar_turno(turno)
+        for paciente in pacientes:
+            historia = clinica.obtener_historia_clinica(paciente.obtener_dni())
+            # De la más antigua a la más reciente, para conservar el orden entre recetas de igual fecha
+            for receta in reversed(historia.obtener_recetas()):
+                yield "emitir_receta", serializar_receta(receta)
+
+    def _cargar_snapshot(self, clinica: Clinica) -> int:
+        ruta_snapshot = self.obtener_ruta_snapshot()
+        if not os.path.exists(ruta_snapshot):
+            return 0
+
+        with open(ruta_snapshot, encoding="utf-8") as archivo:
+            cabecera = json.loads(archivo.readline())
+            if cabecera.get("version") != self.VERSION_SNAPSHOT:
+                raise ValueError(f"Versión de snapshot no soportada: {cabecera.get('version')}.")
+            for linea in archivo:
+                evento = json.loads(linea)
+                self._aplicar_evento(clinica, evento["op"], evento["datos"])
+        clinica.reservar_ids_turno(cabecera.get("ultimo_id_turno", 0))
+        return cabecera["seq"]
+
+
+    # Lectura y aplicación de eventos
+    def _leer_eventos(self, ruta: str) -> Iterator[tuple[int, str, dict]]:
+        if not os.path.exists(ruta):
+            return
+        bytes_validos = 0
+        with open(ruta, "rb") as archivo:
+            for numero_linea, linea in enumerate(archivo, start=1):
+                try:
+                    if not linea.endswith(b"\n"):
+                        raise ValueError("Línea incompleta.")
+                    evento = json.loads(linea)
+                except ValueError as e:
+                    # Solo la última línea puede estar mal: es una caída durante la escritura y el cambio nunca
+                    # se aplicó. Una línea inválida seguida de otros eventos es un journal dañado, y descartar
+                    # esos eventos en silencio perdería datos.
+                    if archivo.read().strip():
+                        raise ValueError(f"Journal dañado en la línea {numero_linea} de {ruta}: {e}") from e
+                    break
+                bytes_validos += len(linea)
+                yield evento["seq"], evento["op"], evento["datos"]
+        # Se descarta la última línea incompleta para que el próximo evento no quede pegado a ella
+        if bytes_validos < os.path.getsize(ruta):
+            os.truncate(ruta, bytes_validos)
+
+    def _aplicar_evento(self, clinica: Clinica, operacion: str, datos: dict) -> None:
+        if operacion == "agregar_paciente":
+            clinica.agregar_paciente(deserializar_paciente(datos))
+        elif operacion == "agregar_medico":
+            clinica.agregar_medico(deserializar_medico(datos))
+        elif operacion == "agregar_especialidad":
+            clinica.agregar_especialidad(datos["matricula"], deserializar_especialidad(datos))
+        elif operacion == "agendar_turno":
+            clinica.restaurar_turno(
+                datos["dni"], datos["matricula"], datetime.fromisoformat(datos["fecha_hora"]), datos["especialidad"],
+                datos.get("id"), datos.get("minutos", MINUTOS_TURNO),
+            )
+        elif operacion == "agendar_serie_turnos":
+            with clinica.transaccion():
+                for turno in datos["turnos"]:
+                    self._aplicar_evento(clinica, "agendar_turno", turno)
+        elif operacion == "cancelar_turno":
+            clinica.cancelar_turno(datos["id"])
+        elif operacion == "reprogramar_turno":
+            # Sin las reglas de agenda, como al restaurar: la nueva fecha puede haber quedado en el pasado
+            turno = clinica.cancelar_turno(datos["id"])
+            clinica.restaurar_turno(
+                turno.obtener_paciente().obtener_dni(), turno.obtener_medico().obtener_matricula(),
+                datetime.fromisoformat(datos["fecha_hora"]), turno.obtener_especialidad_atendida(), turno.obtener_id(),
+                turno.obtener_minutos(),
+            )
+        elif operacion == "emitir_receta":
+            clinica.emitir_receta(
+                datos["dni"], datos["matricula"], datos["medicamentos"], datetime.fromisoformat(datos["fecha"])
+            )
+        else:
+            raise ValueError(f"Operación desconocida en el journal: '{operacion}'.")
+
+    @staticmethod
+    def _escribir_evento(archivo: TextIO, secuencia: int, operacion: str, datos: dict) -> None:
+        # encode() usa el codificador en C; json.dump escribiría el evento de a fragmentos, mucho más lento
+        archivo.write(CODIFICADOR_JSON.encode({"seq": secuencia, "op": operacion, "datos": datos}) + "\n")
+
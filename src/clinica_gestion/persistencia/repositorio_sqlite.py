@@ -0,0 +1,402 @@
+import json
+import sqlite3
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from functools import wraps
+from src.clinica_gestion.modelo.especialidad import Especialidad
+from src.clinica_gestion.modelo.fechas import MINUTOS_TURNO
+from src.clinica_gestion.modelo.historia_clinica import HistoriaClinica
+from src.clinica_gestion.modelo.medico import Medico
+from src.clinica_gestion.modelo.paciente import Paciente
+from src.clinica_gestion.modelo.receta import Receta
+from src.clinica_gestion.modelo.repositorio import RepositorioClinica
+from src.clinica_gestion.modelo.turno import Turno
+
+# Las fechas se guardan como texto de ancho fijo, así el orden alfabético coincide con el cronológico
+FORMATO_FECHA = "%Y-%m-%d %H:%M:%S.%f"
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS pacientes (
+    dni TEXT PRIMARY KEY,
+    nombre TEXT NOT NULL,
+    fecha_nacimiento TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS medicos (
+    matricula TEXT PRIMARY KEY,
+    nombre TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS especialidades (
+    id INTEGER PRIMARY KEY,
+    matricula TEXT NOT NULL REFERENCES medicos (matricula),
+    tipo TEXT NOT NULL,
+    dias TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_especialidades_matricula ON especialidades (matricula);
+CREATE TABLE IF NOT EXISTS turnos (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    dni TEXT NOT NULL REFERENCES pacientes (dni),
+    matricula TEXT NOT NULL REFERENCES medicos (matricula),
+    fecha_hora TEXT NOT NULL,
+    especialidad TEXT NOT NULL,
+    minutos INTEGER NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_turnos_medico_fecha ON turnos (matricula, fecha_hora);
+CREATE INDEX IF NOT EXISTS idx_turnos_paciente_fecha ON turnos (dni, fecha_hora);
+CREATE TABLE IF NOT EXISTS recetas (
+    id INTEGER PRIMARY KEY,
+    dni TEXT NOT NULL REFERENCES pacientes (dni),
+    matricula TEXT NOT NULL REFERENCES medicos (matricula),
+    medicamentos TEXT NOT NULL,
+    fecha TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_recetas_paciente_fecha ON recetas (dni, fecha);
+"""
+
+
+def _sincronizado(metodo: Callable) -> Callable:
+    # La conexión se comparte entre hilos: cada operación (consulta y lectura de sus filas) se hace bajo el lock
+    @wraps(metodo)
+    def envoltura(self, *args, **kwargs):
+        with self.__bloqueo__:
+            return metodo(self, *args, **kwargs)
+    return envoltura
+
+
+def _donde(condiciones: list[str]) -> str:
+    # Las condiciones son fragmentos fijos con parámetros "?": el texto SQL no depende de los valores buscados
+    return " WHERE " + " AND ".join(condiciones) if condiciones else ""
+
+
+def _limite(cantidad: int | None) -> int:
+    # En SQLite LIMIT -1 significa sin límite
+    return -1 if cantidad is None else cantidad
+
+
+class RepositorioSQLite(RepositorioClinica):
+    # Todas las consultas usan parámetros con texto SQL constante, por lo que sqlite3 reutiliza
+    # las sentencias preparadas de su caché en lugar de compilarlas en cada llamada.
+
+    def __init__(self, ruta: str = ":memory:"):
+        self.__conexion__: sqlite3.Connection = sqlite3.connect(ruta, isolation_level=None, check_same_thread=False)
+        self.__bloqueo__: threading.RLock = threading.RLock()
+        self.__conexion__.execute("PRAGMA foreign_keys = ON")
+        # lower() de SQLite solo convierte letras ASCII; los filtros por nombre usan casefold de Python
+        self.__conexion__.create_function("casefold", 1, str.casefold, deterministic=True)
+        if ruta != ":memory:":
+            self.__conexion__.execute("PRAGMA journal_mode = WAL")
+            self.__conexion__.execute("PRAGMA synchronous = NORMAL")
+        self.__conexion__.executescript(ESQUEMA)
+        self._migrar_duracion_turnos()
+        self.__profundidad_transaccion__: int = 0
+
+    def _migrar_duracion_turnos(self) -> None:
+        # Las bases creadas antes de guardar la duración de los turnos: los turnos existentes duran lo estándar
+        columnas = {fila[1] for fila in self.__conexion__.execute("PRAGMA table_info(turnos)")}
+        if "minutos" not in columnas:
+            self.__conexion__.execute(f"ALTER TABLE turnos ADD COLUMN minutos INTEGER NOT NULL DEFAULT {MINUTOS_TURNO}")
+
+    @_sincronizado
+    def cerrar(self) -> None:
+        self.__conexion__.close()
+
+    @contextmanager
+    def transaccion(self) -> Iterator[None]:
+        # Las transacciones anidadas se unen a la externa: solo la más externa confirma. Cada una anidada es un
+        # savepoint, así un error dentro de ella deshace solo sus propias escrituras aunque la externa siga.
+        # El lock se mantiene durante toda la transacción para que otros hilos no intercalen sentencias.
+        with self.__bloqueo__:
+            profundidad = self.__profundidad_transaccion__
+            self.__conexion__.execute("BEGIN" if profundidad == 0 else f"SAVEPOINT nivel_{profundidad}")
+            self.__profundidad_transaccion__ += 1
+            try:
+                yield
+            except BaseException:
+                self.__profundidad_transaccion__ -= 1
+                if profundidad == 0:
+                    self.__conexion__.execute("ROLLBACK")
+                else:
+                    self.__conexion__.execute(f"ROLLBACK TO nivel_{profundidad}")
+                    self.__conexion__.execute(f"RELEASE nivel_{profundidad}")
+                raise
+            else:
+                self.__profundidad_transaccion__ -= 1
+                self.__conexion__.execute("COMMIT" if profundidad == 0 else f"RELEASE nivel_{profundidad}")
+
+
+    # Pacientes
+    @_sincronizado
+    def agregar_paciente(self, paciente: Paciente) -> None:
+        self.__conexion__.execute(
+            "INSERT INTO pacientes (dni, nombre, fecha_nacimiento) VALUES (?, ?, ?)",
+            (paciente.obtener_dni(), paciente.obtener_nombre(), paciente.obtener_fecha_nacimiento()),
+        )
+
+    @_sincronizado
+    def obtener_paciente(self, dni: str) -> Paciente | None:
+        fila = self.__conexion__.execute(
+            "SELECT nombre, dni, fecha_nacimiento FROM pacientes WHERE dni = ?", (dni,)
+        ).fetchone()
+        return Paciente(*fila) if fila is not None else None
+
+    @_sincronizado
+    def obtener_pacientes(self) -> list[Paciente]:
+        filas = self.__conexion__.execute("SELECT nombre, dni, fecha_nacimiento FROM pacientes ORDER BY rowid")
+        return [Paciente(*fila) for fila in filas]
+
+
+    # Médicos
+    @_sincronizado
+    def agregar_medico(self, medico: Medico) -> None:
+        matricula = medico.obtener_matricula()
+        with self.transaccion():
+            self.__conexion__.execute(
+                "INSERT INTO medicos (matricula, nombre) VALUES (?, ?)", (matricula, medico.obtener_nombre())
+            )
+            for especialidad in medico.obtener_especialidades():
+                self._insertar_especialidad(matricula, especialidad)
+
+    @_sincronizado
+    def obtener_medico(self, matricula: str) -> Medico | None:
+        fila = self.__conexion__.execute(
+            "SELECT nombre, matricula FROM medicos WHERE matricula = ?", (matricula,)
+        ).fetchone()
+        return self._crear_medico(*fila) if fila is not None else None
+
+    @_sincronizado
+    def obtener_medicos(self) -> list[Medico]:
+        filas = self.__conexion__.execute("SELECT nombre, matricula FROM medicos ORDER BY rowid").fetchall()
+        return [self._crear_medico(*fila) for fila in filas]
+
+    @_sincronizado
+    def agregar_especialidad(self, medico: Medico, especialidad: Especialidad) -> None:
+        self._insertar_especialidad(medico.obtener_matricula(), especialidad)
+        medico.agregar_especialidad(especialidad)
+
+    def _insertar_especialidad(self, matricula: str, especialidad: Especialidad) -> None:
+        self.__conexion__.execute(
+            "INSERT INTO especialidades (matricula, tipo, dias) VALUES (?, ?, ?)",
+            (matricula, especialidad.obtener_especialidad(), json.dumps(especialidad.obtener_dias(), ensure_ascii=False)),
+        )
+
+    def _crear_medico(self, nombre: str, matricula: str) -> Medico:
+        medico = Medico(nombre, matricula)
+        filas = self.__conexion__.execute(
+            "SELECT tipo, dias FROM especialidades WHERE matricula = ? ORDER BY id", (matricula,)
+        )
+        for tipo, dias in filas.fetchall():
+            medico.agregar_especialidad(Especialidad(tipo, json.loads(dias)))
+        return medico
+
+
+    # Turnos
+    @_sincronizado
+    def agregar_turno(self, turno: Turno) -> None:
+        self.__conexion__.execute(
+            "INSERT INTO turnos (id, dni, matricula, fecha_hora, especialidad, minutos) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                turno.obtener_id(),
+                turno.obtener_paciente().obtener_dni(),
+                turno.obtener_medico().obtener_matricula(),
+                turno.obtener_fecha_hora().strftime(FORMATO_FECHA),
+                turno.obtener_especialidad_atendida(),
+                turno.obtener_minutos(),
+            ),
+        )
+
+    @_sincronizado
+    def obtener_turno(self, id_turno: int) -> Turno | None:
+        filas = self.__conexion__.execute(
+            "SELECT id, dni, matricula, fecha_hora, especialidad, minutos FROM turnos WHERE id = ?", (id_turno,)
+        ).fetchall()
+        turnos = self._crear_turnos(filas)
+        return turnos[0] if turnos else None
+
+    @_sincronizado
+    def quitar_turno(self, turno: Turno) -> None:
+        self.__conexion__.execute("DELETE FROM turnos WHERE id = ?", (turno.obtener_id(),))
+
+    @_sincronizado
+    def reemplazar_turno(self, anterior: Turno, nuevo: Turno) -> None:
+        self.__conexion__.execute(
+            "UPDATE turnos SET dni = ?, matricula = ?, fecha_hora = ?, especialidad = ?, minutos = ? WHERE id = ?",
+            (
+                nuevo.obtener_paciente().obtener_dni(),
+                nuevo.obtener_medico().obtener_matricula(),
+                nuevo.obtener_fecha_hora().strftime(FORMATO_FECHA),
+                nuevo.obtener_especialidad_atendida(),
+                nuevo.obtener_minutos(),
+                anterior.obtener_id(),
+            ),
+        )
+
+    @_sincronizado
+    def obtener_ultimo_id_turno(self) -> int:
+        # Con AUTOINCREMENT SQLite recuerda el mayor ID usado aunque ese turno se haya borrado;
+        # las bases creadas antes de usarlo no tienen esa tabla y solo cuentan los turnos existentes
+        ultimo = self.__conexion__.execute("SELECT COALESCE(MAX(id), 0) FROM turnos").fetchone()[0]
+        try:
+            fila = self.__conexion__.execute("SELECT seq FROM sqlite_sequence WHERE name = 'turnos'").fetchone()
+        except sqlite3.OperationalError:
+            fila = None
+        return max(ultimo, fila[0]) if fila is not None else ultimo
+
+    @_sincronizado
+    def obtener_turno_superpuesto(self, matricula: str, inicio: datetime, fin: datetime) -> Turno | None:
+        # Como en memoria, alcanza con el último turno del médico que empieza antes de `fin`, que el índice
+        # (matricula, fecha_hora) encuentra sin recorrer la agenda. El turno completo se arma solo si se superpone.
+        fila = self.__conexion__.execute(
+            "SELECT id, fecha_hora, minutos FROM turnos "
+            "WHERE matricula = ? AND fecha_hora < ? ORDER BY fecha_hora DESC LIMIT 1",
+            (matricula, fin.strftime(FORMATO_FECHA)),
+        ).fetchone()
+        if fila is None:
+            return None
+        id_turno, fecha_hora, minutos = fila
+        if datetime.strptime(fecha_hora, FORMATO_FECHA) + timedelta(minutes=minutos) <= inicio:
+            return None
+        return self.obtener_turno(id_turno)
+
+    @_sincronizado
+    def obtener_turnos(self) -> list[Turno]:
+        filas = self.__conexion__.execute(
+            "SELECT id, dni, matricula, fecha_hora, especialidad, minutos FROM turnos ORDER BY id"
+        ).fetchall()
+        return self._crear_turnos(filas)
+
+    @_sincronizado
+    def obtener_turnos_medico_entre(self, matricula: str, desde: datetime, hasta: datetime) -> list[Turno]:
+        filas = self.__conexion__.execute(
+            "SELECT id, dni, matricula, fecha_hora, especialidad, minutos FROM turnos "
+            "WHERE matricula = ? AND fecha_hora BETWEEN ? AND ? ORDER BY fecha_hora",
+            (matricula, desde.strftime(FORMATO_FECHA), hasta.strftime(FORMATO_FECHA)),
+        ).fetchall()
+        return self._crear_turnos(filas)
+
+    @_sincronizado
+    def obtener_proximo_turno_medico(self, matricula: str, desde: datetime) -> Turno | None:
+        filas = self.__conexion__.execute(
+            "SELECT id, dni, matricula, fecha_hora, especialidad, minutos FROM turnos "
+            "WHERE matricula = ? AND fecha_hora >= ? ORDER BY fecha_hora LIMIT 1",
+            (matricula, desde.strftime(FORMATO_FECHA)),
+        ).fetchall()
+        turnos = self._crear_turnos(filas)
+        return turnos[0] if turnos else None
+
+    # Listados paginados: la página se arma con LIMIT/OFFSET y se lee completa bajo el lock,
+    # así el iterador que se devuelve no retiene la conexión
+    @_sincronizado
+    def iterar_pacientes(self, desde: int = 0, cantidad: int | None = None, nombre: str | None = None) -> Iterator[Paciente]:
+        condiciones, parametros = [], []
+        if nombre:
+            condiciones.append("instr(casefold(nombre), ?) > 0")
+            parametros.append(nombre.casefold())
+        filas = self.__conexion__.execute(
+            "SELECT nombre, dni, fecha_nacimiento FROM pacientes" + _donde(condiciones) + " ORDER BY rowid LIMIT ? OFFSET ?",
+            (*parametros, _limite(cantidad), desde),
+        ).fetchall()
+        return iter([Paciente(*fila) for fila in filas])
+
+    @_sincronizado
+    def iterar_medicos(self, desde: int = 0, cantidad: int | None = None, especialidad: str | None = None) -> Iterator[Medico]:
+        condiciones, parametros = [], []
+        if especialidad:
+            condiciones.append("matricula IN (SELECT matricula FROM especialidades WHERE tipo = ?)")
+            parametros.append(especialidad)
+        filas = self.__conexion__.execute(
+            "SELECT nombre, matricula FROM medicos" + _donde(condiciones) + " ORDER BY rowid LIMIT ? OFFSET ?",
+            (*parametros, _limite(cantidad), desde),
+        ).fetchall()
+        return iter([self._crear_medico(*fila) for fila in filas])
+
+    @_sincronizado
+    def iterar_turnos(self, desde: int = 0, cantidad: int | None = None, matricula: str | None = None,
+                      dni: str | None = None, especialidad: str | None = None,
+                      fecha_desde: datetime | None = None, fecha_hasta: datetime | None = None) -> Iterator[Turno]:
+        condiciones, parametros = [], []
+        for condicion, valor in (("matricula = ?", matricula), ("dni = ?", dni), ("especialidad = ?", especialidad)):
+            if valor:
+                condiciones.append(condicion)
+                parametros.append(valor)
+        if fecha_desde is not None:
+            condiciones.append("fecha_hora >= ?")
+            parametros.append(fecha_desde.strftime(FORMATO_FECHA))
+        if fecha_hasta is not None:
+            condiciones.append("fecha_hora <= ?")
+            parametros.append(fecha_hasta.strftime(FORMATO_FECHA))
+        filas = self.__conexion__.execute(
+            "SELECT id, dni, matricula, fecha_hora, especialidad, minutos FROM turnos" + _donde(condiciones) + " ORDER BY id LIMIT ? OFFSET ?",
+            (*parametros, _limite(cantidad), desde),
+        ).fetchall()
+        return iter(self._crear_turnos(filas))
+
+    def _crear_turnos(self, filas: list[tuple[int, str, str, str, str, int]]) -> list[Turno]:
+        # Cada paciente y médico se reconstruye una sola vez por consulta
+        pacientes: dict[str, Paciente] = {}
+        medicos: dict[str, Medico] = {}
+        turnos = []
+        for id_turno, dni, matricula, fecha_hora, especialidad, minutos in filas:
+            if dni not in pacientes:
+                pacientes[dni] = self.obtener_paciente(dni)
+            if matricula not in medicos:
+                medicos[matricula] = self.obtener_medico(matricula)
+            turnos.append(
+                Turno(
+                    pacientes[dni], medicos[matricula], datetime.strptime(fecha_hora, FORMATO_FECHA), especialidad,
+                    id_turno, minutos,
+                )
+            )
+        return turnos
+
+
+    # Recetas e historias clínicas
+    @_sincronizado
+    def agregar_receta(self, receta: Receta) -> None:
+        self.__conexion__.execute(
+            "INSERT INTO recetas (dni, matricula, medicamentos, fecha) VALUES (?, ?, ?, ?)",
+            (
+                receta.obtener_paciente().obtener_dni(),
+                receta.obtener_medico().obtener_matricula(),
+                json.dumps(receta.obtener_medicamentos(), ensure_ascii=False),
+                receta.obtener_fecha_emision().strftime(FORMATO_FECHA),
+            ),
+        )
+
+    @_sincronizado
+    def iterar_recetas(self) -> Iterator[Receta]:
+        # Una sola consulta en lugar de armar la historia de cada paciente
+        filas = self.__conexion__.execute("SELECT dni, matricula, medicamentos, fecha FROM recetas ORDER BY fecha, id").fetchall()
+        pacientes: dict[str, Paciente] = {}
+        medicos: dict[str, Medico] = {}
+        recetas = []
+        for dni, matricula, medicamentos, fecha in filas:
+            if dni not in pacientes:
+                pacientes[dni] = self.obtener_paciente(dni)
+            if matricula not in medicos:
+                medicos[matricula] = self.obtener_medico(matricula)
+            recetas.append(Receta(pacientes[dni], medicos[matricula], json.loads(medicamentos), datetime.strptime(fecha, FORMATO_FECHA)))
+        return iter(recetas)
+
+    @_sincronizado
+    def obtener_historia_clinica(self, dni: str) -> HistoriaClinica:
+        paciente = self.obtener_paciente(dni)
+        historia = HistoriaClinica(paciente)
+
+        filas_turnos = self.__conexion__.execute(
+            "SELECT id, dni, matricula, fecha_hora, especialidad, minutos FROM turnos WHERE dni = ? ORDER BY fecha_hora, id", (dni,)
+        ).fetchall()
+        for turno in self._crear_turnos(filas_turnos):
+            historia.agregar_turno(turno)
+
+        medicos: dict[str, Medico] = {}
+        filas_recetas = self.__conexion__.execute(
+            "SELECT matricula, medicamentos, fecha FROM recetas WHERE dni = ? ORDER BY fecha, id", (dni,)
+        ).fetchall()
+        for matricula, medicamentos, fecha in filas_recetas:
+            if matricula not in medicos:
+                medicos[matricula] = self.obtener_medico(matricula)
+            historia.agregar_receta(
+                Receta(paciente, medicos[matricula], json.loads(medicamentos), datetime.strptime(fecha, FORMATO_FECHA))
+            )
+        return historia
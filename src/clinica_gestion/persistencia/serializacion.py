@@ -0,0 +1,79 @@
+from src.clinica_gestion.modelo.especialidad import Especialidad
+from src.clinica_gestion.modelo.historia_clinica import HistoriaClinica
+from src.clinica_gestion.modelo.medico import Medico
+from src.clinica_gestion.modelo.paciente import Paciente
+from src.clinica_gestion.modelo.receta import Receta
+from src.clinica_gestion.modelo.turno import Turno
+
+# Conversión entre los objetos del modelo y diccionarios compatibles con JSON.
+# La usan el journal (persistencia/journal.py) y el servidor (servicio/servidor.py).
+# Turnos y recetas referencian al paciente y al médico por DNI y matrícula; las fechas van en ISO 8601.
+
+
+def serializar_paciente(paciente: Paciente) -> dict:
+    return {
+        "nombre": paciente.obtener_nombre(),
+        "dni": paciente.obtener_dni(),
+        "fecha_nacimiento": paciente.obtener_fecha_nacimiento(),
+    }
+
+
+def deserializar_paciente(datos: dict) -> Paciente:
+    return Paciente(datos["nombre"], datos["dni"], datos["fecha_nacimiento"])
+
+
+def serializar_especialidad(especialidad: Especialidad) -> dict:
+    return {"tipo": especialidad.obtener_especialidad(), "dias": especialidad.obtener_dias()}
+
+
+def deserializar_especialidad(datos: dict) -> Especialidad:
+    # Un texto en "dias" se recorrería letra por letra: se exige la lista de días
+    tipo, dias = datos["tipo"], datos["dias"]
+    if not isinstance(tipo, str):
+        raise ValueError("El tipo de la especialidad debe ser un texto.")
+    if not isinstance(dias, list) or not all(isinstance(dia, str) for dia in dias):
+        raise ValueError(f"Los días de la especialidad '{tipo}' deben ser una lista de textos, por ejemplo [\"lunes\"].")
+    return Especialidad(tipo, dias)
+
+
+def serializar_medico(medico: Medico) -> dict:
+    return {
+        "nombre": medico.obtener_nombre(),
+        "matricula": medico.obtener_matricula(),
+        "especialidades": [serializar_especialidad(esp) for esp in medico.obtener_especialidades()],
+    }
+
+
+def deserializar_medico(datos: dict) -> Medico:
+    medico = Medico(datos["nombre"], datos["matricula"])
+    for especialidad in datos.get("especialidades", []):
+        medico.agregar_especialidad(deserializar_especialidad(especialidad))
+    return medico
+
+
+def serializar_turno(turno: Turno) -> dict:
+    return {
+        "id": turno.obtener_id(),
+        "dni": turno.obtener_paciente().obtener_dni(),
+        "matricula": turno.obtener_medico().obtener_matricula(),
+        "fecha_hora": turno.obtener_fecha_hora().isoformat(),
+        "especialidad": turno.obtener_especialidad_atendida(),
+        "minutos": turno.obtener_minutos(),
+    }
+
+
+def serializar_receta(receta: Receta) -> dict:
+    return {
+        "dni": receta.obtener_paciente().obtener_dni(),
+        "matricula": receta.obtener_medico().obtener_matricula(),
+        "medicamentos": receta.obtener_medicamentos(),
+        "fecha": receta.obtener_fecha_emision().isoformat(),
+    }
+
+
+def serializar_historia_clinica(paciente: Paciente, historia: HistoriaClinica) -> dict:
+    return {
+        "paciente": serializar_paciente(paciente),
+        "turnos": [serializar_turno(turno) for turno in historia.obtener_turnos()],
+        "recetas": [serializar_receta(receta) for receta in historia.obtener_recetas()],
+    }
@@ -0,0 +1,75 @@
+import asyncio
+import json
+from collections import deque
+from src.clinica_gestion.modelo.excepciones import ServicioClinicaException
+
+
+class ClienteClinica:
+    # Cliente del protocolo de servicio/servidor.py. Varias llamadas concurrentes a solicitar() comparten
+    # la conexión sin esperarse entre sí: el servidor responde en orden, así que cada respuesta
+    # corresponde a la solicitud pendiente más antigua.
+
+    def __init__(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        self.__lector__: asyncio.StreamReader = lector
+        self.__escritor__: asyncio.StreamWriter = escritor
+        self.__pendientes__: deque[tuple[int, asyncio.Future]] = deque()
+        self.__proximo_id__: int = 1
+        self.__receptor__: asyncio.Task = asyncio.create_task(self._recibir())
+
+    @classmethod
+    async def conectar_tcp(cls, host: str, puerto: int) -> "ClienteClinica":
+        lector, escritor = await asyncio.open_connection(host, puerto)
+        return cls(lector, escritor)
+
+    @classmethod
+    async def conectar_unix(cls, ruta: str) -> "ClienteClinica":
+        lector, escritor = await asyncio.open_unix_connection(ruta)
+        return cls(lector, escritor)
+
+    async def cerrar(self) -> None:
+        self.__escritor__.close()
+        try:
+            await self.__escritor__.wait_closed()
+        except ConnectionError:
+            pass
+        await self.__receptor__
+
+    async def solicitar(self, operacion: str, **argumentos) -> object:
+        if self.__receptor__.done():
+            raise ConnectionError("La conexión con el servidor está cerrada.")
+        id_solicitud = self.__proximo_id__
+        self.__proximo_id__ += 1
+        respuesta = asyncio.get_running_loop().create_future()
+        self.__pendientes__.append((id_solicitud, respuesta))
+
+        linea = json.dumps({"id": id_solicitud, "op": operacion, "args": argumentos}, ensure_ascii=False) + "\n"
+        self.__escritor__.write(linea.encode("utf-8"))
+        await self.__escritor__.drain()
+        return await respuesta
+
+    async def _recibir(self) -> None:
+        error = ConnectionError("El servidor cerró la conexión.")
+        try:
+            while linea := await self.__lector__.readline():
+                datos = json.loads(linea)
+                if not self.__pendientes__ or datos.get("id") != self.__pendientes__[0][0]:
+                    raise ConnectionError(f"Respuesta inesperada del servidor: {linea!r}.")
+                _, respuesta = self.__pendientes__.popleft()
+                if respuesta.done():
+                    # El que la pidió la canceló o dejó de esperarla (por ejemplo, con wait_for): se descarta
+                    continue
+                if datos["ok"]:
+                    respuesta.set_result(datos.get("resultado"))
+                else:
+                    respuesta.set_exception(ServicioClinicaException(datos["error"]["tipo"], datos["error"]["mensaje"]))
+        except Exception as e:
+            error = e
+        finally:
+            # Las solicitudes que quedaron sin respuesta fallan en lugar de esperar para siempre
+            self._cancelar_pendientes(error)
+
+    def _cancelar_pendientes(self, error: Exception) -> None:
+        while self.__pendientes__:
+            _, respuesta = self.__pendientes__.popleft()
+            if not respuesta.done():
+                respuesta.set_exception(error)
@@ -0,0 +1,270 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from src.clinica_gestion.modelo.busqueda import LIMITE_RESULTADOS
+from src.clinica_gestion.modelo.clinica import Clinica
+from src.clinica_gestion.modelo.excepciones import ClinicaException
+from src.clinica_gestion.modelo.fechas import FORMATO_FECHA_HORA, MINUTOS_TURNO, parse_fecha_hora
+from src.clinica_gestion.persistencia.serializacion import serializar_paciente, deserializar_paciente, \
+    serializar_medico, deserializar_medico, deserializar_especialidad, serializar_turno, serializar_receta, \
+    serializar_historia_clinica
+
+# Protocolo: una solicitud JSON por línea y una respuesta JSON por línea, en el mismo orden.
+#   -> {"id": 1, "op": "agendar_turno", "args": {"dni": "...", "matricula": "...", "fecha_hora": "...", "especialidad": "..."}}
+#   <- {"id": 1, "ok": true, "resultado": {...}}
+#   <- {"id": 1, "ok": false, "error": {"tipo": "TurnoOcupadoException", "mensaje": "..."}}
+# El cliente puede enviar varias solicitudes sin esperar las respuestas (pipelining).
+
+
+def _texto(args: dict, clave: str) -> str:
+    # Los argumentos se validan antes de llegar a la clínica: un valor de otro tipo no debe llegar al repositorio
+    valor = args[clave]
+    if not isinstance(valor, str):
+        raise ValueError(f"El argumento '{clave}' debe ser un texto.")
+    return valor
+
+
+def _lista_textos(args: dict, clave: str) -> list[str]:
+    valor = args[clave]
+    if not isinstance(valor, list) or not all(isinstance(elemento, str) for elemento in valor):
+        raise ValueError(f"El argumento '{clave}' debe ser una lista de textos.")
+    return valor
+
+
+def _entero(args: dict, clave: str, por_defecto: int | None = None) -> int:
+    # True/False y 1.9 no se convierten en silencio: solo se aceptan enteros de JSON
+    if por_defecto is not None and clave not in args:
+        return por_defecto
+    valor = args[clave]
+    if not isinstance(valor, int) or isinstance(valor, bool):
+        raise ValueError(f"El argumento '{clave}' debe ser un número entero.")
+    return valor
+
+
+def _fecha_opcional(args: dict, clave: str) -> datetime | None:
+    if not args.get(clave):
+        return None
+    fecha = parse_fecha_hora(_texto(args, clave))
+    if fecha is None:
+        raise ValueError(f"Formato de fecha y hora inválido en '{clave}'. Use YYYY-MM-DD HH:MM.")
+    return fecha
+
+
+class ServidorClinica:
+    # Tamaño máximo de una línea de solicitud; una línea más larga cierra la conexión
+    LIMITE_LINEA = 1024 * 1024
+
+    def __init__(self, clinica: Clinica, hilos: int = 1, max_pendientes: int = 64):
+        # Las operaciones se ejecutan en un pool de hilos para que la escritura del journal a disco no frene
+        # el loop. Con un solo hilo se ejecutan de a una; con más, la clínica debe ser concurrente.
+        if hilos > 1 and not clinica.es_concurrente():
+            raise ValueError("Para atender solicitudes en varios hilos la clínica debe crearse con concurrente=True.")
+        self.__clinica__: Clinica = clinica
+        self.__ejecutor__: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=hilos, thread_name_prefix="clinica")
+        # Solicitudes leídas y todavía sin responder por conexión: al llegar al límite se deja de leer
+        # del socket, y el cliente queda frenado por el control de flujo de TCP
+        self.__max_pendientes__: int = max_pendientes
+        self.__servidores__: list[asyncio.Server] = []
+        # Conexiones abiertas (tarea que la atiende -> escritor), para poder cerrarlas al detener el servidor
+        self.__conexiones__: dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+    # Inicio y cierre
+    async def iniciar_tcp(self, host: str = "127.0.0.1", puerto: int = 0) -> asyncio.Server:
+        servidor = await asyncio.start_server(self._atender_conexion, host, puerto, limit=self.LIMITE_LINEA)
+        self.__servidores__.append(servidor)
+        return servidor
+
+    async def iniciar_unix(self, ruta: str) -> asyncio.Server:
+        servidor = await asyncio.start_unix_server(self._atender_conexion, ruta, limit=self.LIMITE_LINEA)
+        self.__servidores__.append(servidor)
+        return servidor
+
+    async def detener(self) -> None:
+        # Deja de aceptar conexiones, cierra las abiertas (las solicitudes ya leídas se terminan de ejecutar)
+        # y espera a que terminen de atenderse
+        for servidor in self.__servidores__:
+            servidor.close()
+            await servidor.wait_closed()
+        self.__servidores__.clear()
+        for escritor in self.__conexiones__.values():
+            escritor.close()
+        await asyncio.gather(*self.__conexiones__, return_exceptions=True)
+        self.__ejecutor__.shutdown(wait=True)
+
+
+    # Conexiones
+    async def _atender_conexion(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter) -> None:
+        self.__conexiones__[asyncio.current_task()] = escritor
+        pendientes: asyncio.Queue[bytes | Exception | None] = asyncio.Queue(maxsize=self.__max_pendientes__)
+        respondedor = asyncio.create_task(self._responder(pendientes, escritor))
+        try:
+            while True:
+                try:
+                    linea = await lector.readline()
+                except ValueError:
+                    await pendientes.put(ValueError(f"La solicitud supera el máximo de {self.LIMITE_LINEA} bytes."))
+                    break
+                except ConnectionError:
+                    break
+                if not linea:
+                    break
+                if linea.strip():
+                    await pendientes.put(linea)
+        finally:
+            await pendientes.put(None)
+            await respondedor
+            escritor.close()
+            try:
+                await escritor.wait_closed()
+            except ConnectionError:
+                pass
+            del self.__conexiones__[asyncio.current_task()]
+
+    async def _responder(self, pendientes: asyncio.Queue, escritor: asyncio.StreamWriter) -> None:
+        # Las solicitudes de una conexión se ejecutan en orden, así una alta enviada antes que un turno
+        # siempre se aplica primero aunque el cliente no haya esperado la respuesta
+        loop = asyncio.get_running_loop()
+        conectado = True
+        while (solicitud := await pendientes.get()) is not None:
+            respuesta = await loop.run_in_executor(self.__ejecutor__, self.procesar_linea, solicitud)
+            if not conectado:
+                # Se siguen consumiendo las solicitudes para que la lectura no quede bloqueada en la cola
+                continue
+            try:
+                escritor.write(respuesta)
+                await escritor.drain()
+            except ConnectionError:
+                conectado = False
+
+
+    # Solicitudes
+    def procesar_linea(self, linea: bytes | Exception) -> bytes:
+        id_solicitud = None
+        try:
+            if isinstance(linea, Exception):
+                raise linea
+            try:
+                solicitud = json.loads(linea)
+            except ValueError as e:
+                raise ValueError(f"JSON inválido: {e}")
+            if not isinstance(solicitud, dict):
+                raise ValueError("Cada solicitud debe ser un objeto JSON.")
+            id_solicitud = solicitud.get("id")
+            argumentos = solicitud.get("args", {})
+            if not isinstance(argumentos, dict):
+                raise ValueError("El campo 'args' debe ser un objeto JSON.")
+            respuesta = {"id": id_solicitud, "ok": True, "resultado": self.ejecutar(solicitud.get("op"), argumentos)}
+        except KeyError as e:
+            respuesta = self._respuesta_error(id_solicitud, "SolicitudInvalida", f"Falta el argumento {e}.")
+        except (ClinicaException, ValueError, TypeError) as e:
+            respuesta = self._respuesta_error(id_solicitud, type(e).__name__, str(e))
+        except Exception as e:
+            # Último recurso, como en el menú: un error inesperado se responde y la conexión sigue atendiendo
+            respuesta = self._respuesta_error(id_solicitud, "ErrorInesperado", f"{type(e).__name__}: {e}")
+        return (json.dumps(respuesta, ensure_ascii=False) + "\n").encode("utf-8")
+
+    def _respuesta_error(self, id_solicitud: object, tipo: str, mensaje: str) -> dict:
+        return {"id": id_solicitud, "ok": False, "error": {"tipo": tipo, "mensaje": mensaje}}
+
+    def ejecutar(self, operacion: str, argumentos: dict) -> object:
+        metodo = getattr(self, f"_op_{operacion}", None) if isinstance(operacion, str) else None
+        if metodo is None:
+            raise ValueError(f"Operación desconocida: '{operacion}'.")
+        return metodo(argumentos)
+
+
+    # Operaciones
+    def _op_ping(self, args: dict) -> str:
+        return "pong"
+
+    def _op_metricas(self, args: dict) -> dict:
+        return self.__clinica__.metricas()
+
+    def _op_agregar_paciente(self, args: dict) -> dict:
+        for clave in ("nombre", "dni", "fecha_nacimiento"):
+            _texto(args, clave)
+        paciente = deserializar_paciente(args)
+        self.__clinica__.agregar_paciente(paciente)
+        return serializar_paciente(paciente)
+
+    def _op_obtener_paciente(self, args: dict) -> dict:
+        return serializar_paciente(self.__clinica__.obtener_paciente_por_matricula(_texto(args, "dni")))
+
+    def _op_obtener_pacientes(self, args: dict) -> list[dict]:
+        return [serializar_paciente(paciente) for paciente in self.__clinica__.obtener_pacientes()]
+
+    def _op_buscar_pacientes(self, args: dict) -> list[dict]:
+        pacientes = self.__clinica__.buscar_pacientes(_texto(args, "texto"), _entero(args, "limite", LIMITE_RESULTADOS))
+        return [serializar_paciente(paciente) for paciente in pacientes]
+
+    def _op_agregar_medico(self, args: dict) -> dict:
+        for clave in ("nombre", "matricula"):
+            _texto(args, clave)
+        medico = deserializar_medico(args)
+        self.__clinica__.agregar_medico(medico)
+        return serializar_medico(medico)
+
+    def _op_agregar_especialidad(self, args: dict) -> dict:
+        self.__clinica__.agregar_especialidad(_texto(args, "matricula"), deserializar_especialidad(args))
+        return serializar_medico(self.__clinica__.obtener_medico_por_matricula(args["matricula"]))
+
+    def _op_obtener_medico(self, args: dict) -> dict:
+        return serializar_medico(self.__clinica__.obtener_medico_por_matricula(_texto(args, "matricula")))
+
+    def _op_obtener_medicos(self, args: dict) -> list[dict]:
+        return [serializar_medico(medico) for medico in self.__clinica__.obtener_medicos()]
+
+    def _op_buscar_medicos(self, args: dict) -> list[dict]:
+        medicos = self.__clinica__.buscar_medicos(_texto(args, "texto"), _entero(args, "limite", LIMITE_RESULTADOS))
+        return [serializar_medico(medico) for medico in medicos]
+
+    def _op_buscar_proximo_turno_libre(self, args: dict) -> list[dict]:
+        libres = self.__clinica__.buscar_proximo_turno_libre(
+            _texto(args, "especialidad"), _fecha_opcional(args, "desde"), _entero(args, "minutos_turno", MINUTOS_TURNO),
+            _entero(args, "cantidad", 1),
+        )
+        return [
+            {"fecha_hora": horario.strftime(FORMATO_FECHA_HORA), "medico": serializar_medico(medico)}
+            for horario, medico in libres
+        ]
+
+    def _op_agendar_turno(self, args: dict) -> dict:
+        turno = self.__clinica__.agendar_turno(
+            _texto(args, "dni"), _texto(args, "matricula"), _texto(args, "fecha_hora"), _texto(args, "especialidad"),
+            _entero(args, "minutos", MINUTOS_TURNO),
+        )
+        return serializar_turno(turno)
+
+    def _op_agendar_serie_turnos(self, args: dict) -> list[dict]:
+        turnos = self.__clinica__.agendar_serie_turnos(
+            _texto(args, "dni"), _texto(args, "matricula"), _texto(args, "fecha_hora"), _texto(args, "especialidad"),
+            _entero(args, "cantidad"), _entero(args, "dias_entre_turnos", 7), _entero(args, "minutos", MINUTOS_TURNO),
+        )
+        return [serializar_turno(turno) for turno in turnos]
+
+    def _op_cancelar_turno(self, args: dict) -> dict:
+        return serializar_turno(self.__clinica__.cancelar_turno(_entero(args, "id")))
+
+    def _op_reprogramar_turno(self, args: dict) -> dict:
+        return serializar_turno(self.__clinica__.reprogramar_turno(_entero(args, "id"), _texto(args, "fecha_hora")))
+
+    def _op_obtener_turnos(self, args: dict) -> list[dict]:
+        return [serializar_turno(turno) for turno in self.__clinica__.obtener_turnos()]
+
+    def _op_emitir_receta(self, args: dict) -> dict:
+        receta = self.__clinica__.emitir_receta(
+            _texto(args, "dni"), _texto(args, "matricula"), _lista_textos(args, "medicamentos")
+        )
+        return serializar_receta(receta)
+
+    def _op_obtener_pacientes_con_medicamento(self, args: dict) -> list[dict]:
+        pacientes = self.__clinica__.obtener_pacientes_con_medicamento(
+            _texto(args, "medicamento"), _fecha_opcional(args, "desde"), _fecha_opcional(args, "hasta")
+        )
+        return [serializar_paciente(paciente) for paciente in pacientes]
+
+    def _op_obtener_historia_clinica(self, args: dict) -> dict:
+        dni = _texto(args, "dni")
+        paciente = self.__clinica__.obtener_paciente_por_matricula(dni)
+        return serializar_historia_clinica(paciente, self.__clinica__.obtener_historia_clinica(dni))
@@ -1,4 +1,5 @@
 import unittest
+from datetime import datetime
 from unittest.mock import patch, MagicMock
 
 from src.clinica_gestion.cli.interfaz_cli import CLI
@@ -51,17 +52,41 @@ class TestInterfazCLI(unittest.TestCase):
         with self.assertRaises(PacienteDuplicadoException):
             self.cli._opcion_agregar_paciente()
 
+    @patch('builtins.input', return_value="")
     @patch('builtins.print')
-    def test_opcion_listar_pacientes_vacio(self, mock_print):
-        self.clinica_mock.obtener_pacientes.return_value = []
+    def test_opcion_listar_pacientes_vacio(self, mock_print, mock_input):
+        self.clinica_mock.iterar_pacientes.return_value = iter([])
         self.cli._opcion_listar_pacientes()
         mock_print.assert_any_call("No hay pacientes registrados.")
 
+    @patch('builtins.input', return_value="")
     @patch('builtins.print')
-    def test_opcion_listar_pacientes_con_pacientes(self, mock_print):
-        self.clinica_mock.obtener_pacientes.return_value = [self.paciente1]
+    def test_opcion_listar_pacientes_con_pacientes(self, mock_print, mock_input):
+        self.clinica_mock.iterar_pacientes.return_value = iter([self.paciente1])
         self.cli._opcion_listar_pacientes()
-        mock_print.assert_any_call(self.paciente1)
+        self.clinica_mock.iterar_pacientes.assert_called_once_with(0, CLI.TAMANIO_PAGINA + 1, None)
+        mock_print.assert_any_call(f"{self.paciente1}\n[1-1]")
+
+    @patch('builtins.input', side_effect=['nombre="Ignacio García" cantidad=2', "", "q"])
+    @patch('builtins.print')
+    def test_opcion_listar_pacientes_paginado(self, mock_print, mock_input):
+        paciente2 = Paciente("Ignacio Gómez", "22222222", "02/02/1982")
+        self.clinica_mock.iterar_pacientes.side_effect = [
+            iter([self.paciente1, paciente2, self.paciente1]),
+            iter([self.paciente1, paciente2, paciente2]),
+        ]
+        self.cli._opcion_listar_pacientes()
+        # Se pide un elemento más que el tamaño de la página para saber si hay otra después
+        self.assertEqual(self.clinica_mock.iterar_pacientes.call_args_list[0].args, (0, 3, "Ignacio García"))
+        self.assertEqual(self.clinica_mock.iterar_pacientes.call_args_list[1].args, (2, 3, "Ignacio García"))
+        mock_print.assert_any_call(f"{self.paciente1}\n{paciente2}\n[1-2, hay más]")
+        mock_print.assert_any_call(f"{self.paciente1}\n{paciente2}\n[3-4, hay más]")
+
+    @patch('builtins.input', return_value="apellido=García")
+    @patch('builtins.print')
+    def test_opcion_listar_pacientes_filtro_desconocido(self, mock_print, mock_input):
+        with self.assertRaises(ValueError):
+            self.cli._opcion_listar_pacientes()
 
     @patch('builtins.input', side_effect=["Dr. Smith", "MED123", "n"])
     @patch('builtins.print')
@@ -116,18 +141,30 @@ class TestInterfazCLI(unittest.TestCase):
         with self.assertRaises(MedicoDuplicadoException):
             self.cli._opcion_agregar_medico()
 
+    @patch('builtins.input', return_value="")
     @patch('builtins.print')
-    def test_opcion_listar_medicos_vacio(self, mock_print):
-        self.clinica_mock.obtener_medicos.return_value = []
+    def test_opcion_listar_medicos_vacio(self, mock_print, mock_input):
+        self.clinica_mock.iterar_medicos.return_value = iter([])
         self.cli._opcion_listar_medicos()
         mock_print.assert_any_call("No hay médicos registrados.")
 
+    @patch('builtins.input', return_value="")
     @patch('builtins.print')
-    def test_opcion_listar_medicos_con_medicos(self, mock_print):
-        self.clinica_mock.obtener_medicos.return_value = [self.medico1]
+    def test_opcion_listar_medicos_con_medicos(self, mock_print, mock_input):
+        self.clinica_mock.iterar_medicos.return_value = iter([self.medico1])
         self.cli._opcion_listar_medicos()
-        mock_print.assert_any_call(f"- {self.medico1.obtener_nombre()} (Matrícula: {self.medico1.obtener_matricula()})")
-        mock_print.assert_any_call(f"    Especialidades: [{str(self.especialidad1)}]")
+        mock_print.assert_any_call("Dr. Lawrence Jacoby (MAT001) | Cardiología\n[1-1]")
+
+    @patch('builtins.input', return_value="especialidad=Cardiología detalle")
+    @patch('builtins.print')
+    def test_opcion_listar_medicos_detalle(self, mock_print, mock_input):
+        self.clinica_mock.iterar_medicos.return_value = iter([self.medico1])
+        self.cli._opcion_listar_medicos()
+        self.clinica_mock.iterar_medicos.assert_called_once_with(0, CLI.TAMANIO_PAGINA + 1, "Cardiología")
+        mock_print.assert_any_call(
+            f"- {self.medico1.obtener_nombre()} (Matrícula: {self.medico1.obtener_matricula()})\n"
+            f"    Especialidades: [{str(self.especialidad1)}]\n[1-1]"
+        )
 
 
     @patch('builtins.input', side_effect=["MAT001", "Pediatría", "jueves,viernes"])
@@ -140,8 +177,9 @@ class TestInterfazCLI(unittest.TestCase):
         self.cli._opcion_agregar_especialidad_a_medico()
 
         self.clinica_mock.obtener_medico_por_matricula.assert_called_once_with("MAT001")
-        mock_medico_existente.agregar_especialidad.assert_called_once()
-        especialidad_arg = mock_medico_existente.agregar_especialidad.call_args[0][0]
+        self.clinica_mock.agregar_especialidad.assert_called_once()
+        self.assertEqual(self.clinica_mock.agregar_especialidad.call_args[0][0], "MAT001")
+        especialidad_arg = self.clinica_mock.agregar_especialidad.call_args[0][1]
         self.assertIsInstance(especialidad_arg, Especialidad)
         self.assertEqual(especialidad_arg.obtener_especialidad(), "Pediatría")
         self.assertIn("jueves", especialidad_arg.__dias__)
@@ -160,8 +198,8 @@ class TestInterfazCLI(unittest.TestCase):
 
         mock_print.assert_any_call("Advertencia: Día 'dia_malo' no reconocido y será ignorado.")
 
-        mock_medico_existente.agregar_especialidad.assert_called_once()
-        especialidad_arg = mock_medico_existente.agregar_especialidad.call_args[0][0]
+        self.clinica_mock.agregar_especialidad.assert_called_once()
+        especialidad_arg = self.clinica_mock.agregar_especialidad.call_args[0][1]
 
         self.assertIsInstance(especialidad_arg, Especialidad)
         self.assertEqual("Neurología", especialidad_arg.obtener_especialidad())
@@ -179,7 +217,7 @@ class TestInterfazCLI(unittest.TestCase):
         self.cli._opcion_agregar_especialidad_a_medico()
 
         mock_print.assert_any_call("No se ingresaron días válidos para la especialidad. No se agregará.")
-        mock_medico_existente.agregar_especialidad.assert_not_called()
+        self.clinica_mock.agregar_especialidad.assert_not_called()
 
 
     @patch('builtins.input', side_effect=["NONEXISTENT_MAT"])
@@ -189,7 +227,7 @@ class TestInterfazCLI(unittest.TestCase):
             self.cli._opcion_agregar_especialidad_a_medico()
 
 
-    @patch('builtins.input', side_effect=["12345678", "MED123", "2023-06-15 10:00", "Cardiología"])
+    @patch('builtins.input', side_effect=["12345678", "MED123", "2023-06-15 10:00", "Cardiología", ""])
     @patch('builtins.print')
     def test_opcion_agendar_turno(self, mock_print, mock_input):
         turno_mock = MagicMock(spec=Turno)
@@ -199,49 +237,49 @@ class TestInterfazCLI(unittest.TestCase):
         self.cli._opcion_agendar_turno()
 
         self.clinica_mock.agendar_turno.assert_called_once_with(
-            "12345678", "MED123", "2023-06-15 10:00", "Cardiología"
+            "12345678", "MED123", "2023-06-15 10:00", "Cardiología", 30
         )
         mock_print.assert_any_call("\n¡Turno agendado exitosamente!\n")
         mock_print.assert_any_call("Turno:\nDetalles del turno mock")
 
-    @patch('builtins.input', side_effect=["12345678", "MED123", "2023-06-15 10:00", "Cardiología"])
+    @patch('builtins.input', side_effect=["12345678", "MED123", "2023-06-15 10:00", "Cardiología", ""])
     def test_opcion_agendar_turno_duplicado_raises_exception(self, mock_input):
         self.clinica_mock.agendar_turno.side_effect = TurnoOcupadoException("Turno ocupado")
         with self.assertRaises(TurnoOcupadoException):
             self.cli._opcion_agendar_turno()
 
-    @patch('builtins.input', side_effect=["DNI_NO_EXISTE", "MED123", "2023-06-15 10:00", "Cardiología"])
+    @patch('builtins.input', side_effect=["DNI_NO_EXISTE", "MED123", "2023-06-15 10:00", "Cardiología", ""])
     def test_opcion_agendar_turno_paciente_no_encontrado_raises_exception(self, mock_input):
         self.clinica_mock.agendar_turno.side_effect = PacienteNoEncontradoException("Paciente no existe")
         with self.assertRaises(PacienteNoEncontradoException):
             self.cli._opcion_agendar_turno()
 
-    @patch('builtins.input', side_effect=["12345678", "MAT_NO_EXISTE", "2023-06-15 10:00", "Cardiología"])
+    @patch('builtins.input', side_effect=["12345678", "MAT_NO_EXISTE", "2023-06-15 10:00", "Cardiología", ""])
     def test_opcion_agendar_turno_medico_no_encontrado_raises_exception(self, mock_input):
         self.clinica_mock.agendar_turno.side_effect = MedicoNoEncontradoException("Médico no existe")
         with self.assertRaises(MedicoNoEncontradoException):
             self.cli._opcion_agendar_turno()
 
-    @patch('builtins.input', side_effect=["12345678", "MED123", "2023-06-15 10:00", "EspecialidadRara"])
+    @patch('builtins.input', side_effect=["12345678", "MED123", "2023-06-15 10:00", "EspecialidadRara", ""])
     def test_opcion_agendar_turno_especialidad_no_valida_raises_exception(self, mock_input):
         self.clinica_mock.agendar_turno.side_effect = EspecialidadNoValidaParaDiaException("Especialidad no válida")
         with self.assertRaises(EspecialidadNoValidaParaDiaException):
             self.cli._opcion_agendar_turno()
 
-    @patch('builtins.input', side_effect=["12345678", "MED123", "2023-06-15 10:00", "Cardiología"])
+    @patch('builtins.input', side_effect=["12345678", "MED123", "2023-06-15 10:00", "Cardiología", ""])
     def test_opcion_agendar_turno_medico_no_disponible_raises_exception(self, mock_input):
         self.clinica_mock.agendar_turno.side_effect = MedicoNoDisponibleException("Médico no disponible ese día")
         with self.assertRaises(MedicoNoDisponibleException):
             self.cli._opcion_agendar_turno()
 
-    @patch('builtins.input', side_effect=["12345678", "MED123", "2000-01-01 10:00", "Cardiología"]) # Past date
+    @patch('builtins.input', side_effect=["12345678", "MED123", "2000-01-01 10:00", "Cardiología", ""]) # Past date
     def test_opcion_agendar_turno_fecha_pasada_raises_exception(self, mock_input):
         # Assuming Clinica.agendar_turno raises ValueError for past dates
         self.clinica_mock.agendar_turno.side_effect = ValueError("No se pueden agendar turnos en el pasado.")
         with self.assertRaises(ValueError):
             self.cli._opcion_agendar_turno()
 
-    @patch('builtins.input', side_effect=["12345678", "MED123", "FECHA_INVALIDA", "Cardiología"])
+    @patch('builtins.input', side_effect=["12345678", "MED123", "FECHA_INVALIDA", "Cardiología", ""])
     def test_opcion_agendar_turno_fecha_formato_invalido_raises_exception(self, mock_input):
         # Assuming Clinica.agendar_turno raises ValueError for invalid format
         self.clinica_mock.agendar_turno.side_effect = ValueError("Formato de fecha y hora inválido.")
@@ -249,19 +287,85 @@ class TestInterfazCLI(unittest.TestCase):
             self.cli._opcion_agendar_turno()
 
 
+    @patch('builtins.input', return_value="")
     @patch('builtins.print')
-    def test_opcion_listar_turnos_vacio(self, mock_print):
-        self.clinica_mock.obtener_turnos.return_value = []
+    def test_opcion_listar_turnos_vacio(self, mock_print, mock_input):
+        self.clinica_mock.iterar_turnos.return_value = iter([])
         self.cli._opcion_listar_turnos()
         mock_print.assert_any_call("No hay turnos agendados.")
 
+    @patch('builtins.input', return_value="medico=MAT002")
+    @patch('builtins.print')
+    def test_opcion_listar_turnos_sin_resultados_para_el_filtro(self, mock_print, mock_input):
+        self.clinica_mock.iterar_turnos.return_value = iter([])
+        self.cli._opcion_listar_turnos()
+        mock_print.assert_any_call("No hay resultados para los filtros indicados.")
+
+    @patch('builtins.input', side_effect=["12345678", "MAT001", "2030-01-07 10:00", "Cardiología", "2", "", ""])
     @patch('builtins.print')
-    def test_opcion_listar_turnos_con_turnos(self, mock_print):
+    def test_opcion_agendar_serie_turnos(self, mock_print, mock_input):
+        self.clinica_mock.agendar_serie_turnos.return_value = [
+            Turno(self.paciente1, self.medico1, datetime(2030, 1, 7, 10, 0), "Cardiología", 1),
+            Turno(self.paciente1, self.medico1, datetime(2030, 1, 14, 10, 0), "Cardiología", 2),
+        ]
+        self.cli._opcion_agendar_serie_turnos()
+        self.clinica_mock.agendar_serie_turnos.assert_called_once_with(
+            "12345678", "MAT001", "2030-01-07 10:00", "Cardiología", 2, 7, 30
+        )
+        impreso = mock_print.call_args_list[-1].args[0]
+        self.assertTrue(impreso.startswith("\n¡2 turnos agendados exitosamente!\n#1 | 2030-01-07 10:00"))
+        self.assertIn("#2 | 2030-01-14 10:00", impreso)
+
+    @patch('builtins.input', side_effect=["7"])
+    @patch('builtins.print')
+    def test_opcion_cancelar_turno(self, mock_print, mock_input):
+        self.clinica_mock.cancelar_turno.return_value = Turno(
+            self.paciente1, self.medico1, datetime(2030, 1, 7, 10, 0), "Cardiología", 7
+        )
+        self.cli._opcion_cancelar_turno()
+        self.clinica_mock.cancelar_turno.assert_called_once_with(7)
+        mock_print.assert_any_call(
+            "Turno 7 cancelado: #7 | 2030-01-07 10:00 | Cardiología | Dr. Lawrence Jacoby (MAT001) | Ignacio García (DNI 12345678)"
+        )
+
+    @patch('builtins.input', side_effect=["siete"])
+    def test_opcion_cancelar_turno_id_invalido(self, mock_input):
+        with self.assertRaises(ValueError):
+            self.cli._opcion_cancelar_turno()
+        self.clinica_mock.cancelar_turno.assert_not_called()
+
+    @patch('builtins.input', side_effect=["7", "2030-01-14 10:00"])
+    @patch('builtins.print')
+    def test_opcion_reprogramar_turno(self, mock_print, mock_input):
+        turno_mock = MagicMock(spec=Turno)
+        turno_mock.__str__.return_value = "Detalles del turno mock"
+        self.clinica_mock.reprogramar_turno.return_value = turno_mock
+        self.cli._opcion_reprogramar_turno()
+        self.clinica_mock.reprogramar_turno.assert_called_once_with(7, "2030-01-14 10:00")
+        mock_print.assert_any_call("Turno:\nDetalles del turno mock")
+
+    @patch('builtins.input', return_value="")
+    @patch('builtins.print')
+    def test_opcion_listar_turnos_con_turnos(self, mock_print, mock_input):
+        turno = Turno(self.paciente1, self.medico1, datetime(2030, 1, 7, 10, 0), "Cardiología", 7)
+        self.clinica_mock.iterar_turnos.return_value = iter([turno])
+        self.cli._opcion_listar_turnos()
+        mock_print.assert_any_call(
+            "#7 | 2030-01-07 10:00 | Cardiología | Dr. Lawrence Jacoby (MAT001) | Ignacio García (DNI 12345678)\n[1-1]"
+        )
+
+    @patch('builtins.input', return_value="paciente=12345678 fecha_desde=2030-01-01 fecha_hasta=2030-01-31 detalle")
+    @patch('builtins.print')
+    def test_opcion_listar_turnos_con_filtros_y_detalle(self, mock_print, mock_input):
         turno_mock = MagicMock(spec=Turno)
         turno_mock.__str__.return_value = "Detalles del Turno 1"
-        self.clinica_mock.obtener_turnos.return_value = [turno_mock]
+        self.clinica_mock.iterar_turnos.return_value = iter([turno_mock])
         self.cli._opcion_listar_turnos()
-        mock_print.assert_any_call(turno_mock)
+        self.clinica_mock.iterar_turnos.assert_called_once_with(
+            0, CLI.TAMANIO_PAGINA + 1, None, "12345678", None,
+            datetime(2030, 1, 1), datetime(2030, 1, 31, 23, 59, 59, 999999),
+        )
+        mock_print.assert_any_call("Detalles del Turno 1\n[1-1]")
 
 
     @patch('builtins.input', side_effect=["12345678", "MED123", "Paracetamol", "Ibuprofeno", ""])
@@ -318,5 +422,57 @@ class TestInterfazCLI(unittest.TestCase):
             self.cli._opcion_ver_historia_clinica()
 
 
+    @patch('src.clinica_gestion.cli.interfaz_cli.ImportadorClinica')
+    @patch('builtins.input', side_effect=["pacientes", "pacientes.csv"])
+    @patch('builtins.print')
+    def test_opcion_importar_desde_archivo(self, mock_print, mock_input, mock_importador):
+        resultado_mock = MagicMock()
+        resultado_mock.__str__.return_value = "Filas procesadas: 2"
+        resultado_mock.obtener_errores.return_value = []
+        resultado_mock.obtener_cantidad_errores.return_value = 0
+        mock_importador.return_value.importar_pacientes_desde_archivo.return_value = resultado_mock
+
+        self.cli._opcion_importar_desde_archivo()
+
+        mock_importador.assert_called_once_with(self.clinica_mock)
+        mock_importador.return_value.importar_pacientes_desde_archivo.assert_called_once_with("pacientes.csv")
+        mock_print.assert_any_call("\nImportación finalizada. Filas procesadas: 2")
+
+    @patch('builtins.input', side_effect=["turnos"])
+    @patch('builtins.print')
+    def test_opcion_importar_desde_archivo_tipo_invalido(self, mock_print, mock_input):
+        self.cli._opcion_importar_desde_archivo()
+        mock_print.assert_any_call("Tipo de importación no válido. Use 'pacientes' o 'medicos'.")
+
+
+    @patch('builtins.input', return_value="  jacoby ")
+    @patch('builtins.print')
+    def test_opcion_buscar_por_nombre(self, mock_print, mock_input):
+        self.clinica_mock.buscar_pacientes.return_value = []
+        self.clinica_mock.buscar_medicos.return_value = [self.medico1]
+        self.cli._opcion_buscar_por_nombre()
+        self.clinica_mock.buscar_pacientes.assert_called_once_with("jacoby", CLI.TAMANIO_PAGINA)
+        mock_print.assert_any_call(
+            "Pacientes:\n  Sin coincidencias.\nMédicos:\n  Dr. Lawrence Jacoby (MAT001) | Cardiología"
+        )
+
+    @patch('builtins.input', side_effect=["Cardiología", "2030-01-07 08:00"])
+    @patch('builtins.print')
+    def test_opcion_buscar_turnos_libres(self, mock_print, mock_input):
+        self.clinica_mock.buscar_proximo_turno_libre.return_value = [(datetime(2030, 1, 7, 8, 30), self.medico1)]
+        self.cli._opcion_buscar_turnos_libres()
+        self.clinica_mock.buscar_proximo_turno_libre.assert_called_once_with(
+            "Cardiología", datetime(2030, 1, 7, 8, 0), cantidad=CLI.TURNOS_LIBRES_MOSTRADOS
+        )
+        mock_print.assert_any_call(
+            "2030-01-07 08:30 | Dr. Lawrence Jacoby (MAT001)\nPara reservar uno, use la opción 3 con esa fecha y matrícula."
+        )
+
+    @patch('builtins.input', side_effect=["Cardiología", "mañana"])
+    def test_opcion_buscar_turnos_libres_fecha_invalida(self, mock_input):
+        with self.assertRaises(ValueError):
+            self.cli._opcion_buscar_turnos_libres()
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
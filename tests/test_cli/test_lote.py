@@ -0,0 +1,108 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from src.clinica_gestion.cli.interfaz_cli import CLI
+from src.clinica_gestion.cli.lote import leer_comandos
+from src.clinica_gestion.modelo.clinica import Clinica
+from src.clinica_gestion.modelo.excepciones import TurnoOcupadoException
+
+
+class TestLeerComandos(unittest.TestCase):
+
+    def test_formatos_por_linea(self):
+        comandos = list(leer_comandos([
+            "# comentario",
+            "1|Juan Pérez|12345678|01/01/1990",
+            "",
+            "agendar_turno|12345678|MAT001|2030-01-07 10:00|Pediatría",
+            '{"opcion": 7}',
+            '{"opcion": "5", "valores": ["12345678", "MAT001", "Ibuprofeno", ""]}',
+        ]))
+        self.assertEqual(comandos, [
+            (2, ("1", ["Juan Pérez", "12345678", "01/01/1990"])),
+            (4, ("agendar_turno", ["12345678", "MAT001", "2030-01-07 10:00", "Pediatría"])),
+            (5, ("7", [])),
+            (6, ("5", ["12345678", "MAT001", "Ibuprofeno", ""])),
+        ])
+
+    def test_lineas_invalidas(self):
+        comandos = list(leer_comandos(['{"opcion": ', '{"valores": []}', '{"opcion": "1", "valores": "x"}']))
+        self.assertEqual([numero for numero, _ in comandos], [1, 2, 3])
+        self.assertTrue(all(isinstance(comando, ValueError) for _, comando in comandos))
+
+
+class TestEjecutarLote(unittest.TestCase):
+
+    def setUp(self):
+        self.clinica = Clinica()
+        self.cli = CLI(self.clinica)
+        hoy = datetime.now()
+        proximo_lunes = hoy + timedelta(days=(7 - hoy.weekday()) % 7 or 7)
+        self.fecha_lunes_str = proximo_lunes.strftime("%Y-%m-%d 10:00")
+        self.alta = [
+            "1|Juan Pérez|12345678|01/01/1990",
+            "agregar_medico|Dr. House|MAT001|s|Clínica Médica|lunes,martes|n",
+        ]
+
+    @patch('builtins.input')
+    @patch('builtins.print')
+    def test_ejecuta_sin_pausas_y_acumula_la_salida(self, mock_print, mock_input):
+        salida = []
+        resultado = self.cli.ejecutar_lote(leer_comandos(self.alta + [
+            f"3|12345678|MAT001|{self.fecha_lunes_str}|Clínica Médica",
+            "5|12345678|MAT001|Ibuprofeno|Paracetamol|",
+        ]), salida)
+
+        self.assertEqual(resultado.obtener_correctos(), 4)
+        self.assertEqual(resultado.obtener_cantidad_errores(), 0)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+        receta = self.clinica.obtener_historia_clinica("12345678").obtener_recetas()[0]
+        self.assertEqual(receta.obtener_medicamentos(), ["Ibuprofeno", "Paracetamol"])
+        self.assertIn("Paciente Juan Pérez (DNI: 12345678) agregado exitosamente.", salida)
+        mock_input.assert_not_called()
+        mock_print.assert_not_called()
+
+    def test_errores_por_comando(self):
+        resultado = self.cli.ejecutar_lote(leer_comandos(self.alta + [
+            f"3|12345678|MAT001|{self.fecha_lunes_str}|Clínica Médica",
+            f"3|12345678|MAT001|{self.fecha_lunes_str}|Clínica Médica",
+            "3|12345678|MAT001",
+            "8||sobra",
+            "99",
+            '{"opcion": ',
+            "9",
+        ]))
+
+        self.assertEqual(resultado.obtener_correctos(), 5)
+        self.assertEqual(resultado.obtener_cantidad_errores(), 4)
+        errores = resultado.obtener_errores()
+        self.assertEqual([error.obtener_numero_linea() for error in errores], [4, 5, 7, 8])
+        self.assertIsInstance(errores[0].obtener_error(), TurnoOcupadoException)
+        self.assertIn("Faltan valores", str(errores[1].obtener_error()))
+        self.assertIn("Opción desconocida", str(errores[2].obtener_error()))
+        # Los valores sobrantes no deshacen el comando: se informan como advertencia
+        self.assertEqual(resultado.obtener_cantidad_advertencias(), 1)
+        self.assertIn("Línea 6 (8. Listar Pacientes): sobraron valores", resultado.obtener_advertencias()[0])
+        self.assertEqual(resultado.obtener_por_opcion()["3. Agendar Turno"][:2], (1, 2))
+        self.assertNotIn("99", resultado.obtener_por_opcion())
+        self.assertIn("Comandos ejecutados: 9, correctos: 5, con error: 4, con advertencias: 1", str(resultado))
+
+    def test_confirma_de_a_bloques(self):
+        self.cli.COMANDOS_POR_TRANSACCION = 2
+        with patch.object(self.clinica, "transaccion", wraps=self.clinica.transaccion) as transaccion:
+            resultado = self.cli.ejecutar_lote(leer_comandos(self.alta + ["8", "9", "7"]))
+        self.assertEqual(resultado.obtener_correctos(), 5)
+        self.assertEqual(transaccion.call_count, 3)
+
+    @patch('builtins.input', side_effect=["8", "", "", "0"])
+    @patch('builtins.print')
+    def test_el_menu_sigue_usando_input_y_print(self, mock_print, mock_input):
+        self.cli.ejecutar_lote(leer_comandos(self.alta))
+        self.cli.iniciar()
+        impresos = [" ".join(str(valor) for valor in llamada.args) for llamada in mock_print.call_args_list]
+        self.assertIn("Juan Pérez, 12345678, 01/01/1990\n[1-1]", impresos)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import builtins
+import os
+import pstats
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from src.clinica_gestion.cli.interfaz_cli import CLI
+from src.clinica_gestion.cli.perfilado import PerfiladorSesion
+from src.clinica_gestion.modelo.clinica import Clinica
+from src.clinica_gestion.modelo.paciente import Paciente
+
+
+class TestPerfiladorSesion(unittest.TestCase):
+
+    def setUp(self):
+        self.clinica = Clinica()
+        self.clinica.agregar_paciente(Paciente("Ignacio García", "12345678", "01/01/1980"))
+        self.perfilador = PerfiladorSesion(self.clinica)
+
+    @patch('builtins.print')
+    def test_tiempo_por_opcion_del_menu(self, mock_print):
+        entradas = iter(["8", "", "", "1", "Juan Pérez", "87654321", "01/01/1990", "", "8", "", "", "0"])
+        with patch('builtins.input', side_effect=lambda *args: next(entradas)):
+            with self.perfilador.sesion():
+                CLI(self.clinica, self.perfilador).iniciar()
+
+        tiempos = self.perfilador.obtener_tiempos()
+        self.assertEqual(set(tiempos), {"8. Listar Pacientes", "1. Agregar Paciente"})
+        self.assertEqual(tiempos["8. Listar Pacientes"].obtener_veces(), 2)
+        self.assertGreater(tiempos["8. Listar Pacientes"].obtener_salida(), 0)
+        self.assertGreater(tiempos["1. Agregar Paciente"].obtener_clinica(), 0)
+        # La sesión habilita las métricas de la clínica para separar el tiempo del modelo
+        self.assertEqual(self.clinica.metricas()["agregar_paciente"]["llamadas"], 1)
+
+    @patch('builtins.print')
+    def test_no_cuenta_la_espera_de_datos_del_usuario(self, mock_print):
+        def entrada_lenta(*args):
+            time.sleep(0.05)
+            return "12345678"
+
+        with patch('builtins.input', side_effect=entrada_lenta):
+            with self.perfilador.sesion():
+                with self.perfilador.opcion("6. Ver Historia Clínica de Paciente"):
+                    self.clinica.obtener_historia_clinica(input("DNI del paciente: "))
+        self.assertLess(self.perfilador.obtener_tiempos()["6. Ver Historia Clínica de Paciente"].obtener_total(), 0.05)
+
+    def test_restaura_input_y_print(self):
+        input_original, print_original = builtins.input, builtins.print
+        with self.assertRaises(EOFError):
+            with self.perfilador.sesion():
+                raise EOFError
+        self.assertIs(builtins.input, input_original)
+        self.assertIs(builtins.print, print_original)
+
+    def test_guardar_informe_y_pstats(self):
+        # pstats escribe el informe con print, así que solo se silencia la sesión
+        with patch('builtins.print'), patch('builtins.input', return_value=""):
+            with self.perfilador.sesion():
+                with self.perfilador.opcion("8. Listar Pacientes"):
+                    CLI(self.clinica)._opcion_listar_pacientes()
+
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta_pstats, ruta_informe = self.perfilador.guardar(os.path.join(directorio, "perfil"))
+            self.assertIn("_opcion_listar_pacientes", str(pstats.Stats(ruta_pstats).stats))
+            with open(ruta_informe, encoding="utf-8") as archivo:
+                informe = archivo.read()
+        self.assertIn("8. Listar Pacientes", informe)
+        self.assertIn("Ordered by: cumulative time", informe)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+from src.clinica_gestion.herramientas.generador import GeneradorClinica
+from src.clinica_gestion.modelo.clinica import Clinica
+from src.clinica_gestion.persistencia.journal import JournalClinica
+from src.clinica_gestion.persistencia.repositorio_sqlite import RepositorioSQLite
+from src.clinica_gestion.persistencia.serializacion import serializar_medico, serializar_paciente, \
+    serializar_receta, serializar_turno
+
+class TestGeneradorClinica(unittest.TestCase):
+
+    def _datos(self, generador: GeneradorClinica) -> tuple[list, list, list, list]:
+        return (
+            [serializar_paciente(p) for p in generador.obtener_pacientes()],
+            [serializar_medico(m) for m in generador.obtener_medicos()],
+            [serializar_turno(t) for t in generador.generar_turnos()],
+            [serializar_receta(r) for r in generador.generar_recetas()],
+        )
+
+    def test_misma_semilla_mismos_datos(self):
+        datos = self._datos(GeneradorClinica(50, 5, 300, 100, semilla=7))
+        self.assertEqual(datos, self._datos(GeneradorClinica(50, 5, 300, 100, semilla=7)))
+        self.assertNotEqual(datos, self._datos(GeneradorClinica(50, 5, 300, 100, semilla=8)))
+
+    def test_cantidad_de_recetas_no_altera_los_turnos(self):
+        turnos = self._datos(GeneradorClinica(50, 5, 300, 10))[2]
+        self.assertEqual(turnos, self._datos(GeneradorClinica(50, 5, 300, 500))[2])
+
+    def test_turnos_validos_y_sin_superposiciones(self):
+        generador = GeneradorClinica(100, 10, 2000, 0)
+        claves = set()
+        for turno in generador.generar_turnos():
+            medico = turno.obtener_medico()
+            fecha_hora = turno.obtener_fecha_hora()
+            self.assertIn(turno.obtener_especialidad_atendida(), medico.obtener_especialidades_para_dia_semana(fecha_hora.weekday()))
+            claves.add((medico.obtener_matricula(), fecha_hora))
+        self.assertEqual(len(claves), 2000)
+
+    def test_poblar_clinica(self):
+        clinica = GeneradorClinica(100, 10, 1000, 200).poblar()
+        self.assertEqual(len(clinica.obtener_pacientes()), 100)
+        self.assertEqual(len(clinica.obtener_medicos()), 10)
+        self.assertEqual(len(clinica.obtener_turnos()), 1000)
+        recetas = sum(len(clinica.obtener_historia_clinica(p.obtener_dni()).obtener_recetas()) for p in clinica.obtener_pacientes())
+        self.assertEqual(recetas, 200)
+
+    def test_poblar_clinica_sqlite(self):
+        repositorio = RepositorioSQLite(":memory:")
+        self.addCleanup(repositorio.cerrar)
+        clinica = GeneradorClinica(50, 5, 300, 50).poblar(Clinica(repositorio))
+        self.assertEqual(len(clinica.obtener_turnos()), 300)
+
+    def test_snapshot_se_abre_con_el_journal(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            generador = GeneradorClinica(80, 6, 500, 120)
+            generador.escribir_snapshot(directorio)
+
+            journal = JournalClinica(directorio, sincronizar=False)
+            clinica = journal.abrir()
+            try:
+                self.assertEqual(len(clinica.obtener_pacientes()), 80)
+                self.assertEqual(len(clinica.obtener_medicos()), 6)
+                self.assertEqual(len(clinica.obtener_turnos()), 500)
+                self.assertEqual(
+                    [serializar_turno(t) for t in clinica.obtener_turnos()],
+                    [serializar_turno(t) for t in generador.generar_turnos()],
+                )
+            finally:
+                journal.cerrar(crear_snapshot=False)
+
+    def test_snapshot_no_pisa_datos_existentes(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            open(os.path.join(directorio, JournalClinica.ARCHIVO_JOURNAL), "w").close()
+            with self.assertRaises(FileExistsError):
+                GeneradorClinica(10, 2, 10, 10).escribir_snapshot(directorio)
+
+    def test_cantidades_invalidas(self):
+        with self.assertRaises(ValueError):
+            GeneradorClinica(pacientes=0)
+
+if __name__ == '__main__':
+    unittest.main()
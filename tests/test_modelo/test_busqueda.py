@@ -0,0 +1,149 @@
+import unittest
+from datetime import datetime
+from src.clinica_gestion.modelo.busqueda import IndiceEspecialidades, IndiceMedicamentos, IndiceNombres, normalizar_palabras
+from src.clinica_gestion.modelo.especialidad import Especialidad
+from src.clinica_gestion.modelo.medico import Medico
+from src.clinica_gestion.modelo.paciente import Paciente
+from src.clinica_gestion.modelo.receta import Receta
+
+
+class TestNormalizarPalabras(unittest.TestCase):
+
+    def test_sin_acentos_mayusculas_ni_puntuacion(self):
+        self.assertEqual(normalizar_palabras("Dr. JOSÉ  Pérez-Núñez"), ["dr", "jose", "perez", "nunez"])
+
+
+class TestIndiceNombres(unittest.TestCase):
+
+    def setUp(self):
+        self.pacientes = [
+            Paciente("Juan Pérez", "1", "01/01/1980"),
+            Paciente("Juana Perezoso", "2", "01/01/1980"),
+            Paciente("María Juan", "3", "01/01/1980"),
+            Paciente("Pedro Gómez", "4", "01/01/1980"),
+        ]
+        self.indice = IndiceNombres(lambda: self.pacientes, Paciente.obtener_nombre, Paciente.obtener_dni)
+
+    def _dnis(self, texto: str, limite: int = 20) -> list[str]:
+        return [paciente.obtener_dni() for paciente in self.indice.buscar(texto, limite)]
+
+    def test_prefijos_en_cualquier_orden_y_sin_acentos(self):
+        self.assertEqual(self._dnis("PEREZ juan"), ["1", "2"])
+        self.assertEqual(self._dnis("gom"), ["4"])
+        self.assertEqual(self._dnis("per ju"), ["1", "2"])
+        self.assertEqual(self._dnis("lopez"), [])
+        self.assertEqual(self._dnis("  "), [])
+
+    def test_orden_de_los_resultados(self):
+        # Palabra completa antes que prefijo, y los que empiezan por la palabra buscada antes que el resto
+        self.assertEqual(self._dnis("juan"), ["1", "3", "2"])
+        self.assertEqual(self._dnis("ju", limite=2), ["1", "2"])
+
+    def test_altas_despues_de_construido(self):
+        self.assertEqual(len(self.indice), 4)
+        nuevo = Paciente("Ángel Juárez", "5", "01/01/1980")
+        self.pacientes.append(nuevo)
+        # Un alta que ya vio el origen no se duplica
+        self.indice.agregar(nuevo)
+        self.indice.agregar(Paciente("Angela Ruiz", "6", "01/01/1980"))
+        self.assertEqual(len(self.indice), 6)
+        self.assertEqual(self._dnis("angel"), ["5", "6"])
+
+    def test_altas_antes_de_construido_salen_del_origen(self):
+        self.indice.agregar(self.pacientes[0])
+        self.assertEqual(self._dnis("juan perez"), ["1", "2"])
+        self.assertEqual(len(self.indice), 4)
+
+    def test_error_al_construir_no_deja_indice_a_medias(self):
+        fallar = [True]
+
+        def origen():
+            yield from self.pacientes[:2]
+            if fallar[0]:
+                raise RuntimeError("origen caído")
+            yield from self.pacientes[2:]
+
+        self.indice = IndiceNombres(origen, Paciente.obtener_nombre, Paciente.obtener_dni)
+        for _ in range(2):
+            with self.assertRaises(RuntimeError):
+                self._dnis("juan")
+        fallar[0] = False
+        self.assertEqual(self._dnis("juan"), ["1", "3", "2"])
+        self.assertEqual(len(self.indice), 4)
+
+
+class TestIndiceEspecialidades(unittest.TestCase):
+
+    def setUp(self):
+        self.medicos = []
+        for matricula, dias in (("MAT001", ["lunes", "martes"]), ("MAT002", ["lunes"]), ("MAT003", ["martes"])):
+            medico = Medico(f"Dr. {matricula}", matricula)
+            medico.agregar_especialidad(Especialidad("Pediatría", dias))
+            self.medicos.append(medico)
+
+    def test_error_al_construir_no_deja_indice_a_medias(self):
+        fallar = [True]
+
+        def origen():
+            yield self.medicos[0]
+            if fallar[0]:
+                raise RuntimeError("origen caído")
+            yield from self.medicos[1:]
+
+        indice = IndiceEspecialidades(origen)
+        for _ in range(2):
+            with self.assertRaises(RuntimeError):
+                indice.obtener_matriculas("Pediatría", 0)
+        fallar[0] = False
+        self.assertEqual(indice.obtener_matriculas("Pediatría", 0), ["MAT001", "MAT002"])
+        self.assertEqual(indice.dias_con_atencion("Pediatría"), [0, 1])
+
+
+class TestIndiceMedicamentos(unittest.TestCase):
+
+    def setUp(self):
+        self.paciente = Paciente("Juan Pérez", "1", "01/01/1980")
+        self.medico = Medico("Dr. House", "MAT001")
+        self.recetas = [
+            Receta(self.paciente, self.medico, ["Ibuprofeno 400mg"], datetime(2030, 1, 3)),
+            Receta(self.paciente, self.medico, ["IBUPROFENO 600 mg", "Omeprazol"], datetime(2030, 1, 1)),
+            Receta(self.paciente, self.medico, ["Ibuprofenol"], datetime(2030, 1, 2)),
+        ]
+        self.indice = IndiceMedicamentos(lambda: self.recetas)
+
+    def _fechas(self, recetas: list[Receta]) -> list[int]:
+        return [receta.obtener_fecha_emision().day for receta in recetas]
+
+    def test_por_nombre_completo_o_primeras_palabras(self):
+        self.assertEqual(self._fechas(self.indice.buscar("ibuprofeno")), [3, 1])
+        self.assertEqual(self._fechas(self.indice.buscar("Ibuprofeno 600 MG")), [1])
+        self.assertEqual(self._fechas(self.indice.buscar("ibuprofenol")), [2])
+        self.assertEqual(self.indice.buscar("ibupro"), [])
+
+    def test_rango_de_fechas_y_recetas_nuevas(self):
+        self.indice.buscar("omeprazol")
+        self.indice.agregar(Receta(self.paciente, self.medico, ["Omeprazol 20mg"], datetime(2030, 1, 5)))
+        # Fuera de orden, y una que ya había llegado desde el origen
+        self.indice.agregar(Receta(self.paciente, self.medico, ["Omeprazol"], datetime(2029, 12, 31)))
+        self.indice.agregar(self.recetas[1])
+        self.assertEqual(self._fechas(self.indice.buscar("omeprazol")), [5, 1, 31])
+        self.assertEqual(self._fechas(self.indice.buscar("omeprazol", datetime(2030, 1, 1), datetime(2030, 1, 4))), [1])
+
+    def test_guardar_bajo_el_lock_del_indice(self):
+        self.indice.buscar("omeprazol")
+        receta = Receta(self.paciente, self.medico, ["Omeprazol"], datetime(2030, 1, 1))
+        self.indice.agregar(receta, lambda: self.recetas.append(receta))
+        self.assertIs(self.recetas[-1], receta)
+        self.assertEqual(self._fechas(self.indice.buscar("omeprazol")), [1, 1])
+
+    def test_error_al_construir_no_deja_indice_a_medias(self):
+        self.recetas.append(Receta(self.paciente, self.medico, [None], datetime(2030, 1, 4)))
+        for _ in range(2):
+            with self.assertRaises(TypeError):
+                self.indice.buscar("ibuprofeno")
+        self.recetas.pop()
+        self.assertEqual(self._fechas(self.indice.buscar("ibuprofeno")), [3, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
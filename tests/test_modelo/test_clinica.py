@@ -6,14 +6,19 @@ from src.clinica_gestion.modelo.medico import Medico
 from src.clinica_gestion.modelo.especialidad import Especialidad
 from src.clinica_gestion.modelo.turno import Turno
 from src.clinica_gestion.modelo.receta import Receta
+from src.clinica_gestion.persistencia.repositorio_sqlite import RepositorioSQLite
 from src.clinica_gestion.modelo.excepciones import PacienteDuplicadoException, PacienteNoEncontradoException, \
     MedicoDuplicadoException, MedicoNoEncontradoException, MedicoNoDisponibleException, \
-    EspecialidadNoValidaParaDiaException, TurnoOcupadoException
+    EspecialidadNoValidaParaDiaException, TurnoOcupadoException, TurnoNoEncontradoException, SerieTurnosNoDisponibleException, \
+    RecetaInvalidaException
 
 class TestClinica(unittest.TestCase):
 
+    def crear_clinica(self) -> Clinica:
+        return Clinica()
+
     def setUp(self):
-        self.clinica = Clinica()
+        self.clinica = self.crear_clinica()
 
         self.paciente1 = Paciente("Ignacio García", "12345678", "01/01/1980")
         self.paciente2 = Paciente("Laura Palmer", "87654321", "15/07/1990")
@@ -127,6 +132,19 @@ class TestClinica(unittest.TestCase):
         historia = self.clinica.obtener_historia_clinica("12345678")
         self.assertEqual(len(historia.obtener_recetas()), 1)
 
+    def test_emitir_receta_invalida_no_se_registra(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.emitir_receta("12345678", "MAT001", ["Paracetamol"])
+
+        for medicamentos in ([None], [{"a": 1}], ["Ibuprofeno", "  "], [], "Paracetamol"):
+            with self.subTest(medicamentos=medicamentos):
+                with self.assertRaises(RecetaInvalidaException):
+                    self.clinica.emitir_receta("12345678", "MAT001", medicamentos)
+
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("12345678").obtener_recetas()), 1)
+        self.assertEqual(len(self.clinica.buscar_recetas_por_medicamento("paracetamol")), 1)
+
     def test_agendar_turno(self):
         self.clinica.agregar_paciente(self.paciente1)
         self.clinica.agregar_medico(self.medico1)
@@ -140,6 +158,14 @@ class TestClinica(unittest.TestCase):
         historia = self.clinica.obtener_historia_clinica("12345678")
         self.assertEqual(len(historia.obtener_turnos()), 1)
 
+    def test_agendar_turno_con_nombre_de_especialidad_leido_aparte(self):
+        # El texto ingresado es otro objeto que el de la especialidad del médico: se resuelve por el registro
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        ingresado = "".join(["Psiquia", "tría"])
+        turno = self.clinica.agendar_turno("12345678", "MAT001", self.fecha_lunes_str, ingresado)
+        self.assertIs(turno.obtener_especialidad_atendida(), self.medico1.obtener_especialidades()[0].obtener_especialidad())
+
     def test_agendar_turno_medico_no_disponible(self):
         self.clinica.agregar_paciente(self.paciente1)
         self.clinica.agregar_medico(self.medico1)
@@ -163,3 +189,441 @@ class TestClinica(unittest.TestCase):
 
         with self.assertRaises(TurnoOcupadoException):
             self.clinica.agendar_turno("87654321", "MAT001", self.fecha_lunes_str, "Psiquiatría")
+
+    def test_agendar_turno_mismo_horario_distinto_medico(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.agregar_medico(self.medico1)
+        medico3 = Medico("Dr. Harold Smith", "MAT003")
+        medico3.agregar_especialidad(Especialidad("Psiquiatría", ["lunes"]))
+        self.clinica.agregar_medico(medico3)
+
+        self.clinica.agendar_turno("12345678", "MAT001", self.fecha_lunes_str, "Psiquiatría")
+        turno = self.clinica.agendar_turno("87654321", "MAT003", self.fecha_lunes_str, "Psiquiatría")
+
+        self.assertEqual(turno.obtener_medico().obtener_matricula(), "MAT003")
+        self.assertEqual(len(self.clinica.obtener_turnos()), 2)
+
+    def test_agendar_turno_mismo_medico_distinto_horario(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+
+        otra_hora_str = self.fecha_lunes.replace(hour=11).strftime("%Y-%m-%d %H:%M")
+        self.clinica.agendar_turno("12345678", "MAT001", self.fecha_lunes_str, "Psiquiatría")
+        self.clinica.agendar_turno("12345678", "MAT001", otra_hora_str, "Psiquiatría")
+
+        self.assertEqual(len(self.clinica.obtener_turnos()), 2)
+
+    def test_agendar_turno_ocupado_no_modifica_turnos(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agendar_turno("12345678", "MAT001", self.fecha_lunes_str, "Psiquiatría")
+
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("87654321", "MAT001", self.fecha_lunes_str, "Psiquiatría")
+
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("87654321").obtener_turnos()), 0)
+
+    def _hora_lunes(self, hora: int, minuto: int = 0) -> str:
+        return self.fecha_lunes.replace(hour=hora, minute=minuto).strftime("%Y-%m-%d %H:%M")
+
+    def test_agendar_turno_superpuesto(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agendar_turno("12345678", "MAT001", self.fecha_lunes_str, "Psiquiatría")  # 10:00 a 10:30
+        largo = self.clinica.agendar_turno("12345678", "MAT001", self._hora_lunes(11), "Psiquiatría", 90)
+        self.assertEqual(largo.obtener_fecha_hora_fin(), self.fecha_lunes.replace(hour=12, minute=30))
+
+        for inicio, minutos in (((10, 5), 30), ((9, 45), 30), ((9, 0), 120), ((12, 0), 15), ((10, 15), 60)):
+            with self.subTest(inicio=inicio, minutos=minutos):
+                with self.assertRaises(TurnoOcupadoException):
+                    self.clinica.agendar_turno("87654321", "MAT001", self._hora_lunes(*inicio), "Psiquiatría", minutos)
+
+        # El final de un turno no está incluido: los turnos pegados no se superponen
+        self.clinica.agendar_turno("87654321", "MAT001", self._hora_lunes(9, 30), "Psiquiatría")
+        self.clinica.agendar_turno("87654321", "MAT001", self._hora_lunes(10, 30), "Psiquiatría")
+        self.clinica.agendar_turno("87654321", "MAT001", self._hora_lunes(12, 30), "Psiquiatría", 15)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 5)
+
+        with self.assertRaises(ValueError):
+            self.clinica.agendar_turno("87654321", "MAT001", self._hora_lunes(15), "Psiquiatría", 0)
+
+    def test_reprogramar_turno_superpuesto(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agendar_turno("12345678", "MAT001", self._hora_lunes(9, 30), "Psiquiatría")  # 9:30 a 10:00
+        self.clinica.agendar_turno("12345678", "MAT001", self._hora_lunes(10), "Psiquiatría", 60)  # 10:00 a 11:00
+
+        # Un turno se puede mover a un horario que se superpone con el que ocupaba, y conserva su duración
+        reprogramado = self.clinica.reprogramar_turno(2, self._hora_lunes(10, 15))
+        self.assertEqual(reprogramado.obtener_fecha_hora_fin(), self.fecha_lunes.replace(hour=11, minute=15))
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.reprogramar_turno(2, self._hora_lunes(9, 45))
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.reprogramar_turno(1, self._hora_lunes(10, 30))
+        self.clinica.reprogramar_turno(1, self._hora_lunes(9))
+        self.assertEqual(self.clinica.obtener_turno(2).obtener_fecha_hora(), self.fecha_lunes.replace(minute=15))
+
+    def _agendar_turnos_lunes_medico1(self, horas: list[int]) -> None:
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        for hora in horas:
+            fecha_str = self.fecha_lunes.replace(hour=hora).strftime("%Y-%m-%d %H:%M")
+            self.clinica.agendar_turno("12345678", "MAT001", fecha_str, "Psiquiatría")
+
+    def test_obtener_turnos_medico_entre(self):
+        self._agendar_turnos_lunes_medico1([15, 9, 12, 10])
+
+        turnos = self.clinica.obtener_turnos_medico_entre(
+            "MAT001", self.fecha_lunes.replace(hour=10), self.fecha_lunes.replace(hour=12)
+        )
+
+        self.assertEqual([t.obtener_fecha_hora().hour for t in turnos], [10, 12])
+
+    def test_obtener_turnos_medico_entre_sin_turnos(self):
+        self.clinica.agregar_medico(self.medico2)
+        turnos = self.clinica.obtener_turnos_medico_entre("MAT002", self.fecha_lunes, self.fecha_martes)
+        self.assertEqual(turnos, [])
+
+    def test_obtener_turnos_medico_entre_medico_inexistente(self):
+        with self.assertRaises(MedicoNoEncontradoException):
+            self.clinica.obtener_turnos_medico_entre("MAT999", self.fecha_lunes, self.fecha_martes)
+
+    def test_obtener_proximo_turno_medico(self):
+        self._agendar_turnos_lunes_medico1([15, 9, 12])
+
+        proximo = self.clinica.obtener_proximo_turno_medico("MAT001")
+        self.assertEqual(proximo.obtener_fecha_hora().hour, 9)
+
+        proximo = self.clinica.obtener_proximo_turno_medico("MAT001", self.fecha_lunes.replace(hour=9, minute=1))
+        self.assertEqual(proximo.obtener_fecha_hora().hour, 12)
+
+        self.assertIsNone(self.clinica.obtener_proximo_turno_medico("MAT001", self.fecha_lunes.replace(hour=16)))
+
+    def test_obtener_proximo_turno_medico_inexistente(self):
+        with self.assertRaises(MedicoNoEncontradoException):
+            self.clinica.obtener_proximo_turno_medico("MAT999")
+
+    def test_agendar_turnos_lote(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agregar_medico(self.medico2)
+        otra_hora_str = self.fecha_lunes.replace(hour=11).strftime("%Y-%m-%d %H:%M")
+
+        resultados = self.clinica.agendar_turnos_lote([
+            ("12345678", "MAT001", self.fecha_lunes_str, "Psiquiatría"),
+            ("87654321", "MAT002", self.fecha_martes_str, "Clínica Médica"),
+            ("87654321", "MAT001", otra_hora_str, "Psiquiatría"),
+        ])
+
+        self.assertEqual(len(resultados), 3)
+        for resultado in resultados:
+            self.assertIsInstance(resultado, Turno)
+        self.assertEqual(resultados[1].obtener_medico().obtener_matricula(), "MAT002")
+        self.assertEqual(len(self.clinica.obtener_turnos()), 3)
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("87654321").obtener_turnos()), 2)
+
+    def test_agendar_turnos_lote_resultados_por_item(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agendar_turno("12345678", "MAT001", self.fecha_lunes_str, "Psiquiatría")
+        otra_hora_str = self.fecha_lunes.replace(hour=11).strftime("%Y-%m-%d %H:%M")
+
+        resultados = self.clinica.agendar_turnos_lote([
+            ("99999999", "MAT001", otra_hora_str, "Psiquiatría"),
+            ("12345678", "MAT999", otra_hora_str, "Psiquiatría"),
+            ("12345678", "MAT001", "formato-invalido", "Psiquiatría"),
+            ("12345678", "MAT001", "2000-01-03 10:00", "Psiquiatría"),
+            ("12345678", "MAT001", self.fecha_martes_str, "Psiquiatría"),
+            ("12345678", "MAT001", otra_hora_str, "Cardiología"),
+            ("87654321", "MAT001", self.fecha_lunes_str, "Psiquiatría"),
+            ("87654321", "MAT001", otra_hora_str, "Psiquiatría"),
+            ("12345678", "MAT001", otra_hora_str, "Psiquiatría"),
+        ])
+
+        self.assertIsInstance(resultados[0], PacienteNoEncontradoException)
+        self.assertIsInstance(resultados[1], MedicoNoEncontradoException)
+        self.assertIsInstance(resultados[2], ValueError)
+        self.assertIsInstance(resultados[3], ValueError)
+        self.assertIsInstance(resultados[4], MedicoNoDisponibleException)
+        self.assertIsInstance(resultados[5], EspecialidadNoValidaParaDiaException)
+        self.assertIsInstance(resultados[6], TurnoOcupadoException)
+        self.assertIsInstance(resultados[7], Turno)
+        # Conflicto con un turno agendado dentro del mismo lote
+        self.assertIsInstance(resultados[8], TurnoOcupadoException)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 2)
+
+    def test_agendar_turnos_lote_vacio(self):
+        self.assertEqual(self.clinica.agendar_turnos_lote([]), [])
+
+    def test_agregar_especialidad(self):
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agregar_especialidad("MAT001", Especialidad("Neurología", ["viernes"]))
+        medico = self.clinica.obtener_medico_por_matricula("MAT001")
+        self.assertEqual(medico.obtener_especialidades_para_dia("viernes"), ["Neurología"])
+
+    def test_agregar_especialidad_medico_inexistente(self):
+        with self.assertRaises(MedicoNoEncontradoException):
+            self.clinica.agregar_especialidad("MAT999", Especialidad("Neurología", ["viernes"]))
+
+    def test_emitir_receta_con_fecha(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        fecha = datetime(2024, 5, 10, 9, 30)
+        receta = self.clinica.emitir_receta("12345678", "MAT001", ["Paracetamol"], fecha)
+        self.assertEqual(receta.obtener_fecha_emision(), fecha)
+
+    def test_recetas_iguales_con_la_misma_fecha_se_cuentan_todas(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        fecha = datetime(2024, 5, 10, 9, 30)
+        self.clinica.emitir_receta("12345678", "MAT001", ["Paracetamol"], fecha)
+        self.assertEqual(len(self.clinica.buscar_recetas_por_medicamento("paracetamol")), 1)
+        # Con el índice ya construido, la segunda receta idéntica no se descarta como repetida
+        self.clinica.emitir_receta("12345678", "MAT001", ["Paracetamol"], fecha)
+        self.assertEqual(len(self.clinica.buscar_recetas_por_medicamento("paracetamol")), 2)
+
+    def test_restaurar_turno_en_el_pasado(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        fecha_pasada = datetime(2020, 1, 6, 10, 0)
+
+        turno = self.clinica.restaurar_turno("12345678", "MAT001", fecha_pasada, "Psiquiatría")
+
+        self.assertEqual(turno.obtener_fecha_hora(), fecha_pasada)
+        turnos_historia = self.clinica.obtener_historia_clinica("12345678").obtener_turnos()
+        self.assertEqual([t.obtener_fecha_hora() for t in turnos_historia], [fecha_pasada])
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.restaurar_turno("12345678", "MAT001", fecha_pasada, "Psiquiatría")
+
+    def test_iterar_pacientes_paginado_y_por_nombre(self):
+        for i in range(5):
+            self.clinica.agregar_paciente(Paciente(f"Paciente {i}", f"DNI{i}", "01/01/1980"))
+        self.clinica.agregar_paciente(Paciente("ÁNGELA Núñez", "DNI9", "01/01/1980"))
+
+        pagina = self.clinica.iterar_pacientes(2, 2)
+        self.assertEqual([p.obtener_dni() for p in pagina], ["DNI2", "DNI3"])
+        self.assertEqual([p.obtener_dni() for p in self.clinica.iterar_pacientes(4)], ["DNI4", "DNI9"])
+        self.assertEqual([p.obtener_dni() for p in self.clinica.iterar_pacientes(nombre="ángela")], ["DNI9"])
+        self.assertEqual(list(self.clinica.iterar_pacientes(1, 5, nombre="paciente 3")), [])
+
+    def test_iterar_medicos_por_especialidad(self):
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agregar_medico(self.medico2)
+        self.assertEqual([m.obtener_matricula() for m in self.clinica.iterar_medicos()], ["MAT001", "MAT002"])
+        self.assertEqual([m.obtener_matricula() for m in self.clinica.iterar_medicos(especialidad="Cardiología")], ["MAT002"])
+        self.assertEqual([m.obtener_matricula() for m in self.clinica.iterar_medicos(1, 1)], ["MAT002"])
+
+    def test_iterar_turnos_con_filtros(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agregar_medico(self.medico2)
+        lunes = datetime(2030, 1, 7, 10, 0)
+        self.clinica.restaurar_turno("12345678", "MAT001", lunes, "Psiquiatría")
+        self.clinica.restaurar_turno("87654321", "MAT001", lunes + timedelta(days=7), "Psiquiatría")
+        self.clinica.restaurar_turno("87654321", "MAT002", lunes + timedelta(days=1), "Clínica Médica")
+        self.clinica.restaurar_turno("12345678", "MAT002", lunes + timedelta(days=4), "Cardiología")
+
+        def fechas(turnos):
+            return [t.obtener_fecha_hora().day for t in turnos]
+
+        self.assertEqual(fechas(self.clinica.iterar_turnos()), [7, 14, 8, 11])
+        self.assertEqual(fechas(self.clinica.iterar_turnos(1, 2)), [14, 8])
+        self.assertEqual(fechas(self.clinica.iterar_turnos(matricula_medico="MAT001")), [7, 14])
+        self.assertEqual(fechas(self.clinica.iterar_turnos(dni_paciente="87654321")), [14, 8])
+        self.assertEqual(fechas(self.clinica.iterar_turnos(especialidad="Cardiología")), [11])
+        self.assertEqual(fechas(self.clinica.iterar_turnos(fecha_desde=datetime(2030, 1, 8), fecha_hasta=datetime(2030, 1, 11, 10))), [8, 11])
+        self.assertEqual(fechas(self.clinica.iterar_turnos(1, 1, dni_paciente="12345678")), [11])
+
+    def test_buscar_pacientes_y_medicos_por_nombre(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.assertEqual([p.obtener_dni() for p in self.clinica.buscar_pacientes("garcia")], ["12345678"])
+        # Las altas posteriores a la primera búsqueda se agregan al índice
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.agregar_paciente(Paciente("Ignacio Garcés Ruiz", "11111111", "01/01/1980"))
+        encontrados = self.clinica.buscar_pacientes("IGNACIO GAR")
+        self.assertEqual([p.obtener_dni() for p in encontrados], ["12345678", "11111111"])
+        self.assertEqual([p.obtener_dni() for p in self.clinica.buscar_pacientes("ruiz", limite=1)], ["11111111"])
+
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agregar_medico(self.medico2)
+        self.assertEqual([m.obtener_matricula() for m in self.clinica.buscar_medicos("jac")], ["MAT001"])
+        self.assertEqual([m.obtener_matricula() for m in self.clinica.buscar_medicos("dr")], ["MAT002", "MAT001"])
+
+    def test_buscar_proximo_turno_libre(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agregar_medico(self.medico2)
+        medico3 = Medico("Dra. Audrey Horne", "MAT003")
+        medico3.agregar_especialidad(Especialidad("Psiquiatría", ["lunes"]))
+        self.clinica.agregar_medico(medico3)
+        self.clinica.agendar_turno("12345678", "MAT001", self.fecha_lunes_str, "Psiquiatría")
+        # Un turno fuera de la grilla ocupa los dos horarios con los que se superpone
+        self.clinica.restaurar_turno("12345678", "MAT003", self.fecha_lunes.replace(minute=45), "Psiquiatría")
+
+        def horarios(libres):
+            return [(horario.strftime("%a %H:%M"), medico.obtener_matricula()) for horario, medico in libres]
+
+        lunes = self.fecha_lunes.strftime("%a")
+        libres = self.clinica.buscar_proximo_turno_libre("Psiquiatría", self.fecha_lunes, 30, 3)
+        self.assertEqual(horarios(libres), [(f"{lunes} 10:00", "MAT003"), (f"{lunes} 10:30", "MAT001"), (f"{lunes} 11:00", "MAT001")])
+
+        # Las especialidades agregadas después de la primera búsqueda también se tienen en cuenta
+        self.clinica.agregar_especialidad("MAT002", Especialidad("Psiquiatría", ["martes"]))
+        libres = self.clinica.buscar_proximo_turno_libre("Psiquiatría", self.fecha_lunes.replace(hour=17, minute=30), 20, 3)
+        martes = self.fecha_martes.strftime("%a")
+        self.assertEqual(horarios(libres), [(f"{lunes} 17:40", "MAT001"), (f"{lunes} 17:40", "MAT003"), (f"{martes} 08:00", "MAT002")])
+
+        self.assertEqual(self.clinica.buscar_proximo_turno_libre("Odontología"), [])
+        with self.assertRaises(ValueError):
+            self.clinica.buscar_proximo_turno_libre("Psiquiatría", minutos_turno=0)
+
+    def test_buscar_proximo_turno_libre_con_turno_largo(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agendar_turno("12345678", "MAT001", self.fecha_lunes_str, "Psiquiatría", 90)
+        fin = self.fecha_lunes.replace(hour=11, minute=30)
+
+        libres = self.clinica.buscar_proximo_turno_libre("Psiquiatría", self.fecha_lunes, 30, 1)
+        self.assertEqual([horario for horario, _ in libres], [fin])
+        # Desde las 10:40 la grilla empieza a las 11:00, con el turno largo todavía en curso
+        libres = self.clinica.buscar_proximo_turno_libre("Psiquiatría", self.fecha_lunes.replace(minute=40), 30, 1)
+        self.assertEqual([horario for horario, _ in libres], [fin])
+
+    def test_cancelar_turno(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        turno1 = self.clinica.agendar_turno("12345678", "MAT001", self.fecha_lunes_str, "Psiquiatría")
+        turno2 = self.clinica.agendar_turno("12345678", "MAT001", self.fecha_lunes.replace(hour=11).strftime("%Y-%m-%d %H:%M"), "Psiquiatría")
+        self.assertEqual((turno1.obtener_id(), turno2.obtener_id()), (1, 2))
+
+        cancelado = self.clinica.cancelar_turno(1)
+        self.assertEqual(cancelado.obtener_fecha_hora(), self.fecha_lunes)
+        self.assertEqual([t.obtener_id() for t in self.clinica.obtener_turnos()], [2])
+        self.assertEqual([t.obtener_id() for t in self.clinica.obtener_historia_clinica("12345678").obtener_turnos()], [2])
+        self.assertEqual(self.clinica.obtener_proximo_turno_medico("MAT001", self.fecha_lunes).obtener_id(), 2)
+        with self.assertRaises(TurnoNoEncontradoException):
+            self.clinica.obtener_turno(1)
+        with self.assertRaises(TurnoNoEncontradoException):
+            self.clinica.cancelar_turno(1)
+
+        # El horario queda libre y el turno nuevo no reutiliza el ID cancelado
+        turno3 = self.clinica.agendar_turno("12345678", "MAT001", self.fecha_lunes_str, "Psiquiatría")
+        self.assertEqual(turno3.obtener_id(), 3)
+
+    def test_reprogramar_turno(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agendar_turno("12345678", "MAT001", self.fecha_lunes_str, "Psiquiatría")
+        ocupado = self.clinica.agendar_turno("12345678", "MAT001", self.fecha_lunes.replace(hour=12).strftime("%Y-%m-%d %H:%M"), "Psiquiatría")
+
+        nueva_fecha = self.fecha_lunes + timedelta(days=2, hours=1)  # Miércoles a las 11
+        reprogramado = self.clinica.reprogramar_turno(1, nueva_fecha.strftime("%Y-%m-%d %H:%M"))
+        self.assertEqual((reprogramado.obtener_id(), reprogramado.obtener_fecha_hora()), (1, nueva_fecha))
+        self.assertEqual(self.clinica.obtener_turno(1).obtener_fecha_hora(), nueva_fecha)
+        self.assertEqual([t.obtener_id() for t in self.clinica.obtener_turnos()], [1, 2])
+        self.assertEqual([t.obtener_id() for t in self.clinica.obtener_historia_clinica("12345678").obtener_turnos()], [2, 1])
+        self.assertEqual(self.clinica.obtener_turnos_medico_entre("MAT001", self.fecha_lunes, self.fecha_lunes.replace(hour=11)), [])
+
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.reprogramar_turno(1, ocupado.obtener_fecha_hora().strftime("%Y-%m-%d %H:%M"))
+        with self.assertRaises(MedicoNoDisponibleException):
+            self.clinica.reprogramar_turno(1, self.fecha_martes_str)
+        with self.assertRaises(ValueError):
+            self.clinica.reprogramar_turno(1, "2020-01-06 10:00")
+        with self.assertRaises(TurnoNoEncontradoException):
+            self.clinica.reprogramar_turno(99, self.fecha_lunes_str)
+        self.assertEqual(self.clinica.obtener_turno(1).obtener_fecha_hora(), nueva_fecha)
+
+    def test_agendar_serie_turnos(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        turnos = self.clinica.agendar_serie_turnos("12345678", "MAT001", self.fecha_lunes_str, "Psiquiatría", 20)
+        self.assertEqual([t.obtener_fecha_hora() for t in turnos], [self.fecha_lunes + timedelta(weeks=n) for n in range(20)])
+        self.assertEqual([t.obtener_id() for t in turnos], list(range(1, 21)))
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("12345678").obtener_turnos()), 20)
+
+        # Cada dos días desde un lunes: el lunes y el miércoles
+        cada_dos_dias = self.clinica.agendar_serie_turnos(
+            "12345678", "MAT001", self.fecha_lunes.replace(hour=15).strftime("%Y-%m-%d %H:%M"), "Psiquiatría", 2, 2
+        )
+        self.assertEqual([t.obtener_fecha_hora().weekday() for t in cada_dos_dias], [0, 2])
+
+    def test_agendar_serie_turnos_con_conflictos_no_agenda_ninguno(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.agregar_medico(self.medico1)
+        ocupado = self.fecha_lunes + timedelta(weeks=2)
+        self.clinica.agendar_turno("87654321", "MAT001", ocupado.strftime("%Y-%m-%d %H:%M"), "Psiquiatría")
+
+        # Cada dos días desde el lunes: solo se atienden ese lunes, el miércoles y el lunes dos semanas después,
+        # que ya está ocupado
+        with self.assertRaises(SerieTurnosNoDisponibleException) as contexto:
+            self.clinica.agendar_serie_turnos("12345678", "MAT001", self.fecha_lunes_str, "Psiquiatría", 8, 2)
+        conflictos = contexto.exception.conflictos
+        fechas = [self.fecha_lunes + timedelta(days=2 * n) for n in range(8)]
+        self.assertEqual([fecha for fecha, _ in conflictos], fechas[2:])
+        self.assertIsInstance(conflictos[0][1], MedicoNoDisponibleException)
+        self.assertIsInstance(conflictos[-1][1], TurnoOcupadoException)
+        with self.assertRaises(SerieTurnosNoDisponibleException) as contexto:
+            self.clinica.agendar_serie_turnos("12345678", "MAT001", self.fecha_lunes_str, "Psiquiatría", 4)
+        self.assertEqual([fecha for fecha, _ in contexto.exception.conflictos], [ocupado])
+        self.assertIsInstance(contexto.exception.conflictos[0][1], TurnoOcupadoException)
+        self.assertIn(ocupado.strftime("%Y-%m-%d %H:%M"), str(contexto.exception))
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+
+        with self.assertRaises(ValueError):
+            self.clinica.agendar_serie_turnos("12345678", "MAT001", self.fecha_lunes_str, "Psiquiatría", 0)
+        with self.assertRaises(ValueError):
+            self.clinica.agendar_serie_turnos("12345678", "MAT001", self.fecha_lunes_str, "Psiquiatría", 3, 7, 25 * 60)
+        with self.assertRaises(ValueError):
+            self.clinica.agendar_serie_turnos("12345678", "MAT001", "2020-01-06 10:00", "Psiquiatría", 3)
+
+    def test_agendar_serie_turnos_superpuesta_con_turnos_existentes(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.agregar_medico(self.medico1)
+        # Uno empieza antes de la primera fecha y sigue en curso; el otro empieza durante el tercer turno
+        self.clinica.agendar_turno("87654321", "MAT001", self._hora_lunes(9, 45), "Psiquiatría")
+        tercero = self.fecha_lunes + timedelta(weeks=2)
+        self.clinica.restaurar_turno("87654321", "MAT001", tercero.replace(minute=40), "Psiquiatría")
+
+        with self.assertRaises(SerieTurnosNoDisponibleException) as contexto:
+            self.clinica.agendar_serie_turnos("12345678", "MAT001", self.fecha_lunes_str, "Psiquiatría", 4, 7, 45)
+        self.assertEqual([fecha for fecha, _ in contexto.exception.conflictos], [self.fecha_lunes, tercero])
+
+        turnos = self.clinica.agendar_serie_turnos("12345678", "MAT001", self._hora_lunes(10, 15), "Psiquiatría", 4, 7, 25)
+        self.assertEqual([t.obtener_minutos() for t in turnos], [25] * 4)
+
+    def test_pacientes_con_medicamento(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.agregar_medico(self.medico1)
+        ahora = datetime.now()
+        self.clinica.emitir_receta("12345678", "MAT001", ["Sertralina 50mg"], ahora - timedelta(days=200))
+        self.clinica.emitir_receta("87654321", "MAT001", ["sertralina 100 mg", "Clonazepam"], ahora - timedelta(days=10))
+        self.assertEqual([p.obtener_dni() for p in self.clinica.obtener_pacientes_con_medicamento("Sertralina")],
+                         ["87654321", "12345678"])
+
+        # Las recetas emitidas después de la primera consulta también se indexan
+        self.clinica.emitir_receta("12345678", "MAT001", ["Sertralina 50mg"], ahora - timedelta(days=1))
+        ultimos_90_dias = self.clinica.obtener_pacientes_con_medicamento("sertralina", desde=ahora - timedelta(days=90))
+        self.assertEqual([p.obtener_dni() for p in ultimos_90_dias], ["12345678", "87654321"])
+        recetas = self.clinica.buscar_recetas_por_medicamento("SERTRALINA 50MG")
+        self.assertEqual([r.obtener_fecha_emision() for r in recetas], [ahora - timedelta(days=1), ahora - timedelta(days=200)])
+        self.assertEqual(self.clinica.obtener_pacientes_con_medicamento("Ibuprofeno"), [])
+
+
+class TestClinicaSQLite(TestClinica):
+    # Las mismas pruebas de TestClinica, con los datos guardados en una base SQLite en memoria
+
+    def crear_clinica(self) -> Clinica:
+        repositorio = RepositorioSQLite(":memory:")
+        self.addCleanup(repositorio.cerrar)
+        return Clinica(repositorio)
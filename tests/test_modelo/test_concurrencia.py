@@ -0,0 +1,200 @@
+import sys
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+from src.clinica_gestion.modelo.clinica import Clinica
+from src.clinica_gestion.modelo.concurrencia import BloqueosClinica
+from src.clinica_gestion.modelo.especialidad import Especialidad
+from src.clinica_gestion.modelo.medico import Medico
+from src.clinica_gestion.modelo.paciente import Paciente
+from src.clinica_gestion.modelo.repositorio import RepositorioClinica, RepositorioEnMemoria
+from src.clinica_gestion.modelo.turno import Turno
+from src.clinica_gestion.persistencia.repositorio_sqlite import RepositorioSQLite
+from src.clinica_gestion.modelo.excepciones import PacienteDuplicadoException, TurnoOcupadoException
+
+
+class RepositorioLento(RepositorioEnMemoria):
+    # Agranda la ventana entre "verificar si el horario está libre" y "agendar" para forzar la carrera
+    def obtener_turno_superpuesto(self, matricula: str, inicio: datetime, fin: datetime) -> Turno | None:
+        superpuesto = super().obtener_turno_superpuesto(matricula, inicio, fin)
+        time.sleep(0.001)
+        return superpuesto
+
+
+class TestBloqueosClinica(unittest.TestCase):
+
+    def test_mismo_lock_para_la_misma_clave(self):
+        bloqueos = BloqueosClinica()
+        self.assertIs(bloqueos.medico("MAT001"), bloqueos.medico("MAT001"))
+        self.assertIsNot(bloqueos.medico("MAT001"), bloqueos.medico("MAT002"))
+        self.assertIsNot(bloqueos.medico("123"), bloqueos.paciente("123"))
+
+
+class TestClinicaConcurrente(unittest.TestCase):
+    HILOS = 8
+    MEDICOS = 4
+    HORARIOS = 10
+
+    def crear_repositorio(self) -> RepositorioClinica:
+        return RepositorioLento()
+
+    def setUp(self):
+        self.clinica = Clinica(self.crear_repositorio(), concurrente=True)
+        for i in range(self.HILOS):
+            self.clinica.agregar_paciente(Paciente(f"Paciente {i}", f"DNI{i}", "01/01/1980"))
+        for i in range(self.MEDICOS):
+            medico = Medico(f"Dr. {i}", f"MAT{i}")
+            medico.agregar_especialidad(Especialidad("Clínica Médica", ["lunes"]))
+            self.clinica.agregar_medico(medico)
+
+        hoy = datetime.now()
+        proximo_lunes = (hoy + timedelta(days=(7 - hoy.weekday()) % 7 or 7)).replace(hour=8, minute=0, second=0, microsecond=0)
+        self.horarios = [(proximo_lunes + timedelta(minutes=30 * i)).strftime("%Y-%m-%d %H:%M") for i in range(self.HORARIOS)]
+
+        intervalo = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, intervalo)
+
+    def _en_paralelo(self, tarea, cantidad_hilos: int) -> None:
+        inicio = threading.Barrier(cantidad_hilos)
+        errores = []
+
+        def ejecutar(indice: int) -> None:
+            inicio.wait()
+            try:
+                tarea(indice)
+            except Exception as e:
+                errores.append(e)
+
+        hilos = [threading.Thread(target=ejecutar, args=(i,)) for i in range(cantidad_hilos)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        self.assertEqual(errores, [])
+
+    def test_no_se_agenda_dos_veces_el_mismo_horario(self):
+        agendados = []
+        ocupados = []
+
+        # Todos los hilos intentan tomar todos los horarios de todos los médicos
+        def reservar(indice: int) -> None:
+            for matricula in (f"MAT{i}" for i in range(self.MEDICOS)):
+                for horario in self.horarios:
+                    try:
+                        agendados.append(self.clinica.agendar_turno(f"DNI{indice}", matricula, horario, "Clínica Médica"))
+                    except TurnoOcupadoException:
+                        ocupados.append(horario)
+
+        self._en_paralelo(reservar, self.HILOS)
+
+        turnos = self.clinica.obtener_turnos()
+        claves = {(t.obtener_medico().obtener_matricula(), t.obtener_fecha_hora()) for t in turnos}
+        self.assertEqual(len(turnos), self.MEDICOS * self.HORARIOS)
+        self.assertEqual(len(claves), len(turnos))
+        self.assertEqual(len(agendados), len(turnos))
+        self.assertEqual(len(ocupados), (self.HILOS - 1) * len(turnos))
+
+        total_en_historias = sum(
+            len(self.clinica.obtener_historia_clinica(f"DNI{i}").obtener_turnos()) for i in range(self.HILOS)
+        )
+        self.assertEqual(total_en_historias, len(turnos))
+        for i in range(self.MEDICOS):
+            agenda = self.clinica.obtener_turnos_medico_entre(f"MAT{i}", datetime.min, datetime.max)
+            fechas = [turno.obtener_fecha_hora() for turno in agenda]
+            self.assertEqual(fechas, sorted(set(fechas)))
+
+    def test_lotes_concurrentes_no_duplican_turnos(self):
+        resultados = []
+
+        def reservar_lote(indice: int) -> None:
+            solicitudes = [(f"DNI{indice}", "MAT0", horario, "Clínica Médica") for horario in self.horarios]
+            resultados.extend(self.clinica.agendar_turnos_lote(solicitudes))
+
+        self._en_paralelo(reservar_lote, self.HILOS)
+
+        self.assertEqual(len(self.clinica.obtener_turnos()), self.HORARIOS)
+        self.assertEqual(sum(1 for r in resultados if isinstance(r, TurnoOcupadoException)), (self.HILOS - 1) * self.HORARIOS)
+
+    def test_recetas_concurrentes_para_el_mismo_paciente(self):
+        def emitir(indice: int) -> None:
+            for j in range(20):
+                self.clinica.emitir_receta("DNI0", f"MAT{indice % self.MEDICOS}", [f"Medicamento {indice}-{j}"],
+                                           datetime(2025, 1, 1) + timedelta(minutes=j))
+
+        self._en_paralelo(emitir, self.HILOS)
+
+        recetas = self.clinica.obtener_historia_clinica("DNI0").obtener_recetas()
+        self.assertEqual(len(recetas), self.HILOS * 20)
+        fechas = [receta.obtener_fecha_emision() for receta in recetas]
+        self.assertEqual(fechas, sorted(fechas, reverse=True))
+
+    def test_altas_duplicadas_concurrentes(self):
+        duplicados = []
+
+        def agregar(indice: int) -> None:
+            try:
+                self.clinica.agregar_paciente(Paciente("Audrey Horne", "33445566", "01/12/1973"))
+            except PacienteDuplicadoException:
+                duplicados.append(indice)
+
+        self._en_paralelo(agregar, self.HILOS)
+
+        self.assertEqual(len(duplicados), self.HILOS - 1)
+        self.assertEqual(len(self.clinica.obtener_pacientes()), self.HILOS + 1)
+
+
+class TestClinicaConcurrenteSQLite(TestClinicaConcurrente):
+
+    def crear_repositorio(self) -> RepositorioClinica:
+        repositorio = RepositorioSQLite(":memory:")
+        self.addCleanup(repositorio.cerrar)
+        return repositorio
+
+
+class TestParalelismoEntreMedicos(unittest.TestCase):
+
+    def test_medicos_distintos_no_comparten_lock(self):
+        # Los dos hilos deben estar a la vez dentro de la verificación del horario: con un lock global
+        # uno esperaría al otro y la barrera vencería por tiempo
+        barrera = threading.Barrier(2, timeout=5)
+
+        class RepositorioConBarrera(RepositorioEnMemoria):
+            def obtener_turno_superpuesto(self, matricula: str, inicio: datetime, fin: datetime) -> Turno | None:
+                barrera.wait()
+                return super().obtener_turno_superpuesto(matricula, inicio, fin)
+
+        clinica = Clinica(RepositorioConBarrera(), concurrente=True)
+        clinica.agregar_paciente(Paciente("Laura Palmer", "87654321", "15/07/1990"))
+        for matricula in ("MAT001", "MAT002"):
+            medico = Medico("Dr. Lawrence Jacoby", matricula)
+            medico.agregar_especialidad(Especialidad("Psiquiatría", ["lunes"]))
+            clinica.agregar_medico(medico)
+
+        hoy = datetime.now()
+        fecha = (hoy + timedelta(days=(7 - hoy.weekday()) % 7 or 7)).strftime("%Y-%m-%d 10:00")
+        errores = []
+
+        def reservar(matricula: str) -> None:
+            try:
+                clinica.agendar_turno("87654321", matricula, fecha, "Psiquiatría")
+            except Exception as e:
+                errores.append(e)
+
+        hilos = [threading.Thread(target=reservar, args=(m,)) for m in ("MAT001", "MAT002")]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        self.assertEqual(errores, [])
+        self.assertEqual(len(clinica.obtener_turnos()), 2)
+
+    def test_clinica_no_concurrente_por_defecto(self):
+        self.assertFalse(Clinica().es_concurrente())
+        self.assertTrue(Clinica(concurrente=True).es_concurrente())
+
+
+if __name__ == "__main__":
+    unittest.main()
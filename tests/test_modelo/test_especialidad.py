@@ -32,3 +32,24 @@ class TestEspecialidad(unittest.TestCase):
     def test_representacion_str_especialidad_un_dia(self):
         especialidad = Especialidad("Kinesiología", ["miércoles"])
         self.assertEqual(str(especialidad), "Kinesiología (Días: miércoles)", "La representación str para un día no es la esperada.")
+
+    def test_obtener_dias(self):
+        especialidad = Especialidad("Kinesiología", ["Lunes", "miércoles"])
+        self.assertEqual(especialidad.obtener_dias(), ["lunes", "miércoles"])
+
+    def test_especialidad_sin_dict_por_instancia(self):
+        especialidad = Especialidad("Kinesiología", ["miércoles"])
+        self.assertFalse(hasattr(especialidad, "__dict__"))
+
+    def test_mascara_dias(self):
+        especialidad = Especialidad("Cardiología", ["Lunes", "miércoles", "domingo"])
+        self.assertEqual(especialidad.obtener_mascara_dias(), 0b1000101)
+        self.assertTrue(especialidad.atiende_dia_semana(0))
+        self.assertTrue(especialidad.atiende_dia_semana(2))
+        self.assertTrue(especialidad.atiende_dia_semana(6))
+        self.assertFalse(especialidad.atiende_dia_semana(1))
+
+    def test_mascara_dias_ignora_dias_desconocidos(self):
+        especialidad = Especialidad("Cardiología", ["feriado"])
+        self.assertEqual(especialidad.obtener_mascara_dias(), 0)
+        self.assertTrue(especialidad.verificar_dia("feriado"))
@@ -0,0 +1,40 @@
+import unittest
+from datetime import datetime
+from src.clinica_gestion.modelo.fechas import parse_fecha_hora, parse_fecha_hora_rapido, FORMATO_FECHA_HORA
+
+class TestFechas(unittest.TestCase):
+
+    def _parse_con_strptime(self, texto: str) -> datetime | None:
+        try:
+            return datetime.strptime(texto, FORMATO_FECHA_HORA)
+        except ValueError:
+            return None
+
+    def test_formato_exacto(self):
+        self.assertEqual(parse_fecha_hora("2025-10-15 14:30"), datetime(2025, 10, 15, 14, 30))
+
+    def test_mismos_resultados_que_strptime(self):
+        textos = [
+            "2025-10-15 14:30", "2024-02-29 00:00", "2025-02-29 10:00", "2025-13-01 10:00",
+            "2025-00-10 10:00", "2025-04-31 10:00", "2025-10-15 24:00", "2025-10-15 23:60",
+            "0000-01-01 10:00", "2025-1-5 9:30", "2025-10-15T14:30", "2025-10-15 14:30 ",
+            "2025/10/15 14:30", "20a5-10-15 14:30", "2025-10-15 1:30", "", "formato-invalido",
+            "+025-10-15 14:30", "2025-10-15 14:3 ", "２０２５-10-15 14:30",
+        ]
+        for texto in textos:
+            with self.subTest(texto=texto):
+                self.assertEqual(parse_fecha_hora(texto), self._parse_con_strptime(texto))
+
+    def test_parse_rapido_lanza_value_error(self):
+        with self.assertRaises(ValueError):
+            parse_fecha_hora_rapido("2025-02-30 10:00")
+
+    def test_valor_que_no_es_texto_lanza_type_error(self):
+        with self.assertRaises(TypeError):
+            parse_fecha_hora(None)
+
+    def test_textos_repetidos_devuelven_la_misma_instancia(self):
+        self.assertIs(parse_fecha_hora("2031-05-06 08:15"), parse_fecha_hora("2031-05-06 08:15"))
+
+if __name__ == '__main__':
+    unittest.main()
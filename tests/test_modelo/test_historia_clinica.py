@@ -39,6 +39,7 @@ class TestHistoriaClinica(unittest.TestCase):
 
         turnos = self.historia_clinica.obtener_turnos()
         self.assertEqual(len(turnos), 2)
+        self.assertEqual(turnos, [self.turno1, self.turno2])
 
     def test_obtener_turnos_devuelve_copia(self):
         self.historia_clinica.agregar_turno(self.turno1)
@@ -76,3 +77,64 @@ class TestHistoriaClinica(unittest.TestCase):
         self.assertIn(str(self.paciente_hc), representacion)
 
         self.assertIn("\n", representacion)
+
+    def _crear_recetas_por_dia(self, dias: list[int]) -> dict[int, Receta]:
+        recetas = {}
+        for dia in dias:
+            recetas[dia] = Receta(self.paciente_hc, self.medico1, ["Ibuprofeno"], datetime(2025, 3, dia, 10, 0))
+            self.historia_clinica.agregar_receta(recetas[dia])
+        return recetas
+
+    def test_recetas_ordenadas_de_mas_reciente_a_mas_antigua(self):
+        recetas = self._crear_recetas_por_dia([10, 3, 20, 15])
+        self.assertEqual(self.historia_clinica.obtener_recetas(), [recetas[20], recetas[15], recetas[10], recetas[3]])
+
+    def test_recetas_misma_fecha_respetan_orden_de_carga(self):
+        fecha = datetime(2025, 3, 1, 10, 0)
+        receta_a = Receta(self.paciente_hc, self.medico1, ["A"], fecha)
+        receta_b = Receta(self.paciente_hc, self.medico1, ["B"], fecha)
+        self.historia_clinica.agregar_receta(receta_a)
+        self.historia_clinica.agregar_receta(receta_b)
+        self.assertEqual(self.historia_clinica.obtener_recetas(), [receta_a, receta_b])
+
+    def test_obtener_turnos_entre(self):
+        turno3 = Turno(self.paciente_hc, self.medico1, datetime(2025, 10, 13, 9, 0), "Forense")
+        for turno in (turno3, self.turno2, self.turno1):
+            self.historia_clinica.agregar_turno(turno)
+
+        turnos = self.historia_clinica.obtener_turnos_entre(datetime(2025, 10, 7), datetime(2025, 10, 13, 9, 0))
+        self.assertEqual(turnos, [self.turno2, turno3])
+        self.assertEqual(self.historia_clinica.obtener_turnos_entre(datetime(2026, 1, 1), datetime(2026, 2, 1)), [])
+
+    def test_quitar_turno(self):
+        # Dos turnos a la misma hora con distintos médicos: se quita el del ID indicado
+        turno3 = Turno(self.paciente_hc, self.medico1, self.turno2.obtener_fecha_hora(), "Forense", 3)
+        turno4 = Turno(self.paciente_hc, self.medico2, self.turno2.obtener_fecha_hora(), "Clínica Médica", 4)
+        for turno in (self.turno1, turno3, turno4):
+            self.historia_clinica.agregar_turno(turno)
+
+        self.historia_clinica.quitar_turno(Turno(self.paciente_hc, self.medico2, turno4.obtener_fecha_hora(), "Clínica Médica", 4))
+        self.assertEqual(self.historia_clinica.obtener_turnos(), [self.turno1, turno3])
+        self.historia_clinica.quitar_turno(self.turno1)
+        self.assertEqual(self.historia_clinica.obtener_turnos(), [turno3])
+
+    def test_obtener_ultimos_turnos(self):
+        turno3 = Turno(self.paciente_hc, self.medico1, datetime(2025, 10, 13, 9, 0), "Forense")
+        for turno in (turno3, self.turno1, self.turno2):
+            self.historia_clinica.agregar_turno(turno)
+
+        self.assertEqual(self.historia_clinica.obtener_ultimos_turnos(2), [self.turno2, turno3])
+        self.assertEqual(len(self.historia_clinica.obtener_ultimos_turnos(10)), 3)
+        self.assertEqual(self.historia_clinica.obtener_ultimos_turnos(0), [])
+
+    def test_obtener_recetas_entre(self):
+        recetas = self._crear_recetas_por_dia([10, 3, 20, 15])
+        resultado = self.historia_clinica.obtener_recetas_entre(datetime(2025, 3, 3), datetime(2025, 3, 15, 10, 0))
+        self.assertEqual(resultado, [recetas[15], recetas[10], recetas[3]])
+        self.assertEqual(self.historia_clinica.obtener_recetas_entre(datetime(2024, 1, 1), datetime(2024, 2, 1)), [])
+
+    def test_obtener_ultimas_recetas(self):
+        recetas = self._crear_recetas_por_dia([10, 3, 20])
+        self.assertEqual(self.historia_clinica.obtener_ultimas_recetas(2), [recetas[20], recetas[10]])
+        self.assertEqual(len(self.historia_clinica.obtener_ultimas_recetas(5)), 3)
+        self.assertEqual(self.historia_clinica.obtener_ultimas_recetas(0), [])
@@ -0,0 +1,194 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+from src.clinica_gestion.modelo.clinica import Clinica
+from src.clinica_gestion.modelo.importacion import ImportadorClinica
+from src.clinica_gestion.modelo.paciente import Paciente
+from src.clinica_gestion.modelo.excepciones import PacienteDuplicadoException, MedicoDuplicadoException
+from src.clinica_gestion.persistencia.repositorio_sqlite import RepositorioSQLite
+
+class TestImportacion(unittest.TestCase):
+
+    def setUp(self):
+        self.clinica = Clinica()
+        self.importador = ImportadorClinica(self.clinica)
+        self.directorio = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def _crear_archivo(self, nombre: str, contenido: str) -> str:
+        ruta = os.path.join(self.directorio.name, nombre)
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write(contenido)
+        return ruta
+
+    def test_importar_pacientes_csv(self):
+        ruta = self._crear_archivo("pacientes.csv", (
+            "nombre,dni,fecha_nacimiento\n"
+            "Dale Cooper,11111111,19/04/1954\n"
+            "Audrey Horne,22222222,01/12/1973\n"
+        ))
+
+        resultado = self.importador.importar_pacientes_desde_archivo(ruta)
+
+        self.assertEqual(resultado.obtener_importados(), 2)
+        self.assertEqual(resultado.obtener_cantidad_errores(), 0)
+        self.assertEqual(self.clinica.obtener_paciente_por_matricula("22222222").obtener_nombre(), "Audrey Horne")
+        self.assertGreaterEqual(resultado.obtener_filas_por_segundo(), 0)
+
+    def test_importar_pacientes_reporta_errores_sin_abortar(self):
+        self.clinica.agregar_paciente(Paciente("Dale Cooper", "11111111", "19/04/1954"))
+        ruta = self._crear_archivo("pacientes.jsonl", "\n".join([
+            json.dumps({"nombre": "Dale Cooper", "dni": "11111111", "fecha_nacimiento": "19/04/1954"}),
+            "{esto no es json",
+            json.dumps({"nombre": "Sin DNI", "fecha_nacimiento": "01/01/2000"}),
+            "",
+            json.dumps({"nombre": "Shelly Johnson", "dni": "33333333", "fecha_nacimiento": "05/05/1970"}),
+        ]))
+
+        resultado = self.importador.importar_pacientes_desde_archivo(ruta)
+
+        self.assertEqual(resultado.obtener_importados(), 1)
+        self.assertEqual(resultado.obtener_cantidad_errores(), 3)
+        errores = resultado.obtener_errores()
+        self.assertEqual([e.obtener_numero_fila() for e in errores], [1, 2, 3])
+        self.assertIsInstance(errores[0].obtener_error(), PacienteDuplicadoException)
+        self.assertIsInstance(errores[1].obtener_error(), ValueError)
+        self.assertEqual(len(self.clinica.obtener_pacientes()), 2)
+
+    def test_importar_csv_con_filas_ilegibles_sin_abortar(self):
+        self.addCleanup(csv.field_size_limit, csv.field_size_limit(50))
+        ruta = os.path.join(self.directorio.name, "pacientes.csv")
+        with open(ruta, "wb") as archivo:
+            archivo.write(
+                b"nombre,dni,fecha_nacimiento\n"
+                b"Dale Cooper,11111111,19/04/1954\n"
+                b"Audrey Horne \xff,22222222,01/12/1973\n"
+                + b"x" * 100 + b",33333333,01/01/2000\n"
+                b"Shelly Johnson,44444444,05/05/1970\n"
+            )
+
+        resultado = self.importador.importar_pacientes_desde_archivo(ruta)
+
+        self.assertEqual(resultado.obtener_importados(), 2)
+        errores = resultado.obtener_errores()
+        self.assertEqual([e.obtener_numero_fila() for e in errores], [3, 4])
+        self.assertTrue(all(isinstance(e.obtener_error(), ValueError) for e in errores))
+        self.assertEqual([p.obtener_dni() for p in self.clinica.obtener_pacientes()], ["11111111", "44444444"])
+
+    def test_importar_jsonl_con_linea_que_no_es_utf8(self):
+        ruta = os.path.join(self.directorio.name, "pacientes.jsonl")
+        with open(ruta, "wb") as archivo:
+            archivo.write(
+                b'{"nombre": "Audrey \xff", "dni": "22222222", "fecha_nacimiento": "01/12/1973"}\n'
+                b'{"nombre": "Shelly Johnson", "dni": "44444444", "fecha_nacimiento": "05/05/1970"}\n'
+            )
+
+        resultado = self.importador.importar_pacientes_desde_archivo(ruta)
+
+        self.assertEqual(resultado.obtener_importados(), 1)
+        self.assertEqual([e.obtener_numero_fila() for e in resultado.obtener_errores()], [1])
+
+    def test_importar_medicos_csv_con_especialidades(self):
+        ruta = self._crear_archivo("medicos.csv", (
+            "nombre,matricula,especialidades\n"
+            "Dr. Hayward,MAT002,Cardiología:lunes|miércoles;Pediatría:viernes\n"
+            "Dr. Hayward,MAT002,\n"
+            "Dr. Jacoby,MAT001,Psiquiatría:feriado\n"
+        ))
+
+        resultado = self.importador.importar_medicos_desde_archivo(ruta)
+
+        self.assertEqual(resultado.obtener_importados(), 1)
+        self.assertEqual(resultado.obtener_cantidad_errores(), 2)
+        self.assertIsInstance(resultado.obtener_errores()[0].obtener_error(), MedicoDuplicadoException)
+        medico = self.clinica.obtener_medico_por_matricula("MAT002")
+        self.assertEqual(medico.obtener_especialidades_para_dia("miércoles"), ["Cardiología"])
+        self.assertEqual(medico.obtener_especialidades_para_dia("viernes"), ["Pediatría"])
+
+    def test_importar_medicos_jsonl_con_lista_de_especialidades(self):
+        ruta = self._crear_archivo("medicos.jsonl", json.dumps({
+            "nombre": "Dr. Jacoby", "matricula": "MAT001",
+            "especialidades": [{"tipo": "Psiquiatría", "dias": ["Lunes", "jueves"]}],
+        }))
+
+        resultado = self.importador.importar_medicos_desde_archivo(ruta)
+
+        self.assertEqual(resultado.obtener_importados(), 1)
+        medico = self.clinica.obtener_medico_por_matricula("MAT001")
+        self.assertEqual(medico.obtener_especialidades_para_dia("lunes"), ["Psiquiatría"])
+
+    def test_importar_medicos_jsonl_dias_como_texto(self):
+        ruta = self._crear_archivo("medicos.jsonl", json.dumps({
+            "nombre": "Dr. Jacoby", "matricula": "MAT001", "especialidades": [{"tipo": "Psiquiatría", "dias": "lunes"}],
+        }))
+
+        resultado = self.importador.importar_medicos_desde_archivo(ruta)
+
+        self.assertEqual(resultado.obtener_importados(), 0)
+        self.assertIn("deben ser una lista", str(resultado.obtener_errores()[0].obtener_error()))
+
+    def test_importar_medicos_jsonl_especialidad_que_no_es_objeto(self):
+        ruta = self._crear_archivo("medicos.jsonl", json.dumps({
+            "nombre": "Dr. Jacoby", "matricula": "MAT001",
+            "especialidades": [{"tipo": "Psiquiatría", "dias": ["lunes"]}, "Neurología:viernes"],
+        }))
+
+        resultado = self.importador.importar_medicos_desde_archivo(ruta)
+
+        self.assertEqual(resultado.obtener_importados(), 0)
+        self.assertIsInstance(resultado.obtener_errores()[0].obtener_error(), ValueError)
+        self.assertEqual(self.clinica.obtener_medicos(), [])
+
+    def test_importar_desde_generador(self):
+        filas = ((i, {"nombre": f"Paciente {i}", "dni": str(i), "fecha_nacimiento": "01/01/2000"}) for i in range(1, 501))
+        resultado = self.importador.importar_pacientes(filas)
+        self.assertEqual(resultado.obtener_importados(), 500)
+        self.assertEqual(len(self.clinica.obtener_pacientes()), 500)
+
+    def test_limite_de_errores_detallados(self):
+        importador = ImportadorClinica(self.clinica, max_errores_detallados=2)
+        filas = ((i, {"nombre": "Sin DNI"}) for i in range(1, 11))
+        resultado = importador.importar_pacientes(filas)
+        self.assertEqual(resultado.obtener_cantidad_errores(), 10)
+        self.assertEqual(len(resultado.obtener_errores()), 2)
+
+    def test_filas_por_transaccion_invalidas(self):
+        for filas_por_transaccion in (0, -1):
+            with self.assertRaises(ValueError):
+                ImportadorClinica(self.clinica, filas_por_transaccion=filas_por_transaccion)
+
+    def test_fila_que_falla_a_mitad_no_deja_escrituras_en_sqlite(self):
+        repositorio = RepositorioSQLite()
+        self.addCleanup(repositorio.cerrar)
+        insertar_especialidad = repositorio._insertar_especialidad
+
+        def insertar_o_fallar(matricula, especialidad):
+            if especialidad.obtener_especialidad() == "Neurología":
+                raise ValueError("falla al guardar la especialidad")
+            insertar_especialidad(matricula, especialidad)
+
+        repositorio._insertar_especialidad = insertar_o_fallar
+        clinica = Clinica(repositorio)
+        filas = [
+            (2, {"nombre": "Dr. Jacoby", "matricula": "MAT001", "especialidades": "Psiquiatría:lunes"}),
+            (3, {"nombre": "Dr. Hayward", "matricula": "MAT002", "especialidades": "Pediatría:lunes;Neurología:martes"}),
+            (4, {"nombre": "Dr. Lydecker", "matricula": "MAT003", "especialidades": "Cardiología:viernes"}),
+        ]
+
+        resultado = ImportadorClinica(clinica).importar_medicos(filas)
+
+        self.assertEqual(resultado.obtener_importados(), 2)
+        self.assertEqual([error.obtener_numero_fila() for error in resultado.obtener_errores()], [3])
+        self.assertEqual([medico.obtener_matricula() for medico in clinica.obtener_medicos()], ["MAT001", "MAT003"])
+
+    def test_formato_no_soportado(self):
+        ruta = self._crear_archivo("pacientes.xml", "<pacientes/>")
+        with self.assertRaises(ValueError):
+            self.importador.importar_pacientes_desde_archivo(ruta)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -99,3 +99,21 @@ class TestMedico(unittest.TestCase):
         medico.agregar_especialidad(especialidad2)
         esperado = "Medico: Dr. Jorge Jaramillo, MAT443, Especialidades: [Oftalmología (Días: lunes), Otorrinolaringología (Días: jueves, viernes)]"
         self.assertEqual(str(medico), esperado)
+
+    def test_medico_sin_dict_por_instancia(self):
+        medico = Medico("Dr. Jorge Jaramillo", "MAT443")
+        self.assertFalse(hasattr(medico, "__dict__"))
+
+    def test_obtener_especialidades_para_dia_semana(self):
+        medico = Medico("Dr. Jorge Jaramillo", "MAT443")
+        medico.agregar_especialidad(Especialidad("Oftalmología", ["lunes", "jueves"]))
+        medico.agregar_especialidad(Especialidad("Otorrinolaringología", ["jueves", "viernes"]))
+        self.assertEqual(medico.obtener_especialidades_para_dia_semana(0), ("Oftalmología",))
+        self.assertEqual(medico.obtener_especialidades_para_dia_semana(3), ("Oftalmología", "Otorrinolaringología"))
+        self.assertEqual(medico.obtener_especialidades_para_dia_semana(6), ())
+
+    def test_obtener_especialidades_para_dia_coincide_con_dia_semana(self):
+        medico = Medico("Dr. Jorge Jaramillo", "MAT443")
+        medico.agregar_especialidad(Especialidad("Oftalmología", ["Miércoles"]))
+        self.assertEqual(medico.obtener_especialidades_para_dia("MIÉRCOLES"), ["Oftalmología"])
+        self.assertEqual(medico.obtener_especialidades_para_dia("martes"), [])
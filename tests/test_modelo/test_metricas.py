@@ -0,0 +1,122 @@
+import os
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta
+from src.clinica_gestion.modelo.clinica import Clinica
+from src.clinica_gestion.modelo.especialidad import Especialidad
+from src.clinica_gestion.modelo.medico import Medico
+from src.clinica_gestion.modelo.metricas import HistogramaLatencia, MetricasClinica
+from src.clinica_gestion.modelo.paciente import Paciente
+from src.clinica_gestion.modelo.excepciones import PacienteNoEncontradoException, TurnoOcupadoException
+
+
+class TestHistogramaLatencia(unittest.TestCase):
+
+    def test_acumula_por_limite(self):
+        histograma = HistogramaLatencia()
+        for segundos in (0.000005, 0.00001, 0.0003, 0.002, 10.0):
+            histograma.registrar(segundos)
+        acumulados = histograma.obtener_acumulados()
+        self.assertEqual(acumulados["1e-05"], 2)
+        self.assertEqual(acumulados["0.0005"], 3)
+        self.assertEqual(acumulados["0.0025"], 4)
+        self.assertEqual(acumulados["5.0"], 4)
+        self.assertEqual(acumulados["+Inf"], 5)
+        self.assertEqual(histograma.obtener_cantidad(), 5)
+        self.assertAlmostEqual(histograma.obtener_suma(), 10.002315)
+
+
+class TestMetricasClinica(unittest.TestCase):
+
+    def setUp(self):
+        self.paciente = Paciente("Juan Perez", "12345678", "01/01/1980")
+        self.medico = Medico("Dr. House", "MAT123")
+        self.medico.agregar_especialidad(Especialidad("Clínica Médica", ["lunes"]))
+        hoy = datetime.now()
+        proximo_lunes = hoy + timedelta(days=(7 - hoy.weekday()) % 7 or 7)
+        self.fecha_lunes_str = proximo_lunes.strftime("%Y-%m-%d 10:00")
+
+    def crear_clinica(self, **opciones) -> Clinica:
+        clinica = Clinica(**opciones)
+        clinica.agregar_paciente(self.paciente)
+        clinica.agregar_medico(self.medico)
+        return clinica
+
+    def test_sin_metricas_no_se_envuelven_los_metodos(self):
+        clinica = self.crear_clinica()
+        self.assertEqual(clinica.metricas(), {})
+        self.assertIsNone(clinica.obtener_metricas())
+        self.assertNotIn("agendar_turno", vars(clinica))
+
+    def test_cuenta_llamadas_y_errores_por_tipo(self):
+        clinica = self.crear_clinica(metricas=True)
+        clinica.agendar_turno("12345678", "MAT123", self.fecha_lunes_str, "Clínica Médica")
+        with self.assertRaises(TurnoOcupadoException):
+            clinica.agendar_turno("12345678", "MAT123", self.fecha_lunes_str, "Clínica Médica")
+        with self.assertRaises(PacienteNoEncontradoException):
+            clinica.agendar_turno("99999999", "MAT123", self.fecha_lunes_str, "Clínica Médica")
+
+        metricas = clinica.metricas()["agendar_turno"]
+        self.assertEqual(metricas["llamadas"], 3)
+        self.assertEqual(metricas["errores"], {"TurnoOcupadoException": 1, "PacienteNoEncontradoException": 1})
+        self.assertEqual(metricas["latencia"]["cantidad"], 3)
+        self.assertEqual(metricas["latencia"]["buckets"]["+Inf"], 3)
+        self.assertGreater(metricas["latencia"]["suma_segundos"], 0)
+
+    def test_las_llamadas_internas_no_se_cuentan_aparte(self):
+        clinica = self.crear_clinica(metricas=True)
+        clinica.agendar_turno("12345678", "MAT123", self.fecha_lunes_str, "Clínica Médica")
+        # agendar_turno busca al paciente y al médico con los métodos públicos de la clínica
+        self.assertEqual(clinica.metricas()["obtener_paciente_por_matricula"]["llamadas"], 0)
+        clinica.obtener_paciente_por_matricula("12345678")
+        self.assertEqual(clinica.metricas()["obtener_paciente_por_matricula"]["llamadas"], 1)
+
+    def test_deshabilitar_metricas(self):
+        clinica = self.crear_clinica(metricas=True)
+        clinica.deshabilitar_metricas()
+        self.assertEqual(clinica.metricas(), {})
+        self.assertNotIn("agendar_turno", vars(clinica))
+        clinica.agendar_turno("12345678", "MAT123", self.fecha_lunes_str, "Clínica Médica")
+
+    def test_conteos_correctos_desde_varios_hilos(self):
+        clinica = self.crear_clinica(concurrente=True, metricas=True)
+
+        def consultar():
+            for _ in range(500):
+                clinica.obtener_historia_clinica("12345678")
+
+        hilos = [threading.Thread(target=consultar) for _ in range(8)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        self.assertEqual(clinica.metricas()["obtener_historia_clinica"]["llamadas"], 4000)
+
+    def test_exportar_en_formato_prometheus(self):
+        clinica = self.crear_clinica(metricas=True)
+        with self.assertRaises(TurnoOcupadoException):
+            for _ in range(2):
+                clinica.agendar_turno("12345678", "MAT123", self.fecha_lunes_str, "Clínica Médica")
+
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "clinica.prom")
+            clinica.obtener_metricas().escribir_prometheus(ruta)
+            with open(ruta, encoding="utf-8") as archivo:
+                texto = archivo.read()
+            self.assertEqual(os.listdir(directorio), ["clinica.prom"])
+
+        lineas = texto.splitlines()
+        self.assertIn("# TYPE clinica_llamadas_total counter", lineas)
+        self.assertIn('clinica_llamadas_total{metodo="agendar_turno"} 2', lineas)
+        self.assertIn('clinica_errores_total{metodo="agendar_turno",tipo="TurnoOcupadoException"} 1', lineas)
+        self.assertIn("# TYPE clinica_latencia_segundos histogram", lineas)
+        self.assertIn('clinica_latencia_segundos_bucket{metodo="agendar_turno",le="+Inf"} 2', lineas)
+        self.assertIn('clinica_latencia_segundos_count{metodo="agendar_turno"} 2', lineas)
+
+    def test_metricas_vacias_sin_llamadas(self):
+        self.assertEqual(MetricasClinica().instantanea(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
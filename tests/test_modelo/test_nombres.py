@@ -0,0 +1,40 @@
+import unittest
+from datetime import datetime
+from src.clinica_gestion.modelo.especialidad import Especialidad
+from src.clinica_gestion.modelo.fechas import DIAS_SEMANA_ES
+from src.clinica_gestion.modelo.medico import Medico
+from src.clinica_gestion.modelo.nombres import ESPECIALIDADES, RegistroNombres
+from src.clinica_gestion.modelo.paciente import Paciente
+from src.clinica_gestion.modelo.turno import Turno
+
+
+def _copia(texto: str) -> str:
+    # Un str igual pero distinto objeto, como los que se leen de un archivo o de la entrada del usuario
+    return "".join(list(texto))
+
+
+class TestRegistroNombres(unittest.TestCase):
+
+    def test_una_instancia_por_nombre(self):
+        registro = RegistroNombres()
+        primera = registro.canonico(_copia("Pediatría"))
+        self.assertIs(registro.canonico(_copia("Pediatría")), primera)
+        self.assertIs(registro.buscar(_copia("Pediatría")), primera)
+        self.assertIsNone(registro.buscar("Odontología"))
+        self.assertEqual(len(registro), 1)
+
+    def test_especialidades_y_turnos_comparten_los_nombres(self):
+        especialidad = Especialidad(_copia("Neumonología"), [_copia("Lunes"), "Miércoles", "feriado"])
+        self.assertIs(especialidad.obtener_especialidad(), ESPECIALIDADES.buscar("Neumonología"))
+        dias = especialidad.obtener_dias()
+        self.assertIs(dias[0], DIAS_SEMANA_ES[0])
+        self.assertIs(dias[1], DIAS_SEMANA_ES[2])
+        self.assertEqual(dias[2], "feriado")
+
+        turno = Turno(Paciente("Laura Palmer", "1", "01/01/1990"), Medico("Dr. House", "MAT001"),
+                      datetime(2030, 1, 7, 10, 0), _copia("Neumonología"))
+        self.assertIs(turno.obtener_especialidad_atendida(), especialidad.obtener_especialidad())
+
+
+if __name__ == "__main__":
+    unittest.main()
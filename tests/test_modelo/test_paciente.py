@@ -16,3 +16,11 @@ class TestPaciente(unittest.TestCase):
         paciente = Paciente("Carlos Solari", "11223344", "10/10/2000")
         self.assertEqual(paciente.obtener_dni(), "11223344")
         self.assertEqual(str(paciente), "Carlos Solari, 11223344, 10/10/2000")
+
+    def test_obtener_fecha_nacimiento(self):
+        paciente = Paciente("Carlos Solari", "11223344", "10/10/2000")
+        self.assertEqual(paciente.obtener_fecha_nacimiento(), "10/10/2000")
+
+    def test_paciente_sin_dict_por_instancia(self):
+        paciente = Paciente("Carlos Solari", "11223344", "10/10/2000")
+        self.assertFalse(hasattr(paciente, "__dict__"))
@@ -39,6 +39,26 @@ class TestReceta(unittest.TestCase):
         self.assertIn(str(self.fecha), representacion)
 
         self.assertIn("\n", representacion)
+    def test_obtener_datos_receta(self):
+        self.assertEqual(self.receta.obtener_paciente(), self.paciente)
+        self.assertEqual(self.receta.obtener_medico(), self.medico)
+        self.assertEqual(self.receta.obtener_medicamentos(), self.medicamentos)
+        self.assertEqual(self.receta.obtener_fecha_emision(), self.fecha)
+
+    def test_fecha_por_defecto_es_el_momento_de_emision(self):
+        antes = datetime.now()
+        receta = Receta(self.paciente, self.medico, self.medicamentos)
+        self.assertGreaterEqual(receta.obtener_fecha_emision(), antes)
+        self.assertLessEqual(receta.obtener_fecha_emision(), datetime.now())
+
+    def test_receta_sin_dict_por_instancia(self):
+        self.assertFalse(hasattr(self.receta, "__dict__"))
+
+    def test_medicamentos_compartidos_entre_recetas(self):
+        # Textos iguales leídos por separado (por ejemplo, de disco) terminan siendo el mismo objeto
+        leido = "".join(["Sertralina", " 50mg"])
+        otra = Receta(self.paciente, self.medico, [leido])
+        self.assertIs(otra.obtener_medicamentos()[0], self.receta.obtener_medicamentos()[1])
 
 if __name__ == '__main__':
     unittest.main()
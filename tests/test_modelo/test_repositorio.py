@@ -0,0 +1,79 @@
+import unittest
+from src.clinica_gestion.modelo.repositorio import ListaPorId
+
+
+class TestListaPorId(unittest.TestCase):
+
+    def setUp(self):
+        # Bloques chicos para ejercitar los cortes entre bloques
+        self.lista = ListaPorId(lambda elemento: elemento[0])
+        self.lista.TAMANIO_BLOQUE = 4
+
+    def _ids(self, desde: int = 0) -> list[int]:
+        return [id_elemento for id_elemento, _ in self.lista.iterar(desde)]
+
+    def test_agregar_obtener_y_quitar(self):
+        for id_elemento in range(1, 11):
+            self.lista.agregar((id_elemento, f"turno {id_elemento}"))
+        self.assertEqual(self.lista.obtener(7), (7, "turno 7"))
+        self.assertEqual(self.lista.quitar(7), (7, "turno 7"))
+        self.assertIsNone(self.lista.quitar(7))
+        self.assertIsNone(self.lista.obtener(7))
+        for id_elemento in (1, 2, 3, 4):
+            self.lista.quitar(id_elemento)
+        self.assertEqual(self._ids(), [5, 6, 8, 9, 10])
+        self.assertEqual(len(self.lista), 5)
+
+    def test_iterar_desde_una_posicion(self):
+        for id_elemento in range(1, 11):
+            self.lista.agregar((id_elemento, None))
+        self.lista.quitar(2)
+        self.assertEqual(self._ids(3), [5, 6, 7, 8, 9, 10])
+        self.assertEqual(self._ids(9), [])
+
+    def test_insertar_en_el_medio(self):
+        for id_elemento in range(10, 110, 10):
+            self.lista.agregar((id_elemento, None))
+        for id_elemento in range(21, 30):
+            self.lista.agregar((id_elemento, None))
+        self.lista.agregar((5, None))
+        self.assertEqual(self._ids(), sorted([5, *range(10, 110, 10), *range(21, 30)]))
+        self.assertEqual(self._ids(3), [21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 40, 50, 60, 70, 80, 90, 100])
+        with self.assertRaises(ValueError):
+            self.lista.agregar((25, None))
+
+    def test_vecinos_y_recorrido_por_id(self):
+        self.assertIsNone(self.lista.anterior(10))
+        self.assertIsNone(self.lista.siguiente(10))
+        for id_elemento in range(10, 110, 10):
+            self.lista.agregar((id_elemento, None))
+        self.assertIsNone(self.lista.anterior(10))
+        self.assertEqual(self.lista.anterior(11), (10, None))
+        self.assertEqual(self.lista.anterior(50), (40, None))
+        self.assertEqual(self.lista.anterior(500), (100, None))
+        self.assertEqual(self.lista.siguiente(50), (50, None))
+        self.assertEqual(self.lista.siguiente(41), (50, None))
+        self.assertIsNone(self.lista.siguiente(101))
+        self.lista.quitar(50)
+        self.assertEqual(self.lista.anterior(60), (40, None))
+        self.assertEqual(self.lista.siguiente(41), (60, None))
+        self.assertEqual([id_elemento for id_elemento, _ in self.lista.iterar_desde_id(35)], [40, 60, 70, 80, 90, 100])
+        self.assertEqual(list(self.lista.iterar_desde_id(101)), [])
+
+    def test_cambios_durante_el_recorrido(self):
+        for id_elemento in range(1, 9):
+            self.lista.agregar((id_elemento, None))
+        recorridos = []
+        for id_elemento, _ in self.lista.iterar():
+            recorridos.append(id_elemento)
+            if id_elemento == 2:
+                # Se quita todo el bloque actual y parte del siguiente, y se agrega un elemento al final:
+                # el bloque actual ya se había copiado, el siguiente se busca a partir del último ID recorrido
+                for quitado in (1, 3, 4, 5):
+                    self.lista.quitar(quitado)
+                self.lista.agregar((9, None))
+        self.assertEqual(recorridos, [1, 2, 3, 4, 6, 7, 8, 9])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -46,6 +46,21 @@ class TestTurno(unittest.TestCase):
         fecha_hora_dt = datetime(2025, 12, 24, 16, 00)
         turno_navidad = Turno(self.paciente, self.medico, fecha_hora_dt, "Psiquiatría")
         self.assertEqual(turno_navidad.obtener_fecha_hora(), fecha_hora_dt)
+    def test_id_turno(self):
+        self.assertIsNone(self.turno.obtener_id())
+        turno = Turno(self.paciente, self.medico, self.fecha_hora_turno_dt, "Psiquiatría", 42)
+        self.assertEqual(turno.obtener_id(), 42)
+        self.assertIn("ID: 42", str(turno))
+
+    def test_duracion_turno(self):
+        self.assertEqual(self.turno.obtener_minutos(), 30)
+        self.assertEqual(self.turno.obtener_fecha_hora_fin(), datetime(2025, 11, 21, 11, 0))
+        turno = Turno(self.paciente, self.medico, self.fecha_hora_turno_dt, "Psiquiatría", 42, 90)
+        self.assertEqual(turno.obtener_fecha_hora_fin(), datetime(2025, 11, 21, 12, 0))
+        self.assertIn("Duración: 90 minutos", str(turno))
+
+    def test_turno_sin_dict_por_instancia(self):
+        self.assertFalse(hasattr(self.turno, "__dict__"))
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
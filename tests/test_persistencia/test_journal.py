@@ -0,0 +1,212 @@
+import os
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta
+from src.clinica_gestion.modelo.clinica import Clinica
+from src.clinica_gestion.modelo.especialidad import Especialidad
+from src.clinica_gestion.modelo.medico import Medico
+from src.clinica_gestion.modelo.paciente import Paciente
+from src.clinica_gestion.persistencia.journal import JournalClinica
+from src.clinica_gestion.modelo.excepciones import PacienteDuplicadoException
+
+class TestJournalClinica(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+
+        hoy = datetime.now()
+        dias_hasta_lunes = (7 - hoy.weekday()) % 7 or 7
+        self.fecha_lunes = (hoy + timedelta(days=dias_hasta_lunes)).replace(hour=10, minute=0, second=0, microsecond=0)
+        self.fecha_lunes_str = self.fecha_lunes.strftime("%Y-%m-%d %H:%M")
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def _crear_journal(self, **kwargs) -> JournalClinica:
+        journal = JournalClinica(self.directorio.name, sincronizar=False, **kwargs)
+        # Al terminar cada prueba se cierra el archivo sin compactar, como si el proceso se hubiera detenido
+        self.addCleanup(journal.cerrar, crear_snapshot=False)
+        return journal
+
+    def _cargar_datos(self, clinica: Clinica) -> None:
+        clinica.agregar_paciente(Paciente("Laura Palmer", "87654321", "15/07/1990"))
+        medico = Medico("Dr. Lawrence Jacoby", "MAT001")
+        medico.agregar_especialidad(Especialidad("Psiquiatría", ["lunes"]))
+        clinica.agregar_medico(medico)
+        clinica.agregar_especialidad("MAT001", Especialidad("Neurología", ["viernes"]))
+        clinica.agendar_turno("87654321", "MAT001", self.fecha_lunes_str, "Psiquiatría")
+        clinica.emitir_receta("87654321", "MAT001", ["Sertralina 50mg"], datetime(2025, 1, 10, 9, 0))
+
+    def _verificar_datos(self, clinica: Clinica) -> None:
+        self.assertEqual(clinica.obtener_paciente_por_matricula("87654321").obtener_nombre(), "Laura Palmer")
+        medico = clinica.obtener_medico_por_matricula("MAT001")
+        self.assertEqual(medico.obtener_especialidades_para_dia("viernes"), ["Neurología"])
+        turnos = clinica.obtener_turnos()
+        self.assertEqual(len(turnos), 1)
+        self.assertEqual(turnos[0].obtener_fecha_hora(), self.fecha_lunes)
+        historia = clinica.obtener_historia_clinica("87654321")
+        self.assertEqual(len(historia.obtener_turnos()), 1)
+        recetas = historia.obtener_recetas()
+        self.assertEqual(recetas[0].obtener_medicamentos(), ["Sertralina 50mg"])
+        self.assertEqual(recetas[0].obtener_fecha_emision(), datetime(2025, 1, 10, 9, 0))
+
+    def test_reabrir_reproduce_el_journal(self):
+        journal = self._crear_journal()
+        self._cargar_datos(journal.abrir())
+        journal.cerrar(crear_snapshot=False)
+        self.assertFalse(os.path.exists(journal.obtener_ruta_snapshot()))
+
+        clinica = self._crear_journal().abrir()
+        self._verificar_datos(clinica)
+
+    def test_cerrar_crea_snapshot_y_vacia_journal(self):
+        journal = self._crear_journal()
+        self._cargar_datos(journal.abrir())
+        journal.cerrar()
+
+        self.assertTrue(os.path.exists(journal.obtener_ruta_snapshot()))
+        self.assertEqual(os.path.getsize(journal.obtener_ruta_journal()), 0)
+        self._verificar_datos(self._crear_journal().abrir())
+
+    def test_snapshot_periodico_y_cola_del_journal(self):
+        journal = self._crear_journal(eventos_por_snapshot=3)
+        clinica = journal.abrir()
+        self._cargar_datos(clinica)
+        clinica.agregar_paciente(Paciente("Audrey Horne", "33445566", "01/12/1973"))
+
+        # Se compactó al llegar a 3 eventos: en el journal solo quedan los eventos posteriores
+        with open(journal.obtener_ruta_journal(), encoding="utf-8") as archivo:
+            self.assertEqual(len(archivo.readlines()), 3)
+
+        reabierta = self._crear_journal().abrir()
+        self._verificar_datos(reabierta)
+        self.assertEqual(len(reabierta.obtener_pacientes()), 2)
+
+    def test_cancelaciones_y_reprogramaciones(self):
+        journal = self._crear_journal()
+        clinica = journal.abrir()
+        self._cargar_datos(clinica)
+        clinica.agendar_turno("87654321", "MAT001", self.fecha_lunes.replace(hour=11).strftime("%Y-%m-%d %H:%M"), "Psiquiatría")
+        clinica.agendar_turno("87654321", "MAT001", self.fecha_lunes.replace(hour=12).strftime("%Y-%m-%d %H:%M"), "Psiquiatría")
+        nueva_fecha = self.fecha_lunes + timedelta(days=7)
+        clinica.reprogramar_turno(2, nueva_fecha.strftime("%Y-%m-%d %H:%M"))
+        clinica.cancelar_turno(3)
+        journal.cerrar(crear_snapshot=False)
+
+        def turnos(clinica):
+            return [(turno.obtener_id(), turno.obtener_fecha_hora()) for turno in clinica.obtener_turnos()]
+
+        reabierta = self._crear_journal()
+        clinica = reabierta.abrir()
+        self.assertEqual(turnos(clinica), [(1, self.fecha_lunes), (2, nueva_fecha)])
+        reabierta.cerrar()
+
+        # El snapshot conserva los IDs, y el del turno cancelado no se vuelve a usar
+        clinica = self._crear_journal().abrir()
+        self.assertEqual(turnos(clinica), [(1, self.fecha_lunes), (2, nueva_fecha)])
+        turno = clinica.agendar_turno("87654321", "MAT001", self.fecha_lunes.replace(hour=12).strftime("%Y-%m-%d %H:%M"), "Psiquiatría")
+        self.assertEqual(turno.obtener_id(), 4)
+
+    def test_duracion_de_los_turnos(self):
+        journal = self._crear_journal()
+        clinica = journal.abrir()
+        self._cargar_datos(clinica)
+        clinica.agendar_turno("87654321", "MAT001", self.fecha_lunes.replace(hour=11).strftime("%Y-%m-%d %H:%M"), "Psiquiatría", 90)
+        clinica.reprogramar_turno(2, (self.fecha_lunes + timedelta(days=7)).strftime("%Y-%m-%d %H:%M"))
+        journal.cerrar(crear_snapshot=False)
+
+        def minutos(clinica):
+            return [turno.obtener_minutos() for turno in clinica.obtener_turnos()]
+
+        reabierta = self._crear_journal()
+        self.assertEqual(minutos(reabierta.abrir()), [30, 90])
+        reabierta.cerrar()
+        self.assertEqual(minutos(self._crear_journal().abrir()), [30, 90])
+
+    def test_serie_de_turnos_en_un_solo_evento(self):
+        journal = self._crear_journal()
+        clinica = journal.abrir()
+        self._cargar_datos(clinica)
+        secuencia = journal.obtener_secuencia()
+        clinica.agendar_serie_turnos("87654321", "MAT001", self.fecha_lunes.replace(hour=11).strftime("%Y-%m-%d %H:%M"),
+                                     "Psiquiatría", 10)
+        self.assertEqual(journal.obtener_secuencia(), secuencia + 1)
+        journal.cerrar(crear_snapshot=False)
+
+        turnos = self._crear_journal().abrir().obtener_turnos()
+        self.assertEqual([turno.obtener_id() for turno in turnos], list(range(1, 12)))
+        self.assertEqual(turnos[-1].obtener_fecha_hora(), self.fecha_lunes.replace(hour=11) + timedelta(weeks=9))
+
+    def test_operacion_rechazada_no_se_registra(self):
+        journal = self._crear_journal()
+        clinica = journal.abrir()
+        clinica.agregar_paciente(Paciente("Laura Palmer", "87654321", "15/07/1990"))
+        with self.assertRaises(PacienteDuplicadoException):
+            clinica.agregar_paciente(Paciente("Laura Palmer", "87654321", "15/07/1990"))
+        self.assertEqual(journal.obtener_secuencia(), 1)
+
+    def test_linea_incompleta_al_final_se_descarta(self):
+        journal = self._crear_journal()
+        self._cargar_datos(journal.abrir())
+        journal.cerrar(crear_snapshot=False)
+        with open(journal.obtener_ruta_journal(), "a", encoding="utf-8") as archivo:
+            archivo.write('{"seq": 99, "op": "agregar_pac')
+
+        reabierto = self._crear_journal()
+        clinica = reabierto.abrir()
+        self._verificar_datos(clinica)
+
+        clinica.agregar_paciente(Paciente("Audrey Horne", "33445566", "01/12/1973"))
+        reabierto.cerrar(crear_snapshot=False)
+        self.assertEqual(len(self._crear_journal().abrir().obtener_pacientes()), 2)
+
+    def test_linea_danada_en_el_medio_no_se_descarta_en_silencio(self):
+        journal = self._crear_journal()
+        self._cargar_datos(journal.abrir())
+        journal.cerrar(crear_snapshot=False)
+        ruta = journal.obtener_ruta_journal()
+        with open(ruta, encoding="utf-8") as archivo:
+            lineas = archivo.readlines()
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.writelines([lineas[0], "{esto no es json\n", *lineas[1:]])
+        tamanio = os.path.getsize(ruta)
+
+        with self.assertRaises(ValueError) as contexto:
+            self._crear_journal().abrir()
+        self.assertIn("línea 2", str(contexto.exception))
+        # Los eventos posteriores siguen en el archivo para poder recuperarlos
+        self.assertEqual(os.path.getsize(ruta), tamanio)
+
+    def test_escrituras_concurrentes_con_snapshots(self):
+        journal = self._crear_journal(eventos_por_snapshot=7)
+        clinica = journal.abrir(Clinica(concurrente=True))
+        for i in range(4):
+            medico = Medico(f"Dr. {i}", f"MAT{i}")
+            medico.agregar_especialidad(Especialidad("Psiquiatría", ["lunes"]))
+            clinica.agregar_medico(medico)
+
+        def trabajar(indice: int) -> None:
+            dni = f"DNI{indice}"
+            clinica.agregar_paciente(Paciente(f"Paciente {indice}", dni, "01/01/1980"))
+            for j in range(10):
+                horario = (self.fecha_lunes + timedelta(minutes=30 * j)).strftime("%Y-%m-%d %H:%M")
+                clinica.agendar_turno(dni, f"MAT{indice}", horario, "Psiquiatría")
+                clinica.emitir_receta(dni, f"MAT{indice}", [f"Medicamento {j}"], datetime(2025, 1, 1, 9, j))
+
+        hilos = [threading.Thread(target=trabajar, args=(i,)) for i in range(4)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        journal.cerrar(crear_snapshot=False)
+
+        # Lo que no entró en el último snapshot tiene que estar en la cola del journal
+        reabierta = self._crear_journal().abrir()
+        self.assertEqual(len(reabierta.obtener_pacientes()), 4)
+        self.assertEqual(len(reabierta.obtener_turnos()), 40)
+        for i in range(4):
+            self.assertEqual(len(reabierta.obtener_historia_clinica(f"DNI{i}").obtener_recetas()), 10)
+
+if __name__ == '__main__':
+    unittest.main()
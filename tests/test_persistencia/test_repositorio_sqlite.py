@@ -0,0 +1,121 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime
+from src.clinica_gestion.modelo.clinica import Clinica
+from src.clinica_gestion.modelo.especialidad import Especialidad
+from src.clinica_gestion.modelo.excepciones import TurnoOcupadoException
+from src.clinica_gestion.modelo.medico import Medico
+from src.clinica_gestion.modelo.paciente import Paciente
+from src.clinica_gestion.persistencia.repositorio_sqlite import RepositorioSQLite
+
+class TestRepositorioSQLite(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "clinica.db")
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def _abrir_clinica(self) -> Clinica:
+        repositorio = RepositorioSQLite(self.ruta)
+        self.addCleanup(repositorio.cerrar)
+        return Clinica(repositorio)
+
+    def _cargar_datos(self, clinica: Clinica) -> None:
+        clinica.agregar_paciente(Paciente("Laura Palmer", "87654321", "15/07/1990"))
+        medico = Medico("Dr. Lawrence Jacoby", "MAT001")
+        medico.agregar_especialidad(Especialidad("Psiquiatría", ["lunes", "miércoles"]))
+        clinica.agregar_medico(medico)
+        clinica.agregar_especialidad("MAT001", Especialidad("Neurología", ["viernes"]))
+        clinica.restaurar_turno("87654321", "MAT001", datetime(2025, 3, 5, 10, 0), "Psiquiatría")
+        clinica.restaurar_turno("87654321", "MAT001", datetime(2025, 3, 3, 9, 30), "Psiquiatría")
+        clinica.emitir_receta("87654321", "MAT001", ["Sertralina 50mg"], datetime(2025, 3, 3, 9, 45))
+        clinica.emitir_receta("87654321", "MAT001", ["Ibuprofeno 400mg", "Omeprazol"], datetime(2025, 3, 5, 10, 15))
+
+    def test_datos_persisten_al_reabrir(self):
+        self._cargar_datos(self._abrir_clinica())
+
+        clinica = self._abrir_clinica()
+
+        self.assertEqual(clinica.obtener_paciente_por_matricula("87654321").obtener_fecha_nacimiento(), "15/07/1990")
+        medico = clinica.obtener_medico_por_matricula("MAT001")
+        self.assertEqual(medico.obtener_especialidades_para_dia("miércoles"), ["Psiquiatría"])
+        self.assertEqual(medico.obtener_especialidades_para_dia("viernes"), ["Neurología"])
+
+        historia = clinica.obtener_historia_clinica("87654321")
+        self.assertEqual([t.obtener_fecha_hora().day for t in historia.obtener_turnos()], [3, 5])
+        recetas = historia.obtener_recetas()
+        self.assertEqual(recetas[0].obtener_medicamentos(), ["Ibuprofeno 400mg", "Omeprazol"])
+        self.assertEqual(recetas[1].obtener_fecha_emision(), datetime(2025, 3, 3, 9, 45))
+
+    def test_turnos_en_orden_de_alta_y_agenda_por_fecha(self):
+        clinica = self._abrir_clinica()
+        self._cargar_datos(clinica)
+
+        self.assertEqual([t.obtener_fecha_hora().day for t in clinica.obtener_turnos()], [5, 3])
+        agenda = clinica.obtener_turnos_medico_entre("MAT001", datetime(2025, 3, 1), datetime(2025, 3, 31))
+        self.assertEqual([t.obtener_fecha_hora().day for t in agenda], [3, 5])
+        proximo = clinica.obtener_proximo_turno_medico("MAT001", datetime(2025, 3, 4))
+        self.assertEqual(proximo.obtener_fecha_hora(), datetime(2025, 3, 5, 10, 0))
+
+    def test_base_sin_duracion_de_turnos(self):
+        # Una base creada antes de que los turnos tuvieran duración: sus turnos duran lo estándar
+        with sqlite3.connect(self.ruta) as conexion:
+            conexion.executescript("""
+                CREATE TABLE pacientes (dni TEXT PRIMARY KEY, nombre TEXT NOT NULL, fecha_nacimiento TEXT NOT NULL);
+                CREATE TABLE medicos (matricula TEXT PRIMARY KEY, nombre TEXT NOT NULL);
+                CREATE TABLE turnos (id INTEGER PRIMARY KEY AUTOINCREMENT, dni TEXT NOT NULL, matricula TEXT NOT NULL,
+                                     fecha_hora TEXT NOT NULL, especialidad TEXT NOT NULL);
+                INSERT INTO pacientes VALUES ('87654321', 'Laura Palmer', '15/07/1990');
+                INSERT INTO medicos VALUES ('MAT001', 'Dr. Lawrence Jacoby');
+                INSERT INTO turnos (dni, matricula, fecha_hora, especialidad)
+                    VALUES ('87654321', 'MAT001', '2025-03-03 09:30:00.000000', 'Psiquiatría');
+            """)
+        conexion.close()
+
+        clinica = self._abrir_clinica()
+        self.assertEqual([turno.obtener_minutos() for turno in clinica.obtener_turnos()], [30])
+        with self.assertRaises(TurnoOcupadoException):
+            clinica.restaurar_turno("87654321", "MAT001", datetime(2025, 3, 3, 9, 30), "Psiquiatría")
+        clinica.restaurar_turno("87654321", "MAT001", datetime(2025, 3, 3, 10, 0), "Psiquiatría", minutos=45)
+        self.assertEqual([turno.obtener_minutos() for turno in self._abrir_clinica().obtener_turnos()], [30, 45])
+
+    def test_transaccion_deshace_cambios_ante_error(self):
+        clinica = self._abrir_clinica()
+        with self.assertRaises(RuntimeError):
+            with clinica.transaccion():
+                clinica.agregar_paciente(Paciente("Audrey Horne", "33445566", "01/12/1973"))
+                with clinica.transaccion():
+                    clinica.agregar_paciente(Paciente("Donna Hayward", "44556677", "20/05/1972"))
+                raise RuntimeError("falla")
+
+        self.assertEqual(clinica.obtener_pacientes(), [])
+
+    def test_transaccion_anidada_deshace_solo_sus_cambios(self):
+        clinica = self._abrir_clinica()
+        with clinica.transaccion():
+            clinica.agregar_paciente(Paciente("Audrey Horne", "33445566", "01/12/1973"))
+            with self.assertRaises(RuntimeError):
+                with clinica.transaccion():
+                    clinica.agregar_paciente(Paciente("Donna Hayward", "44556677", "20/05/1972"))
+                    raise RuntimeError("falla")
+            clinica.agregar_paciente(Paciente("Shelly Johnson", "55667788", "03/03/1975"))
+
+        dnis = [paciente.obtener_dni() for paciente in self._abrir_clinica().obtener_pacientes()]
+        self.assertEqual(dnis, ["33445566", "55667788"])
+
+    def test_indices_creados(self):
+        repositorio = RepositorioSQLite(self.ruta)
+        repositorio.cerrar()
+
+        with sqlite3.connect(self.ruta) as conexion:
+            indices = {fila[0] for fila in conexion.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        conexion.close()
+        self.assertIn("idx_turnos_medico_fecha", indices)
+        self.assertIn("idx_turnos_paciente_fecha", indices)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import asyncio
+import json
+import unittest
+from src.clinica_gestion.servicio.cliente import ClienteClinica
+
+class TestClienteClinica(unittest.IsolatedAsyncioTestCase):
+
+    async def _iniciar_servidor(self, atender) -> int:
+        servidor = await asyncio.start_server(atender, "127.0.0.1", 0)
+        self.addAsyncCleanup(servidor.wait_closed)
+        self.addCleanup(servidor.close)
+        return servidor.sockets[0].getsockname()[1]
+
+    async def test_servidor_que_cierra_la_conexion(self):
+        async def cerrar_al_recibir(lector, escritor):
+            await lector.readline()
+            escritor.close()
+
+        cliente = await ClienteClinica.conectar_tcp("127.0.0.1", await self._iniciar_servidor(cerrar_al_recibir))
+        with self.assertRaises(ConnectionError):
+            await cliente.solicitar("ping")
+        with self.assertRaises(ConnectionError):
+            await cliente.solicitar("ping")
+        await cliente.cerrar()
+
+    async def test_respuesta_con_id_inesperado(self):
+        async def responder_mal(lector, escritor):
+            await lector.readline()
+            escritor.write(b'{"id": 99, "ok": true, "resultado": "pong"}\n')
+            await escritor.drain()
+            await lector.read()
+            escritor.close()
+
+        cliente = await ClienteClinica.conectar_tcp("127.0.0.1", await self._iniciar_servidor(responder_mal))
+        with self.assertRaises(ConnectionError):
+            await asyncio.wait_for(cliente.solicitar("ping"), timeout=5)
+        await cliente.cerrar()
+
+    async def test_solicitud_cancelada_no_corta_la_conexion(self):
+        async def responder_de_a_dos(lector, escritor):
+            # La primera respuesta llega recién cuando el cliente ya canceló esa solicitud y mandó otra
+            while primera := await lector.readline():
+                segunda = await lector.readline()
+                for linea in (primera, segunda):
+                    id_solicitud = json.loads(linea)["id"]
+                    escritor.write(json.dumps({"id": id_solicitud, "ok": True, "resultado": id_solicitud}).encode() + b"\n")
+                await escritor.drain()
+            escritor.close()
+
+        cliente = await ClienteClinica.conectar_tcp("127.0.0.1", await self._iniciar_servidor(responder_de_a_dos))
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(cliente.solicitar("ping"), timeout=0.1)
+        self.assertEqual(await asyncio.wait_for(cliente.solicitar("ping"), timeout=5), 2)
+        self.assertEqual(await asyncio.wait_for(asyncio.gather(cliente.solicitar("ping"), cliente.solicitar("ping")), timeout=5), [3, 4])
+        await cliente.cerrar()
+
+if __name__ == '__main__':
+    unittest.main()
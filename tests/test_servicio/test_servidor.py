@@ -0,0 +1,300 @@
+import asyncio
+import json
+import os
+import socket
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from src.clinica_gestion.modelo.clinica import Clinica
+from src.clinica_gestion.servicio.cliente import ClienteClinica
+from src.clinica_gestion.servicio.servidor import ServidorClinica
+from src.clinica_gestion.modelo.excepciones import ServicioClinicaException
+
+class TestServidorClinica(unittest.IsolatedAsyncioTestCase):
+
+    def crear_clinica(self) -> Clinica:
+        return Clinica()
+
+    async def asyncSetUp(self):
+        self.clinica = self.crear_clinica()
+        self.servidor_clinica = ServidorClinica(self.clinica, **self.opciones_servidor())
+        self.servidor = await self.servidor_clinica.iniciar_tcp("127.0.0.1", 0)
+        self.puerto = self.servidor.sockets[0].getsockname()[1]
+        # Se registra primero para que se ejecute al final, después de cerrar los clientes
+        self.addAsyncCleanup(self.servidor_clinica.detener)
+
+        hoy = datetime.now()
+        proximo_lunes = hoy + timedelta(days=(7 - hoy.weekday()) % 7 or 7)
+        self.fecha_lunes_str = proximo_lunes.strftime("%Y-%m-%d 10:00")
+
+    def opciones_servidor(self) -> dict:
+        return {}
+
+    async def _conectar(self) -> ClienteClinica:
+        cliente = await ClienteClinica.conectar_tcp("127.0.0.1", self.puerto)
+        self.addAsyncCleanup(cliente.cerrar)
+        return cliente
+
+    async def _cargar_datos(self, cliente: ClienteClinica) -> None:
+        await cliente.solicitar("agregar_paciente", nombre="Laura Palmer", dni="87654321", fecha_nacimiento="15/07/1990")
+        await cliente.solicitar("agregar_medico", nombre="Dr. Lawrence Jacoby", matricula="MAT001",
+                                especialidades=[{"tipo": "Psiquiatría", "dias": ["lunes"]}])
+
+    async def test_ping(self):
+        cliente = await self._conectar()
+        self.assertEqual(await cliente.solicitar("ping"), "pong")
+
+    async def test_flujo_completo(self):
+        cliente = await self._conectar()
+        await self._cargar_datos(cliente)
+        turno = await cliente.solicitar("agendar_turno", dni="87654321", matricula="MAT001",
+                                        fecha_hora=self.fecha_lunes_str, especialidad="Psiquiatría")
+        self.assertEqual(turno["matricula"], "MAT001")
+        await cliente.solicitar("emitir_receta", dni="87654321", matricula="MAT001", medicamentos=["Sertralina 50mg"])
+
+        historia = await cliente.solicitar("obtener_historia_clinica", dni="87654321")
+        self.assertEqual(historia["paciente"]["nombre"], "Laura Palmer")
+        self.assertEqual(len(historia["turnos"]), 1)
+        self.assertEqual(historia["recetas"][0]["medicamentos"], ["Sertralina 50mg"])
+        # El estado vive en la clínica del proceso servidor
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+
+    async def test_cancelar_y_reprogramar_turno(self):
+        cliente = await self._conectar()
+        await self._cargar_datos(cliente)
+        turno = await cliente.solicitar("agendar_turno", dni="87654321", matricula="MAT001",
+                                        fecha_hora=self.fecha_lunes_str, especialidad="Psiquiatría")
+        proximo_lunes = (datetime.strptime(self.fecha_lunes_str, "%Y-%m-%d %H:%M") + timedelta(days=7)).strftime("%Y-%m-%d %H:%M")
+        reprogramado = await cliente.solicitar("reprogramar_turno", id=turno["id"], fecha_hora=proximo_lunes)
+        self.assertEqual((reprogramado["id"], reprogramado["fecha_hora"]), (turno["id"], proximo_lunes.replace(" ", "T") + ":00"))
+
+        cancelado = await cliente.solicitar("cancelar_turno", id=turno["id"])
+        self.assertEqual(cancelado["id"], turno["id"])
+        self.assertEqual(await cliente.solicitar("obtener_turnos"), [])
+        with self.assertRaises(ServicioClinicaException) as contexto:
+            await cliente.solicitar("cancelar_turno", id=turno["id"])
+        self.assertEqual(contexto.exception.tipo, "TurnoNoEncontradoException")
+
+    async def test_agendar_serie_turnos(self):
+        cliente = await self._conectar()
+        await self._cargar_datos(cliente)
+        turnos = await cliente.solicitar("agendar_serie_turnos", dni="87654321", matricula="MAT001",
+                                         fecha_hora=self.fecha_lunes_str, especialidad="Psiquiatría", cantidad=4)
+        self.assertEqual(len(turnos), 4)
+        with self.assertRaises(ServicioClinicaException) as contexto:
+            await cliente.solicitar("agendar_serie_turnos", dni="87654321", matricula="MAT001",
+                                    fecha_hora=self.fecha_lunes_str, especialidad="Psiquiatría", cantidad=2,
+                                    dias_entre_turnos=1)
+        self.assertEqual(contexto.exception.tipo, "SerieTurnosNoDisponibleException")
+        self.assertEqual(len(self.clinica.obtener_turnos()), 4)
+
+    async def test_agendar_turno_con_duracion(self):
+        cliente = await self._conectar()
+        await self._cargar_datos(cliente)
+        turno = await cliente.solicitar("agendar_turno", dni="87654321", matricula="MAT001",
+                                        fecha_hora=self.fecha_lunes_str, especialidad="Psiquiatría", minutos=60)
+        self.assertEqual(turno["minutos"], 60)
+        media_hora_despues = (datetime.strptime(self.fecha_lunes_str, "%Y-%m-%d %H:%M") + timedelta(minutes=30)).strftime("%Y-%m-%d %H:%M")
+        with self.assertRaises(ServicioClinicaException) as contexto:
+            await cliente.solicitar("agendar_turno", dni="87654321", matricula="MAT001",
+                                    fecha_hora=media_hora_despues, especialidad="Psiquiatría")
+        self.assertEqual(contexto.exception.tipo, "TurnoOcupadoException")
+
+    async def test_metricas(self):
+        cliente = await self._conectar()
+        self.assertEqual(await cliente.solicitar("metricas"), {})
+        self.clinica.habilitar_metricas()
+        await self._cargar_datos(cliente)
+        metricas = await cliente.solicitar("metricas")
+        self.assertEqual(metricas["agregar_paciente"]["llamadas"], 1)
+        self.assertEqual(metricas["agregar_medico"]["latencia"]["buckets"]["+Inf"], 1)
+
+    async def test_buscar_por_nombre(self):
+        cliente = await self._conectar()
+        await self._cargar_datos(cliente)
+        pacientes = await cliente.solicitar("buscar_pacientes", texto="palmer")
+        self.assertEqual([paciente["dni"] for paciente in pacientes], ["87654321"])
+        medicos = await cliente.solicitar("buscar_medicos", texto="lawrence", limite=5)
+        self.assertEqual([medico["matricula"] for medico in medicos], ["MAT001"])
+
+    async def test_buscar_proximo_turno_libre(self):
+        cliente = await self._conectar()
+        await self._cargar_datos(cliente)
+        desde = self.fecha_lunes_str[:11] + "09:00"
+        libres = await cliente.solicitar("buscar_proximo_turno_libre", especialidad="Psiquiatría", desde=desde, cantidad=2)
+        self.assertEqual([libre["fecha_hora"] for libre in libres], [desde, desde[:11] + "09:30"])
+        self.assertEqual(libres[0]["medico"]["matricula"], "MAT001")
+
+    async def test_pacientes_con_medicamento(self):
+        cliente = await self._conectar()
+        await self._cargar_datos(cliente)
+        await cliente.solicitar("emitir_receta", dni="87654321", matricula="MAT001", medicamentos=["Sertralina 50mg"])
+        pacientes = await cliente.solicitar("obtener_pacientes_con_medicamento", medicamento="sertralina", desde="2020-01-01 00:00")
+        self.assertEqual([paciente["dni"] for paciente in pacientes], ["87654321"])
+
+    async def test_agregar_especialidad(self):
+        cliente = await self._conectar()
+        await self._cargar_datos(cliente)
+        medico = await cliente.solicitar("agregar_especialidad", matricula="MAT001", tipo="Neurología", dias=["viernes"])
+        self.assertEqual([esp["tipo"] for esp in medico["especialidades"]], ["Psiquiatría", "Neurología"])
+        # Los días van en una lista: un texto no se separa letra por letra
+        with self.assertRaises(ServicioClinicaException) as contexto:
+            await cliente.solicitar("agregar_especialidad", matricula="MAT001", tipo="Pediatría", dias="martes")
+        self.assertEqual(contexto.exception.tipo, "ValueError")
+        self.assertIn("deben ser una lista", str(contexto.exception))
+        with self.assertRaises(ServicioClinicaException):
+            await cliente.solicitar("agregar_medico", nombre="Dr. Hayward", matricula="MAT002",
+                                    especialidades=[{"tipo": "Cardiología", "dias": "lunes"}])
+        self.assertEqual(len(self.clinica.obtener_medicos()), 1)
+
+    async def test_error_de_la_clinica(self):
+        cliente = await self._conectar()
+        await self._cargar_datos(cliente)
+        with self.assertRaises(ServicioClinicaException) as contexto:
+            await cliente.solicitar("agregar_paciente", nombre="Laura Palmer", dni="87654321", fecha_nacimiento="15/07/1990")
+        self.assertEqual(contexto.exception.tipo, "PacienteDuplicadoException")
+        # La conexión sigue siendo utilizable después de un error
+        self.assertEqual(len(await cliente.solicitar("obtener_pacientes")), 1)
+
+    async def test_operacion_desconocida_y_argumento_faltante(self):
+        cliente = await self._conectar()
+        with self.assertRaises(ServicioClinicaException) as contexto:
+            await cliente.solicitar("borrar_todo")
+        self.assertEqual(contexto.exception.tipo, "ValueError")
+        with self.assertRaises(ServicioClinicaException) as contexto:
+            await cliente.solicitar("obtener_paciente")
+        self.assertEqual(contexto.exception.tipo, "SolicitudInvalida")
+
+    async def test_argumentos_de_tipo_incorrecto(self):
+        cliente = await self._conectar()
+        await self._cargar_datos(cliente)
+        for operacion, argumentos in (
+            ("obtener_paciente", {"dni": ["87654321"]}),
+            ("emitir_receta", {"dni": "87654321", "matricula": "MAT001", "medicamentos": [None]}),
+            ("emitir_receta", {"dni": "87654321", "matricula": "MAT001", "medicamentos": "Sertralina"}),
+            ("agendar_turno", {"dni": "87654321", "matricula": {"a": 1}, "fecha_hora": self.fecha_lunes_str,
+                               "especialidad": "Psiquiatría"}),
+            ("agendar_turno", {"dni": "87654321", "matricula": "MAT001", "fecha_hora": self.fecha_lunes_str,
+                               "especialidad": "Psiquiatría", "minutos": "30"}),
+            ("cancelar_turno", {"id": True}),
+            ("cancelar_turno", {"id": 1.9}),
+            ("reprogramar_turno", {"id": "1", "fecha_hora": self.fecha_lunes_str}),
+            ("buscar_pacientes", {"texto": "laura", "limite": 2.5}),
+        ):
+            with self.subTest(operacion=operacion, argumentos=argumentos):
+                with self.assertRaises(ServicioClinicaException) as contexto:
+                    await cliente.solicitar(operacion, **argumentos)
+                self.assertEqual(contexto.exception.tipo, "ValueError")
+        self.assertEqual(self.clinica.obtener_historia_clinica("87654321").obtener_recetas(), [])
+        self.assertEqual(self.clinica.obtener_turnos(), [])
+        self.assertEqual(await cliente.solicitar("ping"), "pong")
+
+    async def test_error_inesperado_no_corta_la_conexion(self):
+        cliente = await self._conectar()
+
+        def fallar():
+            raise RuntimeError("falla del repositorio")
+
+        self.clinica.obtener_pacientes = fallar
+        with self.assertRaises(ServicioClinicaException) as contexto:
+            await cliente.solicitar("obtener_pacientes")
+        self.assertEqual(contexto.exception.tipo, "ErrorInesperado")
+        self.assertIn("falla del repositorio", str(contexto.exception))
+        self.assertEqual(await cliente.solicitar("ping"), "pong")
+
+    async def test_json_invalido(self):
+        lector, escritor = await asyncio.open_connection("127.0.0.1", self.puerto)
+        escritor.write(b'{"id": 1, "op": \n[1, 2]\n{"id": 3, "op": "ping"}\n')
+        await escritor.drain()
+        respuestas = [json.loads(await lector.readline()) for _ in range(3)]
+        escritor.close()
+        await escritor.wait_closed()
+
+        self.assertFalse(respuestas[0]["ok"])
+        self.assertFalse(respuestas[1]["ok"])
+        self.assertEqual(respuestas[2], {"id": 3, "ok": True, "resultado": "pong"})
+
+    async def test_pipelining_respeta_el_orden(self):
+        cliente = await self._conectar()
+        # Las solicitudes se envían sin esperar respuestas: el alta de cada paciente llega antes que su consulta
+        tareas = []
+        for i in range(50):
+            tareas.append(cliente.solicitar("agregar_paciente", nombre=f"Paciente {i}", dni=f"DNI{i}", fecha_nacimiento="01/01/1980"))
+            tareas.append(cliente.solicitar("obtener_paciente", dni=f"DNI{i}"))
+        resultados = await asyncio.gather(*tareas)
+        self.assertEqual([r["dni"] for r in resultados[1::2]], [f"DNI{i}" for i in range(50)])
+
+    async def test_cliente_lento_no_pierde_respuestas(self):
+        # El cliente escribe muchas solicitudes sin leer: el servidor deja de leer al llenarse la cola
+        # de pendientes y continúa cuando el cliente empieza a consumir las respuestas
+        lector, escritor = await asyncio.open_connection("127.0.0.1", self.puerto)
+        cantidad = 2000
+        escritura = asyncio.create_task(self._escribir_pings(escritor, cantidad))
+        await asyncio.sleep(0.05)
+        ids = [json.loads(await lector.readline())["id"] for _ in range(cantidad)]
+        await escritura
+        escritor.close()
+        await escritor.wait_closed()
+        self.assertEqual(ids, list(range(cantidad)))
+
+    async def _escribir_pings(self, escritor: asyncio.StreamWriter, cantidad: int) -> None:
+        for i in range(cantidad):
+            escritor.write(json.dumps({"id": i, "op": "ping"}).encode() + b"\n")
+            await escritor.drain()
+
+    async def test_clientes_concurrentes_no_duplican_turnos(self):
+        cliente = await self._conectar()
+        await self._cargar_datos(cliente)
+        clientes = [await self._conectar() for _ in range(10)]
+
+        resultados = await asyncio.gather(
+            *(c.solicitar("agendar_turno", dni="87654321", matricula="MAT001",
+                          fecha_hora=self.fecha_lunes_str, especialidad="Psiquiatría") for c in clientes),
+            return_exceptions=True,
+        )
+        errores = [r for r in resultados if isinstance(r, ServicioClinicaException)]
+        self.assertEqual(len(errores), 9)
+        self.assertTrue(all(e.tipo == "TurnoOcupadoException" for e in errores))
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+
+    async def test_solicitud_demasiado_larga_cierra_la_conexion(self):
+        lector, escritor = await asyncio.open_connection("127.0.0.1", self.puerto)
+        escritor.write(b"x" * (ServidorClinica.LIMITE_LINEA + 10) + b"\n")
+        await escritor.drain()
+        respuesta = json.loads(await lector.readline())
+        self.assertFalse(respuesta["ok"])
+        self.assertEqual(await lector.read(), b"")
+        escritor.close()
+        await escritor.wait_closed()
+
+
+class TestServidorClinicaConcurrente(TestServidorClinica):
+
+    def crear_clinica(self) -> Clinica:
+        return Clinica(concurrente=True)
+
+    def opciones_servidor(self) -> dict:
+        return {"hilos": 4}
+
+
+class TestServidorClinicaOpciones(unittest.IsolatedAsyncioTestCase):
+
+    def test_varios_hilos_requiere_clinica_concurrente(self):
+        with self.assertRaises(ValueError):
+            ServidorClinica(Clinica(), hilos=4)
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Sockets Unix no disponibles")
+    async def test_socket_unix(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "clinica.sock")
+            servidor_clinica = ServidorClinica(Clinica())
+            await servidor_clinica.iniciar_unix(ruta)
+            cliente = await ClienteClinica.conectar_unix(ruta)
+            try:
+                self.assertEqual(await cliente.solicitar("ping"), "pong")
+            finally:
+                await cliente.cerrar()
+                await servidor_clinica.detener()
+
+if __name__ == '__main__':
+    unittest.main()